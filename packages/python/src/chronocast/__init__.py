@@ -4,7 +4,7 @@ Chronocast SDK: A Python framework for building and streaming AI-powered interac
 
 __version__ = "0.0.24"
 
-from .experience import StreamTask, configure_logging, LogColors, default_logger
+from .experience import StreamTask, configure_logging, LogColors, default_logger, ArtifactStore, configure_artifact_store, get_artifact_store, read_artifact, register_serializer
 from .host import Host
 from .settings import Config
 from .streaming import Stream, Experience, StreamInstruction
@@ -28,6 +28,7 @@ from .tools import (
     AmadeusTools,
     CalculatorTools,
     FAISSTools,
+    HybridSearchTools,
     PineconeTools,
     LinearTools,
     SemanticSplitter,
@@ -98,6 +99,12 @@ __all__ = [
     "configure_logging",
     "LogColors",
     "default_logger",
+    # Artifacts
+    "ArtifactStore",
+    "configure_artifact_store",
+    "get_artifact_store",
+    "read_artifact",
+    "register_serializer",
     # LLM Provider Models
     "OpenaiModels",
     "AnthropicModels",
@@ -116,6 +123,7 @@ __all__ = [
     "AmadeusTools",
     "CalculatorTools",
     "FAISSTools",
+    "HybridSearchTools",
     "PineconeTools",
     "LinearTools",
     "SemanticSplitter",
@@ -1,10 +1,20 @@
 from pydantic import BaseModel, Field, field_validator
 from typing import Callable, Optional, Union, Dict, List, Any, Set, Tuple, AsyncIterator, Iterator
 from datetime import datetime, date
+from collections import OrderedDict
 import json
+import os
 import re
+import uuid
 import asyncio
 import logging
+import sys
+import threading
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logger for the chronocast package
 logger = logging.getLogger("chronocast")
@@ -84,42 +94,289 @@ def parse_json_response(response: str) -> dict:
                 raise ValueError(f"Invalid JSON structure: {e}")
 
 
+def _serialize_mapping(obj: Any) -> Dict[str, Any]:
+    return {str(k): serialize_result(v) for k, v in obj.items()}
+
+
+def _serialize_sequence(obj: Any) -> List[Any]:
+    return [serialize_result(item) for item in obj]
+
+
+def _serialize_isoformat(obj: Any) -> str:
+    return obj.isoformat()
+
+
+def _serialize_pydantic(obj: BaseModel) -> Any:
+    return obj.model_dump(mode="json")
+
+
+def _serialize_numpy_array(obj: Any) -> Any:
+    values = obj.tolist()
+    # Numeric and boolean arrays convert to Python scalars in one pass; others may hold datetimes or objects
+    return values if obj.dtype.kind in "biuf" else serialize_result(values)
+
+
+def _serialize_numpy_scalar(obj: Any) -> Any:
+    return serialize_result(obj.item())
+
+
+def _column_values(values: Any) -> List[Any]:
+    items = values.tolist()
+    return items if values.dtype.kind in "biuf" else [serialize_result(item) for item in items]
+
+
+def _serialize_series(obj: Any) -> Dict[str, Any]:
+    # Same layout as Series.to_dict(), built from whole-column conversions
+    return dict(zip(map(str, obj.index), _column_values(obj)))
+
+
+def _serialize_dataframe(obj: Any) -> Dict[str, Any]:
+    # Same layout as DataFrame.to_dict(), built from whole-column conversions
+    keys = list(map(str, obj.index))
+    return {str(column): dict(zip(keys, _column_values(obj[column]))) for column in obj.columns}
+
+
+def _identity(obj: Any) -> Any:
+    return obj
+
+
+_serializers: Dict[type, Callable[[Any], Any]] = {
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    type(None): _identity,
+    dict: _serialize_mapping,
+    list: _serialize_sequence,
+    tuple: _serialize_sequence,
+    set: _serialize_sequence,
+    datetime: _serialize_isoformat,
+    date: _serialize_isoformat,
+}
+_serializer_cache: Dict[type, Callable[[Any], Any]] = {}
+
+
+def register_serializer(cls: type, serializer: Callable[[Any], Any]) -> None:
+    """
+    Register how tool results of a type, and its subclasses, are converted to JSON-serializable data.
+
+    Args:
+        cls (type): The type to handle.
+        serializer (Callable[[Any], Any]): Converts an instance to JSON-serializable data.
+    """
+    _serializers[cls] = serializer
+    _serializer_cache.clear()
+
+
+def _find_serializer(cls: type) -> Callable[[Any], Any]:
+    for base in cls.__mro__:
+        if base in _serializers:
+            return _serializers[base]
+
+    # NumPy and pandas are only matched once loaded; objects of their types cannot exist before that
+    numpy = sys.modules.get("numpy")
+    if numpy is not None:
+        if issubclass(cls, numpy.ndarray):
+            return _serialize_numpy_array
+        if issubclass(cls, numpy.generic):
+            return _serialize_numpy_scalar
+    pandas = sys.modules.get("pandas")
+    if pandas is not None:
+        if issubclass(cls, pandas.DataFrame):
+            return _serialize_dataframe
+        if issubclass(cls, pandas.Series):
+            return _serialize_series
+    if issubclass(cls, BaseModel):
+        return _serialize_pydantic
+    if issubclass(cls, dict):
+        return _serialize_mapping
+    if hasattr(cls, "to_dict"):  # Handle objects with to_dict method
+        return lambda obj: serialize_result(obj.to_dict())
+    return str  # Fallback for all other types
+
+
 def serialize_result(obj: Any) -> Union[str, Dict[str, Any], List[Any]]:
     """Convert any object into a JSON-serializable format by aggressively stringifying non-standard types."""
+    cls = type(obj)
+    serializer = _serializers.get(cls) or _serializer_cache.get(cls)
+    if serializer is None:
+        serializer = _serializer_cache[cls] = _find_serializer(cls)
     try:
-        if obj is None:
-            return None
-        elif isinstance(obj, (str, int, float, bool)):
-            return obj
-        elif isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        elif isinstance(obj, dict):
-            try:
-                return {str(k): serialize_result(v) for k, v in obj.items()}
-            except Exception as e:
-                logger.warning(f"Failed to serialize dictionary: {e}")
-                return str(obj)
-        elif type(obj) in (list, tuple, set):  # Exact type checking for sequences
-            try:
-                return [serialize_result(item) for item in obj]
-            except Exception as e:
-                logger.warning(f"Failed to serialize sequence: {e}")
-                return str(obj)
-        elif hasattr(obj, "to_dict"):  # Handle objects with to_dict method
-            try:
-                return serialize_result(obj.to_dict())
-            except Exception as e:
-                logger.warning(f"Failed to serialize using to_dict: {e}")
-                return str(obj)
-        else:
-            return str(obj)  # Fallback for all other types
+        return serializer(obj)
     except Exception as e:
-        logger.error(f"Serialization failed, using str() fallback: {e}")
+        logger.warning(f"Failed to serialize {cls.__name__}, using str() fallback: {e}")
         try:
             return str(obj)
         except Exception as e:
             logger.error(f"str() fallback failed: {e}")
-            return f"<Unserializable object of type {type(obj).__name__}>"
+            return f"<Unserializable object of type {cls.__name__}>"
+
+
+def encode_result(result: Any) -> str:
+    """
+    Encode a serialized tool result as indented JSON text, with orjson when it is installed.
+
+    Strings are returned unchanged.
+    """
+    if not isinstance(result, (dict, list)):
+        return str(result)
+    if orjson is not None:
+        try:
+            return orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits
+    return json.dumps(result, indent=2)
+
+
+ARTIFACT_PREFIX = "artifact:"
+
+
+class ArtifactStore:
+    """
+    Keeps large tool results out of the prompt.
+
+    A result whose serialized form exceeds `max_inline_bytes` is stored once under a short handle,
+    and the host sees a compact summary with its schema and a preview instead. Passing the handle
+    as a tool parameter gives the tool the original object, and the read_artifact tool pages through
+    the rest. The least recently used artifacts are dropped beyond `max_artifacts`; with a `directory`,
+    serialized results are also written to disk. With `max_inline_bytes` None, results are never stored.
+    """
+
+    def __init__(self, max_inline_bytes: Optional[int] = None, max_artifacts: int = 128, directory: Optional[str] = None):
+        self.max_inline_bytes = max_inline_bytes
+        self.max_artifacts = max_artifacts
+        self.directory = directory
+        self._artifacts: "OrderedDict[str, Tuple[Any, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def should_store(self, size: int) -> bool:
+        """Whether a result of `size` bytes should be stored by handle rather than placed in the prompt."""
+        return self.max_inline_bytes is not None and size > self.max_inline_bytes
+
+    def put(self, obj: Any, serialized: Optional[str] = None) -> str:
+        """Store a result and return its handle. Without a serialized form, it is encoded when first read."""
+        handle = f"{ARTIFACT_PREFIX}{uuid.uuid4().hex[:12]}"
+        with self._lock:
+            self._artifacts[handle] = (obj, serialized)
+            while len(self._artifacts) > self.max_artifacts:
+                self._artifacts.popitem(last=False)
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, f"{handle[len(ARTIFACT_PREFIX):]}.json"), "w", encoding="utf-8") as f:
+                f.write(serialized if serialized is not None else encode_result(serialize_result(obj)))
+        return handle
+
+    @staticmethod
+    def estimate_size(obj: Any) -> Optional[int]:
+        """In-memory size of NumPy arrays and pandas objects, which can be stored without serializing them first."""
+        if hasattr(obj, "memory_usage") and hasattr(obj, "index"):
+            usage = obj.memory_usage(index=True, deep=False)
+            return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+        if hasattr(obj, "nbytes") and hasattr(obj, "dtype"):
+            return int(obj.nbytes)
+        return None
+
+    def get(self, handle: str) -> Any:
+        """Return the original object stored under a handle."""
+        with self._lock:
+            if handle not in self._artifacts:
+                raise KeyError(f"Unknown or expired artifact: {handle}")
+            self._artifacts.move_to_end(handle)
+            return self._artifacts[handle][0]
+
+    def read(self, handle: str, start: int = 0, length: int = 4000) -> str:
+        """Return a slice of the serialized result stored under a handle."""
+        with self._lock:
+            if handle not in self._artifacts:
+                raise KeyError(f"Unknown or expired artifact: {handle}")
+            obj, serialized = self._artifacts[handle]
+        if serialized is None:
+            serialized = encode_result(serialize_result(obj))
+            with self._lock:
+                if handle in self._artifacts:
+                    self._artifacts[handle] = (obj, serialized)
+        return serialized[start:start + length]
+
+    def resolve(self, value: Any) -> Any:
+        """Replace artifact handles in tool parameters, including inside lists and dicts, with the stored objects."""
+        if isinstance(value, str):
+            if value.startswith(ARTIFACT_PREFIX) and value in self._artifacts:
+                return self.get(value)
+            return value
+        if isinstance(value, dict):
+            return {key: self.resolve(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.resolve(item) for item in value]
+        return value
+
+    def summarize(self, handle: str, obj: Any, result: Any, size: int) -> Dict[str, Any]:
+        """Describe a stored result: its type, size, schema and a short preview."""
+        summary: Dict[str, Any] = {"artifact": handle, "type": type(obj).__name__, "bytes": size}
+        if hasattr(obj, "columns") and hasattr(obj, "dtypes") and hasattr(obj, "head"):
+            summary["shape"] = list(obj.shape)
+            summary["schema"] = {str(column): str(dtype) for column, dtype in obj.dtypes.items()}
+            if len(obj.index):
+                summary["index"] = {"first": serialize_result(obj.index[0]), "last": serialize_result(obj.index[-1])}
+            summary["preview"] = serialize_result(obj.head(5).to_dict(orient="records"))
+        elif hasattr(obj, "shape") and hasattr(obj, "dtype"):
+            summary["shape"] = list(obj.shape)
+            summary["dtype"] = str(obj.dtype)
+            summary["preview"] = serialize_result(obj.iloc[:10] if hasattr(obj, "iloc") else obj.ravel()[:10])
+        elif isinstance(result, list):
+            summary["length"] = len(result)
+            if result and isinstance(result[0], dict):
+                summary["schema"] = {key: type(value).__name__ for key, value in result[0].items()}
+            summary["preview"] = self._preview(result[:3])
+        elif isinstance(result, dict):
+            summary["schema"] = {
+                key: (f"{type(value).__name__}[{len(value)}]" if isinstance(value, (list, dict, str)) else type(value).__name__)
+                for key, value in list(result.items())[:50]
+            }
+            summary["preview"] = self._preview({key: result[key] for key in list(result)[:5]})
+        else:
+            summary["preview"] = str(result)[:500]
+        summary["note"] = (
+            "The full result is stored as an artifact. Read it in slices with the read_artifact tool, "
+            "or pass the artifact handle as a tool parameter in place of the data to give a tool the full result."
+        )
+        return summary
+
+    def _preview(self, value: Any) -> Any:
+        text = json.dumps(value, separators=(",", ":"))
+        return value if len(text) <= 1000 else text[:1000] + "..."
+
+
+_artifact_store = ArtifactStore()
+
+
+def get_artifact_store() -> ArtifactStore:
+    """Return the artifact store shared by tasks."""
+    return _artifact_store
+
+
+def configure_artifact_store(max_inline_bytes: Optional[int] = 8000, max_artifacts: int = 128, directory: Optional[str] = None) -> ArtifactStore:
+    """
+    Replace the shared artifact store. The default store keeps every result inline; configuring one with
+    `max_inline_bytes` stores larger tool results by handle. Pass None to turn storing off again.
+    """
+    global _artifact_store
+    _artifact_store = ArtifactStore(max_inline_bytes, max_artifacts, directory)
+    return _artifact_store
+
+
+def read_artifact(handle: str, start: int = 0, length: int = 4000) -> str:
+    """
+    Read part of a large tool result that was stored as an artifact.
+
+    Args:
+        handle (str): The artifact handle, e.g. "artifact:1a2b3c4d5e6f".
+        start (int, optional): Character offset into the serialized result. Defaults to 0.
+        length (int, optional): Number of characters to read. Defaults to 4000.
+
+    Returns:
+        str: The requested slice of the JSON-serialized result.
+    """
+    return get_artifact_store().read(handle, start, length)
 
 
 def print_event(event: Dict[str, Any]) -> None:
@@ -613,16 +870,28 @@ class StreamTask(BaseModel):
             tool_call_history = {}
             tool_results = []
             conduct_tool_count = 0  # Counter for consecutive conduct tool calls
+            artifacts = get_artifact_store()
+            # read_artifact joins the tools once a result has been stored, so the host can page through it
+            loop_tools = list(self.tools)
 
             def hash_tool_call(tool_call: dict) -> str:
                 """Create a hash of a tool call to detect duplicates."""
                 tool_str = f"{tool_call.get('tool')}_{json.dumps(tool_call.get('params', {}), sort_keys=True)}"
                 return tool_str
 
-            tool_descriptions = (
-                "\nAvailable Tools:\n"
-                + "\n".join([f"- {func.__name__}: {func.__doc__}" for func in self.tools]).rstrip()
-            )
+            def describe_tools() -> str:
+                return (
+                    "\nAvailable Tools:\n"
+                    + "\n".join([f"- {func.__name__}: {func.__doc__}" for func in loop_tools]).rstrip()
+                )
+
+            def offer_read_artifact() -> None:
+                nonlocal tool_descriptions
+                if read_artifact not in loop_tools:
+                    loop_tools.append(read_artifact)
+                    tool_descriptions = describe_tools()
+
+            tool_descriptions = describe_tools()
 
             more = "more " if len(self.tools) > 1 else ""
             additional = "additional " if len(self.tools) > 1 else ""
@@ -774,7 +1043,7 @@ The original task instruction:
                         return None, tool_results
 
                     # Validate each tool call before proceeding
-                    tools_dict = {func.__name__: func for func in self.tools}
+                    tools_dict = {func.__name__: func for func in loop_tools}
                     for tool_call in response_data["tool_calls"]:
                         if not isinstance(tool_call, dict):
                             raise ValueError("Each tool call must be an object")
@@ -921,7 +1190,7 @@ The original task instruction:
                             print(f"{LogColors.RESET}")  # Reset color at the end
 
                             # Execute tool and store result
-                            tools_dict = {func.__name__: func for func in self.tools}
+                            tools_dict = {func.__name__: func for func in loop_tools}
                             if tool_name not in tools_dict:
                                 error_msg = f"Unknown tool: {tool_name}"
                                 logger.error(f"{LogColors.RED}{error_msg}{LogColors.RESET}")
@@ -958,10 +1227,10 @@ The original task instruction:
                                         f"{LogColors.CYAN}Executing async tool: {tool_name}{LogColors.RESET}"
                                     )
                                     # Combine the parameters only for execution
-                                    execution_params = {**serializable_params, **special_params}
+                                    execution_params = {**artifacts.resolve(serializable_params), **special_params}
                                     raw_result = await tool_func(**execution_params)
                                 else:
-                                    execution_params = {**serializable_params, **special_params}
+                                    execution_params = {**artifacts.resolve(serializable_params), **special_params}
                                     raw_result = tool_func(**execution_params)
 
                                 # Check if the result is an exception
@@ -977,15 +1246,27 @@ The original task instruction:
                                     # Continue execution to let the host handle the error
                                     continue
 
-                                # Process successful result as before
-                                result = serialize_result(raw_result)
-
-                                # Convert to string for message history if needed
-                                result_str = (
-                                    json.dumps(result, indent=2)
-                                    if isinstance(result, (dict, list))
-                                    else str(result)
-                                )
+                                # Large arrays and frames are stored by handle without serializing them
+                                estimated_size = artifacts.estimate_size(raw_result)
+                                if estimated_size is not None and artifacts.should_store(estimated_size):
+                                    handle = artifacts.put(raw_result)
+                                    offer_read_artifact()
+                                    result = artifacts.summarize(handle, raw_result, None, estimated_size)
+                                    result_str = encode_result(result)
+                                    logger.info(f"Stored {estimated_size}-byte result from '{tool_name}' as {handle}")
+                                else:
+                                    # Serialize and encode once; the text is reused for the callback, prompt and log
+                                    result = serialize_result(raw_result)
+                                    result_str = encode_result(result)
+
+                                    # Large results are stored by handle and summarized for the prompt
+                                    result_size = len(result_str.encode("utf-8"))
+                                    if artifacts.should_store(result_size):
+                                        handle = artifacts.put(raw_result, result_str)
+                                        offer_read_artifact()
+                                        result = artifacts.summarize(handle, raw_result, result, result_size)
+                                        result_str = encode_result(result)
+                                        logger.info(f"Stored {result_size}-byte result from '{tool_name}' as {handle}")
 
                                 # Add result snippet output
                                 result_snippet = (
@@ -1020,9 +1301,7 @@ The original task instruction:
                                 )  # Using existing tool_results list
 
                                 # After tool execution
-                                logger.info(
-                                    f"Result from '{tool_name}': {json.dumps(result, separators=(',', ':'))}"
-                                )
+                                logger.info(f"Result from '{tool_name}': {result_str}")
 
                             except Exception as e:
                                 error_msg = f"Tool execution error for {tool_name}: {str(e)}"
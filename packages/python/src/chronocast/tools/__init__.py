@@ -6,6 +6,7 @@ from .embedding_tools import EmbeddingsTools
 from .file_tools import FileTools
 from .github_tools import GitHubTools
 from .faiss_tools import FAISSTools
+from .hybrid_search_tools import HybridSearchTools
 from .linear_tools import LinearTools
 from .pinecone_tools import PineconeTools
 from .web_tools import WebTools
@@ -19,6 +20,7 @@ __all__ = [
     'FAISSTools',
     'FileTools',
     'GitHubTools',
+    'HybridSearchTools',
     'LinearTools',
     'PineconeTools',
     'WebTools',
@@ -1,30 +1,90 @@
 import os
+import time
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Any, Optional, Tuple, Union
 from dotenv import load_dotenv
 import requests
 from datetime import datetime, timedelta
+from .http_utils import get_session, request_with_backoff, RateLimiter
+
+DEFAULT_AMADEUS_BASE_URL = "https://test.api.amadeus.com"
 
 class AmadeusTools:
+    _access_token: Optional[str] = None
+    _token_expires_at: float = 0.0
+    _token_api_key: Optional[str] = None
+    _token_lock = threading.Lock()
+    # Refresh tokens this many seconds before they expire
+    _token_refresh_margin: float = 60.0
+    # The test environment allows 10 transactions per second, with no more than one every 100ms
+    _rate_limiter = RateLimiter(rate=10)
+
+    @staticmethod
+    def _base_url() -> str:
+        """Base URL of the API. Set AMADEUS_BASE_URL to use the production environment or a local test server."""
+        return os.getenv("AMADEUS_BASE_URL", DEFAULT_AMADEUS_BASE_URL).rstrip("/")
+
     @staticmethod
-    def _get_access_token():
-        """Get Amadeus API access token."""
+    def _get_access_token(force_refresh: bool = False) -> str:
+        """
+        Get Amadeus API access token.
+
+        The token is cached until shortly before it expires (about 30 minutes) and shared between threads,
+        so only one request is made per token lifetime.
+
+        Args:
+            force_refresh (bool, optional): Fetch a new token even if the cached one has not expired. Defaults to False.
+        """
         load_dotenv()
         api_key = os.getenv("AMADEUS_API_KEY")
         api_secret = os.getenv("AMADEUS_API_SECRET")
         
         if not api_key or not api_secret:
             raise ValueError("AMADEUS_API_KEY and AMADEUS_API_SECRET must be set in .env file")
-        
-        token_url = "https://test.api.amadeus.com/v1/security/oauth2/token"
-        data = {
-            "grant_type": "client_credentials",
-            "client_id": api_key,
-            "client_secret": api_secret
-        }
-        
-        response = requests.post(token_url, data=data)
-        response.raise_for_status()
-        return response.json()["access_token"]
+
+        with AmadeusTools._token_lock:
+            if (not force_refresh and AmadeusTools._access_token and AmadeusTools._token_api_key == api_key
+                    and time.time() < AmadeusTools._token_expires_at - AmadeusTools._token_refresh_margin):
+                return AmadeusTools._access_token
+
+            token_url = f"{AmadeusTools._base_url()}/v1/security/oauth2/token"
+            data = {
+                "grant_type": "client_credentials",
+                "client_id": api_key,
+                "client_secret": api_secret
+            }
+
+            response = request_with_backoff(lambda: get_session().post(token_url, data=data))
+            response.raise_for_status()
+            token = response.json()
+            AmadeusTools._access_token = token["access_token"]
+            AmadeusTools._token_expires_at = time.time() + float(token.get("expires_in", 1799))
+            AmadeusTools._token_api_key = api_key
+            return AmadeusTools._access_token
+
+    @staticmethod
+    def _get(path: str, params: Dict[str, Any]) -> requests.Response:
+        """
+        Send an authenticated GET request through the shared rate limiter. Rate-limited and transient
+        failures are retried with backoff, and a 401 is retried once with a fresh token.
+        """
+        url = f"{AmadeusTools._base_url()}{path}"
+        for attempt in range(2):
+            headers = {
+                "Authorization": f"Bearer {AmadeusTools._get_access_token(force_refresh=attempt > 0)}",
+                "Content-Type": "application/json"
+            }
+
+            def send() -> requests.Response:
+                AmadeusTools._rate_limiter.acquire()
+                return get_session().get(url, headers=headers, params=params)
+
+            response = request_with_backoff(send)
+            if response.status_code != 401:
+                break
+        return response
 
     @staticmethod
     def search_flights(
@@ -61,15 +121,6 @@ class AmadeusTools:
         Returns:
             Dict[str, Any]: Flight search results
         """
-        access_token = AmadeusTools._get_access_token()
-        
-        url = "https://test.api.amadeus.com/v2/shopping/flight-offers"
-        
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
-        }
-        
         params = {
             "originLocationCode": origin,
             "destinationLocationCode": destination,
@@ -94,7 +145,7 @@ class AmadeusTools:
             params["maxPrice"] = max_price
         
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = AmadeusTools._get("/v2/shopping/flight-offers", params)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -110,11 +161,13 @@ class AmadeusTools:
         destination: str,
         departure_date: Union[str, Tuple[str, str]],
         return_date: Optional[Union[str, Tuple[str, str]]] = None,
-        adults: int = 1
+        adults: int = 1,
+        target_price: Optional[float] = None,
+        max_concurrency: int = 8
     ) -> Dict[str, Any]:
         """
         Find the cheapest flight offer for a given route and date or date range using the Amadeus Flight Offers Search API.
-        Max range of 7 days between start and end date.
+        Max range of 7 days between start and end date. All date combinations are searched concurrently.
 
         Args:
             origin (str): IATA code of the origin airport.
@@ -122,28 +175,22 @@ class AmadeusTools:
             departure_date (Union[str, Tuple[str, str]]): Departure date in YYYY-MM-DD format or a tuple of (start_date, end_date). 
             return_date (Optional[Union[str, Tuple[str, str]]]): Return date in YYYY-MM-DD format or a tuple of (start_date, end_date) for round trips. Defaults to None.
             adults (int): Number of adult travelers. Defaults to 1.
+            target_price (Optional[float]): Stop searching as soon as an offer at or below this price (USD) is found. Defaults to None.
+            max_concurrency (int): Maximum number of searches in flight. Defaults to 8.
 
         Returns:
-            Dict[str, Any]: A dictionary containing the cheapest flight offer information.
+            Dict[str, Any]: A dictionary containing the cheapest flight offer information, and the number of date
+                combinations 'searched', 'skipped' and 'failed'.
 
         Raises:
-            requests.exceptions.HTTPError: If the API request fails.
+            requests.exceptions.HTTPError: If every API request fails.
             ValueError: If the date range is more than 7 days.
         """
-        access_token = AmadeusTools._get_access_token()
-        
-        url = "https://test.api.amadeus.com/v2/shopping/flight-offers"
-        
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
-        }
-        
         def date_range(start_date: str, end_date: str):
             start = datetime.fromisoformat(start_date)
             end = datetime.fromisoformat(end_date)
             if (end - start).days > 7:
-                return {"error": "Date range cannot exceed 7 days"}
+                raise ValueError("Date range cannot exceed 7 days")
             date = start
             while date <= end:
                 yield date.strftime("%Y-%m-%d")
@@ -151,42 +198,82 @@ class AmadeusTools:
 
         departure_dates = [departure_date] if isinstance(departure_date, str) else list(date_range(*departure_date))
         return_dates = [return_date] if return_date and isinstance(return_date, str) else (list(date_range(*return_date)) if return_date else [None])
+        date_pairs = [(dep_date, ret_date) for dep_date in departure_dates for ret_date in return_dates
+                      if ret_date is None or ret_date >= dep_date]
 
-        cheapest_offer = None
-        cheapest_price = float('inf')
-
-        for dep_date in departure_dates:
-            for ret_date in return_dates:
-                params = {
-                    "originLocationCode": origin,
-                    "destinationLocationCode": destination,
-                    "departureDate": dep_date,
-                    "adults": adults,
-                    "max": 1,
-                    "currencyCode": "USD"
-                }
-                if ret_date:
-                    params["returnDate"] = ret_date
-
-                response = requests.get(url, headers=headers, params=params)
+        lock = threading.Lock()
+        stop = threading.Event()
+        best = {"price": float('inf'), "offer": None}
+        counts = {"searched": 0, "skipped": 0, "failed": 0}
+        errors = []
+
+        def search(dep_date: str, ret_date: Optional[str]) -> None:
+            if stop.is_set():
+                with lock:
+                    counts["skipped"] += 1
+                return
+
+            params = {
+                "originLocationCode": origin,
+                "destinationLocationCode": destination,
+                "departureDate": dep_date,
+                "adults": adults,
+                "max": 1,
+                "currencyCode": "USD"
+            }
+            if ret_date:
+                params["returnDate"] = ret_date
+            # The best price so far bounds every remaining search, so the API can drop dearer offers
+            with lock:
+                if best["offer"] is not None:
+                    params["maxPrice"] = math.ceil(best["price"])
+
+            response = AmadeusTools._get("/v2/shopping/flight-offers", params)
+            try:
                 response.raise_for_status()
-                
-                data = response.json()
+            except requests.exceptions.HTTPError as e:
+                with lock:
+                    counts["failed"] += 1
+                    errors.append(e)
+                return
+
+            data = response.json()
+            with lock:
+                counts["searched"] += 1
                 if data.get('data'):
                     offer = data['data'][0]
                     price = float(offer['price']['total'])
-                    if price < cheapest_price:
-                        cheapest_price = price
-                        cheapest_offer = offer
+                    if price < best["price"]:
+                        best["price"] = price
+                        best["offer"] = offer
+                    if target_price is not None and best["price"] <= target_price:
+                        stop.set()
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(date_pairs)))) as executor:
+            futures = [executor.submit(search, dep_date, ret_date) for dep_date, ret_date in date_pairs]
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                future.result()
+                if stop.is_set():
+                    # cancel() also returns True for futures cancelled earlier, so count each one only once
+                    cancelled = sum(1 for pending in futures if not pending.cancelled() and pending.cancel())
+                    with lock:
+                        counts["skipped"] += cancelled
 
+        if errors and not counts["searched"]:
+            raise errors[0]
+
+        cheapest_offer = best["offer"]
         if not cheapest_offer:
-            return {"error": "No flights found for the given criteria"}
+            return {"error": "No flights found for the given criteria", **counts}
 
         result = {
             "price": cheapest_offer['price']['total'],
             "departureDate": cheapest_offer['itineraries'][0]['segments'][0]['departure']['at'],
             "airline": cheapest_offer['validatingAirlineCodes'][0],
-            "details": cheapest_offer
+            "details": cheapest_offer,
+            **counts
         }
         
         if return_date:
@@ -228,15 +315,6 @@ class AmadeusTools:
         Note:
             This method requires valid Amadeus API credentials to be set in the environment variables.
         """
-        access_token = AmadeusTools._get_access_token()
-        
-        url = "https://test.api.amadeus.com/v1/shopping/flight-destinations"
-        
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
-        }
-        
         params = {
             "origin": origin,
             "currency": currency
@@ -245,7 +323,7 @@ class AmadeusTools:
         if max_price:
             params["maxPrice"] = max_price
         
-        response = requests.get(url, headers=headers, params=params)
+        response = AmadeusTools._get("/v1/shopping/flight-destinations", params)
         try:
             response.raise_for_status()
         except requests.exceptions.HTTPError as e:
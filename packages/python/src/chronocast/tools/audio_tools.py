@@ -1,10 +1,21 @@
 import os
-from typing import List, Dict, Optional, Literal, Union
+import io
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+import asyncio
+import wave
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, List, Dict, Optional, Literal, Tuple, Union
+import numpy as np
 from dotenv import load_dotenv
-import requests
 from openai import OpenAI
-import time
-import io
+from .http_utils import get_session, request_with_backoff
 
 load_dotenv()
 
@@ -25,38 +36,430 @@ def check_pygame():
     except ImportError:
         raise ImportError("pygame is required for audio playback. Install with `pip install pygame`")
 
+SENTENCE_END = re.compile(r'[.!?…]+["\'”’)\]]*\s+|\n+')
+CLAUSE_END = re.compile(r'[,;:—]\s+')
+PCM_SAMPLE_RATE = 24000
+
+async def _iterate_text(text: Union[str, Iterable[str], AsyncIterable[str]]) -> AsyncIterator[str]:
+    if isinstance(text, str):
+        yield text
+    elif hasattr(text, "__aiter__"):
+        async for piece in text:
+            yield piece
+    else:
+        for piece in text:
+            yield piece
+
+async def segment_sentences(text: Union[str, Iterable[str], AsyncIterable[str]], min_chars: int = 20,
+                            max_chars: int = 400, first_chars: int = 60) -> AsyncIterator[str]:
+    """
+    Split streamed text into sentences as soon as each one is complete.
+
+    Sentences shorter than min_chars are joined with the next one, so abbreviations and short
+    interjections are not synthesized on their own. To start speaking sooner, the first segment may
+    end at a clause boundary once it reaches first_chars. Text without any boundary is split at a
+    space once it reaches max_chars.
+    """
+    buffer = ""
+    first = True
+    async for piece in _iterate_text(text):
+        buffer += piece
+        while True:
+            cut = None
+            for match in SENTENCE_END.finditer(buffer):
+                if len(buffer[:match.end()].strip()) >= min_chars:
+                    cut = match.end()
+                    break
+            if cut is None and first and len(buffer) >= first_chars:
+                clause = CLAUSE_END.search(buffer, min_chars)
+                cut = clause.end() if clause else None
+            if cut is None and len(buffer) >= max_chars:
+                space = buffer.rfind(" ", 0, max_chars)
+                cut = space + 1 if space > 0 else max_chars
+            if cut is None:
+                break
+            segment, buffer = buffer[:cut].strip(), buffer[cut:]
+            if segment:
+                first = False
+                yield segment
+    if buffer.strip():
+        yield buffer.strip()
+
+TTS_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+class TTSAudioCache:
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = TTS_CACHE_MAX_BYTES, enabled: bool = True):
+        """
+        Initialize an on-disk cache of synthesized speech.
+
+        Entries are addressed by a hash of the provider, model, voice, audio format and text, and the least
+        recently used entries are evicted once the cache grows past max_bytes.
+
+        Args:
+            directory (str, optional): Directory for the cache database. Defaults to the CHRONOCAST_TTS_CACHE_DIR
+                environment variable, or ~/.cache/chronocast.
+            max_bytes (int, optional): Maximum total size of the cached audio. Defaults to 256 MB.
+            enabled (bool, optional): Whether audio is cached. Defaults to True.
+        """
+        self.directory = directory or os.getenv("CHRONOCAST_TTS_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "chronocast")
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def key(provider: str, model: str, voice: str, audio_format: str, text: str) -> str:
+        """Return the content address of a phrase spoken with the given settings."""
+        return hashlib.sha256(json.dumps([provider, model, voice, audio_format, text.strip()]).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached audio for a key, or None."""
+        if not self.enabled:
+            return None
+        with self._db_lock:
+            db = self._connection()
+            row = db.execute("SELECT audio FROM audio WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+            db.execute("UPDATE audio SET last_used = ? WHERE key = ?", (time.time(), key))
+            db.commit()
+            self._stats["hits"] += 1
+        return row[0]
+
+    def put(self, key: str, audio: bytes) -> None:
+        """Store audio under a key, evicting the least recently used entries beyond max_bytes."""
+        if not self.enabled or not audio or len(audio) > self.max_bytes:
+            return
+        with self._db_lock:
+            db = self._connection()
+            db.execute("INSERT OR REPLACE INTO audio (key, audio, size, last_used) VALUES (?, ?, ?, ?)",
+                       (key, audio, len(audio), time.time()))
+            total = db.execute("SELECT COALESCE(SUM(size), 0) FROM audio").fetchone()[0]
+            if total > self.max_bytes:
+                for old_key, size in db.execute("SELECT key, size FROM audio WHERE key != ? ORDER BY last_used", (key,)).fetchall():
+                    db.execute("DELETE FROM audio WHERE key = ?", (old_key,))
+                    self._stats["evictions"] += 1
+                    total -= size
+                    if total <= self.max_bytes:
+                        break
+            db.commit()
+
+    def __contains__(self, key: str) -> bool:
+        if not self.enabled:
+            return False
+        with self._db_lock:
+            return self._connection().execute("SELECT 1 FROM audio WHERE key = ?", (key,)).fetchone() is not None
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache metrics.
+
+        Returns:
+            Dict[str, int]: 'hits', 'misses' and 'evictions' since the process started, and the current
+                number of 'entries' and their total 'bytes'.
+        """
+        with self._db_lock:
+            entries, size = self._connection().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM audio").fetchone()
+            return {**self._stats, "entries": entries, "bytes": size}
+
+    def clear(self) -> None:
+        """Remove all cached audio."""
+        with self._db_lock:
+            db = self._connection()
+            db.execute("DELETE FROM audio")
+            db.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._db is None:
+            os.makedirs(self.directory, exist_ok=True)
+            db = sqlite3.connect(os.path.join(self.directory, "tts_cache.sqlite"), check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("CREATE TABLE IF NOT EXISTS audio (key TEXT PRIMARY KEY, audio BLOB, size INTEGER, last_used REAL)")
+            db.execute("CREATE INDEX IF NOT EXISTS audio_last_used ON audio (last_used)")
+            self._db = db
+        return self._db
+
+_default_tts_cache: Optional[TTSAudioCache] = None
+_default_tts_cache_lock = threading.Lock()
+
+def get_tts_cache() -> TTSAudioCache:
+    """Return the speech cache shared by TextToSpeechTools. Set CHRONOCAST_TTS_CACHE=0 to disable it."""
+    global _default_tts_cache
+    if _default_tts_cache is None:
+        with _default_tts_cache_lock:
+            if _default_tts_cache is None:
+                enabled = os.getenv("CHRONOCAST_TTS_CACHE", "1").lower() not in ("0", "false", "no")
+                _default_tts_cache = TTSAudioCache(enabled=enabled)
+    return _default_tts_cache
+
+def configure_tts_cache(directory: Optional[str] = None, max_bytes: int = TTS_CACHE_MAX_BYTES, enabled: bool = True) -> TTSAudioCache:
+    """
+    Replace the speech cache shared by TextToSpeechTools.
+
+    Args:
+        directory (str, optional): Directory for the cache database.
+        max_bytes (int, optional): Maximum total size of the cached audio. Defaults to 256 MB.
+        enabled (bool, optional): Whether audio is cached. Defaults to True.
+
+    Returns:
+        TTSAudioCache: The new shared cache.
+    """
+    global _default_tts_cache
+    with _default_tts_cache_lock:
+        _default_tts_cache = TTSAudioCache(directory=directory, max_bytes=max_bytes, enabled=enabled)
+    return _default_tts_cache
+
 class TextToSpeechTools:
+    _clients: Dict[str, Any] = {}
+
+    @staticmethod
+    def _get_client(provider: str) -> Any:
+        if provider not in TextToSpeechTools._clients:
+            if provider == "openai":
+                TextToSpeechTools._clients[provider] = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+            elif provider == "elevenlabs":
+                _, ElevenLabs = check_elevenlabs()
+                api_key = os.getenv('ELEVENLABS_API_KEY')
+                if not api_key:
+                    raise ValueError("ELEVENLABS_API_KEY not found in environment variables")
+                TextToSpeechTools._clients[provider] = ElevenLabs(api_key=api_key)
+            else:
+                raise ValueError(f"Unsupported TTS provider: {provider}. Use 'openai' or 'elevenlabs'.")
+        return TextToSpeechTools._clients[provider]
+
+    @staticmethod
+    def _settings(provider: str, voice: Optional[str], model: Optional[str]) -> Tuple[str, str]:
+        if provider == "openai":
+            return voice or "onyx", model or "tts-1"
+        return voice or "Giovanni", model or "eleven_multilingual_v2"
+
+    @staticmethod
+    def _synthesize(provider: str, text: str, voice: Optional[str] = None, model: Optional[str] = None,
+                    audio_format: Literal["mp3", "pcm"] = "mp3", use_cache: bool = True) -> Tuple[bytes, bool]:
+        """Return the complete audio for the text and whether it came from the cache."""
+        voice, model = TextToSpeechTools._settings(provider, voice, model)
+        cache = get_tts_cache()
+        key = TTSAudioCache.key(provider, model, voice, audio_format, text)
+        if use_cache and (audio := cache.get(key)) is not None:
+            return audio, True
+
+        client = TextToSpeechTools._get_client(provider)
+        if provider == "openai":
+            audio = client.audio.speech.create(
+                model=model,
+                voice=voice,
+                input=text,
+                speed=1.0,
+                response_format=audio_format
+            ).content
+        else:
+            audio = client.generate(
+                text=text,
+                voice=voice,
+                model=model,
+                output_format=f"pcm_{PCM_SAMPLE_RATE}" if audio_format == "pcm" else "mp3_44100_128"
+            )
+            if not isinstance(audio, bytes):
+                audio = b"".join(audio)
+        if use_cache:
+            cache.put(key, audio)
+        return audio, False
+
+    @staticmethod
+    def _synthesize_stream(provider: str, text: str, voice: Optional[str], model: Optional[str]) -> Iterator[bytes]:
+        """Yield raw 24 kHz 16-bit mono PCM for the text as the provider streams it, or all at once when cached."""
+        voice, model = TextToSpeechTools._settings(provider, voice, model)
+        cache = get_tts_cache()
+        key = TTSAudioCache.key(provider, model, voice, "pcm", text)
+        if (audio := cache.get(key)) is not None:
+            yield audio
+            return
+
+        client = TextToSpeechTools._get_client(provider)
+        chunks = []
+        if provider == "openai":
+            with client.audio.speech.with_streaming_response.create(
+                model=model,
+                voice=voice,
+                input=text,
+                response_format="pcm"
+            ) as response:
+                for chunk in response.iter_bytes():
+                    chunks.append(chunk)
+                    yield chunk
+        else:
+            for chunk in client.generate(
+                text=text,
+                voice=voice,
+                model=model,
+                stream=True,
+                output_format=f"pcm_{PCM_SAMPLE_RATE}"
+            ):
+                chunks.append(chunk)
+                yield chunk
+        cache.put(key, b"".join(chunks))
+
     @staticmethod
-    def elevenlabs_text_to_speech(text: str, voice: str = "Giovanni", output_file: str = None):
+    def prewarm_cache(
+        phrases: Iterable[str],
+        provider: Literal["openai", "elevenlabs"] = "openai",
+        voice: Optional[str] = None,
+        model: Optional[str] = None,
+        audio_format: Literal["mp3", "pcm"] = "mp3",
+        max_concurrency: int = 4
+    ) -> Dict[str, int]:
         """
-        Convert text to speech using the ElevenLabs API and either play the generated audio or save it to a file.
+        Synthesize stock phrases ahead of time, e.g. at experience startup, so speaking them later is instant.
+
+        Phrases already in the cache are skipped. Use audio_format="mp3" for openai_text_to_speech and
+        elevenlabs_text_to_speech, and "pcm" for stream_speech.
 
         Args:
-            text (str): The text to convert to speech.
-            voice (str, optional): The name of the voice to use. Defaults to "Giovanni".
-            output_file (str, optional): The name of the file to save the generated audio. If None, the audio will be played aloud.
+            phrases (Iterable[str]): The phrases to cache.
+            provider (str, optional): "openai" or "elevenlabs". Defaults to "openai".
+            voice (str, optional): The voice to use. Defaults to "onyx" for OpenAI and "Giovanni" for ElevenLabs.
+            model (str, optional): The model to use. Defaults to "tts-1" for OpenAI and "eleven_multilingual_v2" for ElevenLabs.
+            audio_format (str, optional): "mp3" or "pcm". Defaults to "mp3".
+            max_concurrency (int, optional): Maximum phrases synthesized at once. Defaults to 4.
 
         Returns:
-            None
+            Dict[str, int]: Counts of phrases 'cached' already and newly 'synthesized'.
+        """
+        cache = get_tts_cache()
+        if not cache.enabled:
+            raise ValueError("The TTS cache is disabled; enable it with configure_tts_cache()")
+        resolved_voice, resolved_model = TextToSpeechTools._settings(provider, voice, model)
+        phrases = list(dict.fromkeys(p.strip() for p in phrases if p and p.strip()))
+        missing = [p for p in phrases if TTSAudioCache.key(provider, resolved_model, resolved_voice, audio_format, p) not in cache]
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(missing)))) as executor:
+                list(executor.map(
+                    lambda phrase: TextToSpeechTools._synthesize(provider, phrase, voice, model, audio_format), missing
+                ))
+        return {"cached": len(phrases) - len(missing), "synthesized": len(missing)}
+
+    @staticmethod
+    def _play(audio: bytes, delay: float = 0.0) -> None:
+        pygame = check_pygame()
+        pygame.mixer.init()
+        pygame.mixer.music.load(io.BytesIO(audio))
+        time.sleep(delay)
+        pygame.mixer.music.play()
+        while pygame.mixer.music.get_busy():
+            time.sleep(0.1)
+        pygame.mixer.quit()
+
+    @staticmethod
+    async def stream_speech(
+        text: Union[str, Iterable[str], AsyncIterable[str]],
+        sink: Optional[Callable[[bytes], Any]] = None,
+        provider: Literal["openai", "elevenlabs"] = "openai",
+        voice: Optional[str] = None,
+        model: Optional[str] = None,
+        max_concurrency: int = 3,
+        min_segment_chars: int = 20
+    ) -> Dict[str, Any]:
         """
+        Speak streamed text with low latency, e.g. the output of a streaming StreamTask.
+
+        The text is split into sentences as it arrives; up to max_concurrency sentences are synthesized
+        at once while earlier ones play, and audio reaches the sink in order as soon as the provider
+        streams it.
+
+        Args:
+            text (Union[str, Iterable[str], AsyncIterable[str]]): The text, or an iterator of text pieces.
+            sink (Callable[[bytes], Any], optional): Called with each chunk of raw 24 kHz 16-bit mono PCM audio;
+                may be a coroutine function. If None, the audio is collected and returned.
+            provider (str, optional): "openai" or "elevenlabs". Defaults to "openai".
+            voice (str, optional): The voice to use. Defaults to "onyx" for OpenAI and "Giovanni" for ElevenLabs.
+            model (str, optional): The model to use. Defaults to "tts-1" for OpenAI and "eleven_multilingual_v2" for ElevenLabs.
+            max_concurrency (int, optional): Maximum sentences synthesized at once. Defaults to 3.
+            min_segment_chars (int, optional): Shorter sentences are joined with the next one. Defaults to 20.
+
+        Returns:
+            Dict[str, Any]: 'segments' spoken, audio 'bytes', 'sample_rate', 'time_to_first_audio' in seconds,
+                and the collected 'audio' when no sink is given.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        order: asyncio.Queue = asyncio.Queue()
+        tasks: List[asyncio.Task] = []
+        started = time.monotonic()
+
+        async def synthesize(segment: str, queue: asyncio.Queue) -> None:
+            async with semaphore:
+                def run():
+                    for chunk in TextToSpeechTools._synthesize_stream(provider, segment, voice, model):
+                        loop.call_soon_threadsafe(queue.put_nowait, chunk)
+                try:
+                    await asyncio.to_thread(run)
+                except Exception as e:
+                    queue.put_nowait(e)
+                finally:
+                    queue.put_nowait(None)
+
+        async def produce() -> None:
+            try:
+                async for segment in segment_sentences(text, min_chars=min_segment_chars):
+                    queue: asyncio.Queue = asyncio.Queue()
+                    tasks.append(asyncio.create_task(synthesize(segment, queue)))
+                    order.put_nowait(queue)
+            except Exception as e:
+                order.put_nowait(e)
+            finally:
+                order.put_nowait(None)
+
+        producer = asyncio.create_task(produce())
+        audio = bytearray()
+        segments = 0
+        total = 0
+        first_audio = None
         try:
-            from elevenlabs import play
-            from elevenlabs.client import ElevenLabs
-        except ModuleNotFoundError as e:
-            raise ImportError(f"{e.name} is required for text_to_speech. Install with `pip install {e.name}`")
+            while (queue := await order.get()) is not None:
+                if isinstance(queue, Exception):
+                    raise queue
+                segments += 1
+                while (chunk := await queue.get()) is not None:
+                    if isinstance(chunk, Exception):
+                        raise chunk
+                    if first_audio is None:
+                        first_audio = time.monotonic() - started
+                    total += len(chunk)
+                    if sink is None:
+                        audio.extend(chunk)
+                    elif asyncio.iscoroutine(pending := sink(chunk)):
+                        await pending
+        finally:
+            producer.cancel()
+            for task in tasks:
+                task.cancel()
 
-        api_key = os.getenv('ELEVENLABS_API_KEY')
-        
-        if not api_key:
-            raise ValueError("ELEVENLABS_API_KEY not found in environment variables")
+        result = {"segments": segments, "bytes": total, "sample_rate": PCM_SAMPLE_RATE, "time_to_first_audio": first_audio}
+        if sink is None:
+            result["audio"] = bytes(audio)
+        return result
 
-        client = ElevenLabs(api_key=api_key)
+    @staticmethod
+    def elevenlabs_text_to_speech(text: str, voice: str = "Giovanni", output_file: str = None, use_cache: bool = True):
+        """
+        Convert text to speech using the ElevenLabs API and either play the generated audio or save it to a file.
 
-        audio = client.generate(
-            text=text,
-            voice=voice,
-            model="eleven_multilingual_v2"
-        )
+        Phrases spoken before with the same voice are served from the TTS cache without calling the API.
+
+        Args:
+            text (str): The text to convert to speech.
+            voice (str, optional): The name of the voice to use. Defaults to "Giovanni".
+            output_file (str, optional): The name of the file to save the generated audio. If None, the audio will be played aloud.
+            use_cache (bool, optional): Whether to read and write the TTS cache. Defaults to True.
+
+        Returns:
+            bytes: The generated MP3 audio.
+        """
+        play, _ = check_elevenlabs()
+        audio, _ = TextToSpeechTools._synthesize("elevenlabs", text, voice, audio_format="mp3", use_cache=use_cache)
 
         if output_file:
             with open(output_file, "wb") as file:
@@ -66,56 +469,254 @@ class TextToSpeechTools:
         return audio
 
     @staticmethod
-    def openai_text_to_speech(text: str, voice: str = "onyx", output_file: str = None):
+    def openai_text_to_speech(text: str, voice: str = "onyx", output_file: str = None, use_cache: bool = True):
         """
         Generate speech from text using the OpenAI API and either save it to a file or play it aloud.
 
+        Phrases spoken before with the same voice are served from the TTS cache without calling the API.
+
         Args:
             text (str): The text to convert to speech.
             voice (str, optional): The name of the voice to use. Defaults to "onyx".
             output_file (str, optional): The name of the file to save the generated audio. If None, the audio will be played aloud.
+            use_cache (bool, optional): Whether to read and write the TTS cache. Defaults to True.
 
         Returns:
             None
         """
-        try:
-            import os
-            os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
-            import pygame
-        except ModuleNotFoundError:
-            raise ImportError("pygame is required for audio playback in the openai_text_to_speech tool. Install with `pip install pygame`")
+        if not output_file:
+            check_pygame()
 
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
-        response = client.audio.speech.create(
-            model="tts-1",
-            voice=voice,
-            input=text,
-            speed=1.0
-        )
+        audio, cached = TextToSpeechTools._synthesize("openai", text, voice, audio_format="mp3", use_cache=use_cache)
 
         if output_file:
-            # Save the audio file using the recommended streaming method
             with open(output_file, "wb") as file:
-                for chunk in response.iter_bytes():
-                    file.write(chunk)
+                file.write(audio)
         else:
-            time.sleep(0.7)
-            # Play the audio directly using pygame
-            pygame.mixer.init()
-            audio_data = b''.join(chunk for chunk in response.iter_bytes())
-            audio_file = io.BytesIO(audio_data)
-            pygame.mixer.music.load(audio_file)
-                    
-            # Add a small delay before playing
-            time.sleep(1)
-            
-            pygame.mixer.music.play()
-            while pygame.mixer.music.get_busy():
-                time.sleep(0.1)
-            pygame.mixer.quit()
+            # Freshly synthesized audio keeps the original settling delays; cached phrases play immediately
+            if not cached:
+                time.sleep(0.7)
+            TextToSpeechTools._play(audio, delay=0 if cached else 1)
+
+WHISPER_MAX_UPLOAD_BYTES = 25 * 1024 * 1024
+CHUNK_SAMPLE_RATE = 16000
+ENERGY_FRAME_SECONDS = 0.02
+
+def _openai_audio_url(endpoint: str) -> str:
+    return f"{os.getenv('OPENAI_BASE_URL', 'https://api.openai.com/v1').rstrip('/')}/audio/{endpoint}"
+
+def _load_pcm(file_path: str) -> Tuple[np.ndarray, int]:
+    """
+    Decode an audio file to mono 16-bit samples.
+
+    WAV files are read with the standard library; other formats are decoded to 16 kHz by the ffmpeg command-line tool.
+    """
+    if not os.path.isfile(file_path):
+        raise FileNotFoundError(f"Audio file not found: {file_path}")
+
+    if file_path.lower().endswith(".wav"):
+        with wave.open(file_path, "rb") as wav:
+            if wav.getsampwidth() == 2:
+                samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype="<i2")
+                channels = wav.getnchannels()
+                if channels > 1:
+                    samples = samples.reshape(-1, channels).mean(axis=1).astype(np.int16)
+                return samples, wav.getframerate()
+
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise ImportError("ffmpeg is required to split audio in this format. Install it from https://ffmpeg.org or convert the file to 16-bit WAV")
+    process = subprocess.run(
+        [ffmpeg, "-nostdin", "-v", "error", "-i", file_path, "-f", "s16le", "-ac", "1", "-ar", str(CHUNK_SAMPLE_RATE), "-"],
+        capture_output=True, check=True
+    )
+    return np.frombuffer(process.stdout, dtype="<i2"), CHUNK_SAMPLE_RATE
+
+def _plan_chunks(samples: np.ndarray, sample_rate: int, max_seconds: float, overlap: float,
+                 search_seconds: float) -> List[Tuple[int, int]]:
+    """
+    Choose chunk boundaries of at most max_seconds, cutting at the quietest point in the last
+    search_seconds of each chunk. Consecutive chunks share `overlap` seconds of audio.
+    """
+    frame = max(1, int(sample_rate * ENERGY_FRAME_SECONDS))
+    num_frames = len(samples) // frame
+    energy = np.sqrt(np.mean(samples[:num_frames * frame].astype(np.float32).reshape(-1, frame) ** 2, axis=1)) if num_frames else np.zeros(0)
+
+    max_samples = int(max_seconds * sample_rate)
+    overlap_samples = int(overlap * sample_rate)
+    search_samples = int(min(search_seconds, max_seconds / 2) * sample_rate)
+    chunks = []
+    start = 0
+    while start < len(samples):
+        end = start + max_samples
+        if end >= len(samples):
+            chunks.append((start, len(samples)))
+            break
+        first, last = (end - search_samples) // frame, end // frame
+        window = energy[first:last]
+        if len(window):
+            end = (first + int(np.argmin(window))) * frame + frame // 2
+        chunks.append((start, end))
+        start = max(end - overlap_samples, start + 1)
+    return chunks
+
+def _encode_wav(samples: np.ndarray, sample_rate: int) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(samples.astype("<i2").tobytes())
+    return buffer.getvalue()
+
+def _format_timestamp(seconds: float, separator: str) -> str:
+    milliseconds = int(round(seconds * 1000))
+    hours, milliseconds = divmod(milliseconds, 3600000)
+    minutes, milliseconds = divmod(milliseconds, 60000)
+    seconds, milliseconds = divmod(milliseconds, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}{separator}{milliseconds:03d}"
+
+def _format_subtitles(segments: List[Dict], response_format: str) -> str:
+    if response_format == "vtt":
+        cues = [f"{_format_timestamp(s['start'], '.')} --> {_format_timestamp(s['end'], '.')}\n{s['text'].strip()}" for s in segments]
+        return "WEBVTT\n\n" + "\n\n".join(cues) + "\n"
+    cues = [f"{i}\n{_format_timestamp(s['start'], ',')} --> {_format_timestamp(s['end'], ',')}\n{s['text'].strip()}"
+            for i, s in enumerate(segments, start=1)]
+    return "\n\n".join(cues) + "\n"
 
 class WhisperTools:
+    max_upload_bytes = WHISPER_MAX_UPLOAD_BYTES
+
+    @staticmethod
+    def _request(endpoint: str, file: Tuple[str, Any], data: Dict[str, Any], response_format: str) -> Union[Dict, str]:
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY must be set in .env file")
+
+        def send():
+            if hasattr(file[1], "seek"):
+                file[1].seek(0)
+            return get_session().post(_openai_audio_url(endpoint), headers={'Authorization': f'Bearer {api_key}'},
+                                      files={'file': file}, data=data, timeout=600)
+
+        response = request_with_backoff(send)
+        response.raise_for_status()
+        if response_format == 'json' or response_format == 'verbose_json':
+            return response.json()
+        return response.text
+
+    @staticmethod
+    def _process_files(endpoint: str, audio_input: Union[str, List[str]], data: Dict[str, Any], response_format: str,
+                       max_concurrency: int) -> Union[Dict, str, List[Union[Dict, str]]]:
+        if isinstance(audio_input, str):
+            paths = [audio_input]
+        elif isinstance(audio_input, list) and all(isinstance(file, str) for file in audio_input):
+            paths = audio_input
+        else:
+            raise ValueError('Invalid input type. Expected string or list of strings.')
+        missing = [path for path in paths if not os.path.isfile(path)]
+        if missing:
+            raise FileNotFoundError(f"Audio file(s) not found: {', '.join(missing)}")
+
+        def process_single_file(file_path):
+            if os.path.getsize(file_path) > WhisperTools.max_upload_bytes:
+                return WhisperTools._process_long_file(endpoint, file_path, data, response_format, max_concurrency)
+            with open(file_path, 'rb') as audio_file:
+                return WhisperTools._request(endpoint, (os.path.basename(file_path), audio_file), data, response_format)
+
+        if isinstance(audio_input, str):
+            return process_single_file(audio_input)
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(paths)))) as executor:
+            return list(executor.map(process_single_file, paths))
+
+    @staticmethod
+    def _process_long_file(endpoint: str, file_path: str, data: Dict[str, Any], response_format: str,
+                           max_concurrency: int) -> Union[Dict, str]:
+        params = {key: value for key, value in data.items() if key not in ('model', 'response_format', 'temperature')}
+        result = WhisperTools._transcribe_long(endpoint, file_path, data['model'], temperature=data['temperature'],
+                                               max_concurrency=max_concurrency, **params)
+        if response_format == 'verbose_json':
+            return result
+        if response_format == 'json':
+            return {"text": result["text"]}
+        if response_format in ('srt', 'vtt'):
+            return _format_subtitles(result["segments"], response_format)
+        return result["text"]
+
+    @staticmethod
+    def _stream_chunks(endpoint: str, file_path: str, model: str, max_chunk_seconds: float, overlap_seconds: float,
+                       silence_search_seconds: float, max_concurrency: int, temperature: float,
+                       **params) -> Iterator[Dict[str, Any]]:
+        samples, sample_rate = _load_pcm(file_path)
+        # Leave room for the WAV header and multipart framing under the upload limit
+        max_seconds = min(max_chunk_seconds, (WhisperTools.max_upload_bytes - 64 * 1024) / (2 * sample_rate))
+        chunks = _plan_chunks(samples, sample_rate, max_seconds, overlap_seconds, silence_search_seconds)
+
+        data = {'model': model, 'response_format': 'verbose_json', 'temperature': temperature}
+        data.update({key: value for key, value in params.items() if value})
+
+        def transcribe(index):
+            start, end = chunks[index]
+            audio = _encode_wav(samples[start:end], sample_rate)
+            return WhisperTools._request(endpoint, (f"chunk_{index}.wav", io.BytesIO(audio)), data, 'verbose_json')
+
+        # Segments in the overlap of two chunks are taken from whichever chunk holds them nearer its middle
+        cuts = [0.0] + [(chunks[i + 1][0] + chunks[i][1]) / 2 / sample_rate for i in range(len(chunks) - 1)] + [float("inf")]
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(chunks)))) as executor:
+            futures = [executor.submit(transcribe, index) for index in range(len(chunks))]
+            try:
+                for index, future in enumerate(futures):
+                    response = future.result()
+                    offset = chunks[index][0] / sample_rate
+                    lo, hi = cuts[index], cuts[index + 1]
+                    segments = []
+                    for segment in response.get("segments") or []:
+                        start, end = segment["start"] + offset, segment["end"] + offset
+                        if lo <= start < hi:
+                            segments.append({**segment, "start": start, "end": end})
+                    words = [{**word, "start": word["start"] + offset, "end": word["end"] + offset}
+                             for word in response.get("words") or [] if lo <= word["start"] + offset < hi]
+                    if not response.get("segments"):
+                        text = response.get("text", "")
+                    else:
+                        text = "".join(segment["text"] for segment in segments)
+                    yield {
+                        "chunk": index,
+                        "num_chunks": len(chunks),
+                        "start": offset,
+                        "end": chunks[index][1] / sample_rate,
+                        "text": text.strip(),
+                        "segments": segments,
+                        "words": words,
+                        "language": response.get("language"),
+                    }
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    @staticmethod
+    def _transcribe_long(endpoint: str, file_path: str, model: str, **kwargs) -> Dict[str, Any]:
+        parts = list(WhisperTools._stream_chunks(endpoint, file_path, model,
+                                                 max_chunk_seconds=kwargs.pop('max_chunk_seconds', 600),
+                                                 overlap_seconds=kwargs.pop('overlap_seconds', 2.0),
+                                                 silence_search_seconds=kwargs.pop('silence_search_seconds', 30.0),
+                                                 max_concurrency=kwargs.pop('max_concurrency', 4), **kwargs))
+        segments = [segment for part in parts for segment in part["segments"]]
+        for i, segment in enumerate(segments):
+            segment["id"] = i
+        result = {
+            "text": " ".join(part["text"] for part in parts if part["text"]),
+            "language": parts[0]["language"] if parts else None,
+            "duration": parts[-1]["end"] if parts else 0.0,
+            "segments": segments,
+            "chunks": len(parts),
+        }
+        words = [word for part in parts for word in part["words"]]
+        if words:
+            result["words"] = words
+        return result
+
     @staticmethod
     def whisper_transcribe_audio(
         audio_input: Union[str, List[str]],
@@ -124,11 +725,15 @@ class WhisperTools:
         prompt: Optional[str] = None,
         response_format: Literal["json", "text", "srt", "verbose_json", "vtt"] = "json",
         temperature: float = 0,
-        timestamp_granularities: Optional[List[Literal["segment", "word"]]] = None
+        timestamp_granularities: Optional[List[Literal["segment", "word"]]] = None,
+        max_concurrency: int = 4
     ) -> Union[Dict, List[Dict]]:
         """
         Transcribe audio using the OpenAI Whisper API.
 
+        Lists of files are transcribed concurrently, and files over the API's 25 MB upload limit are
+        split into chunks and transcribed with transcribe_long_audio.
+
         Args:
             audio_input (Union[str, List[str]]): Path to audio file(s) or list of paths.
             model (str): The model to use for transcription. Default is "whisper-1".
@@ -137,47 +742,26 @@ class WhisperTools:
             response_format (str): The format of the transcript output. Default is "json".
             temperature (float): The sampling temperature, between 0 and 1. Default is 0.
             timestamp_granularities (Optional[List[str]]): List of timestamp granularities to include.
+            max_concurrency (int): Maximum number of concurrent requests. Default is 4.
 
         Returns:
             Union[Dict, List[Dict]]: Transcription result(s) in the specified format.
-        """
-        api_key = os.getenv("OPENAI_API_KEY")
-        
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY must be set in .env file")
-
-        url = 'https://api.openai.com/v1/audio/transcriptions'
-        headers = {'Authorization': f'Bearer {api_key}'}
-
-        def process_single_file(file_path):
-            with open(file_path, 'rb') as audio_file:
-                files = {'file': audio_file}
-                data = {
-                    'model': model,
-                    'response_format': response_format,
-                    'temperature': temperature,
-                }
-                if language:
-                    data['language'] = language
-                if prompt:
-                    data['prompt'] = prompt
-                if timestamp_granularities:
-                    data['timestamp_granularities'] = timestamp_granularities
-
-                response = requests.post(url, headers=headers, files=files, data=data)
-                response.raise_for_status()
-                
-                if response_format == 'json' or response_format == 'verbose_json':
-                    return response.json()
-                else:
-                    return response.text
 
-        if isinstance(audio_input, str):
-            return process_single_file(audio_input)
-        elif isinstance(audio_input, list) and all(isinstance(file, str) for file in audio_input):
-            return [process_single_file(file) for file in audio_input if os.path.isfile(file)]
-        else:
-            raise ValueError('Invalid input type. Expected string or list of strings.')
+        Raises:
+            FileNotFoundError: If any of the audio files does not exist.
+        """
+        data = {
+            'model': model,
+            'response_format': response_format,
+            'temperature': temperature,
+        }
+        if language:
+            data['language'] = language
+        if prompt:
+            data['prompt'] = prompt
+        if timestamp_granularities:
+            data['timestamp_granularities'] = timestamp_granularities
+        return WhisperTools._process_files('transcriptions', audio_input, data, response_format, max_concurrency)
 
     @staticmethod
     def whisper_translate_audio(
@@ -186,11 +770,15 @@ class WhisperTools:
         prompt: Optional[str] = None,
         response_format: Literal["json", "text", "srt", "verbose_json", "vtt"] = "json",
         temperature: float = 0,
-        timestamp_granularities: Optional[List[Literal["segment", "word"]]] = None
+        timestamp_granularities: Optional[List[Literal["segment", "word"]]] = None,
+        max_concurrency: int = 4
     ) -> Union[Dict, List[Dict]]:
         """
         Translate audio to English using the OpenAI Whisper API.
 
+        Lists of files are translated concurrently, and files over the API's 25 MB upload limit are
+        split into chunks and translated piece by piece.
+
         Args:
             audio_input (Union[str, List[str]]): Path to audio file(s) or list of paths.
             model (str): The model to use for translation. Default is "whisper-1".
@@ -198,43 +786,83 @@ class WhisperTools:
             response_format (str): The format of the transcript output. Default is "json".
             temperature (float): The sampling temperature, between 0 and 1. Default is 0.
             timestamp_granularities (Optional[List[str]]): List of timestamp granularities to include.
+            max_concurrency (int): Maximum number of concurrent requests. Default is 4.
 
         Returns:
             Union[Dict, List[Dict]]: Translation result(s) in the specified format.
+
+        Raises:
+            FileNotFoundError: If any of the audio files does not exist.
         """
-        load_dotenv()
-        api_key = os.getenv("OPENAI_API_KEY")
-        
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY must be set in .env file")
+        data = {
+            'model': model,
+            'response_format': response_format,
+            'temperature': temperature,
+        }
+        if prompt:
+            data['prompt'] = prompt
+        if timestamp_granularities:
+            data['timestamp_granularities'] = timestamp_granularities
+        return WhisperTools._process_files('translations', audio_input, data, response_format, max_concurrency)
 
-        url = 'https://api.openai.com/v1/audio/translations'
-        headers = {'Authorization': f'Bearer {api_key}'}
+    @staticmethod
+    def transcribe_long_audio(
+        file_path: str,
+        model: str = "whisper-1",
+        language: Optional[str] = None,
+        prompt: Optional[str] = None,
+        temperature: float = 0,
+        timestamp_granularities: Optional[List[Literal["segment", "word"]]] = None,
+        max_chunk_seconds: float = 600,
+        overlap_seconds: float = 2.0,
+        silence_search_seconds: float = 30.0,
+        max_concurrency: int = 4
+    ) -> Dict[str, Any]:
+        """
+        Transcribe a long recording, such as a stream VOD, by splitting it on silence into chunks that are transcribed concurrently.
 
-        def process_single_file(file_path):
-            with open(file_path, 'rb') as audio_file:
-                files = {'file': audio_file}
-                data = {
-                    'model': model,
-                    'response_format': response_format,
-                    'temperature': temperature,
-                }
-                if prompt:
-                    data['prompt'] = prompt
-                if timestamp_granularities:
-                    data['timestamp_granularities'] = timestamp_granularities
-
-                response = requests.post(url, headers=headers, files=files, data=data)
-                response.raise_for_status()
-                
-                if response_format == 'json' or response_format == 'verbose_json':
-                    return response.json()
-                else:
-                    return response.text
+        Args:
+            file_path (str): Path to the audio file. Formats other than 16-bit WAV require ffmpeg.
+            model (str): The model to use for transcription. Default is "whisper-1".
+            language (Optional[str]): The language of the input audio. If None, Whisper will auto-detect.
+            prompt (Optional[str]): An optional text to guide the model's style, sent with every chunk.
+            temperature (float): The sampling temperature, between 0 and 1. Default is 0.
+            timestamp_granularities (Optional[List[str]]): Include "word" to also return word timestamps.
+            max_chunk_seconds (float): Longest chunk, in seconds; chunks are also kept under the upload limit. Default is 600.
+            overlap_seconds (float): Audio shared by consecutive chunks so words at a cut are not lost. Default is 2.0.
+            silence_search_seconds (float): How far back from the longest cut to look for the quietest point. Default is 30.0.
+            max_concurrency (int): Maximum number of chunks transcribed at once. Default is 4.
 
-        if isinstance(audio_input, str):
-            return process_single_file(audio_input)
-        elif isinstance(audio_input, list):
-            return [process_single_file(file) for file in audio_input if os.path.isfile(file)]
-        else:
-            raise ValueError('Invalid input type. Expected string or list of strings.')
+        Returns:
+            Dict[str, Any]: The stitched 'text', 'language', 'duration', 'segments' with timestamps relative to the
+                whole recording, the number of 'chunks', and 'words' when requested.
+        """
+        return WhisperTools._transcribe_long('transcriptions', file_path, model, language=language, prompt=prompt,
+                                             temperature=temperature, timestamp_granularities=timestamp_granularities,
+                                             max_chunk_seconds=max_chunk_seconds, overlap_seconds=overlap_seconds,
+                                             silence_search_seconds=silence_search_seconds, max_concurrency=max_concurrency)
+
+    @staticmethod
+    def stream_transcription(
+        file_path: str,
+        model: str = "whisper-1",
+        language: Optional[str] = None,
+        prompt: Optional[str] = None,
+        temperature: float = 0,
+        timestamp_granularities: Optional[List[Literal["segment", "word"]]] = None,
+        max_chunk_seconds: float = 600,
+        overlap_seconds: float = 2.0,
+        silence_search_seconds: float = 30.0,
+        max_concurrency: int = 4
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Transcribe a long recording chunk by chunk, yielding each chunk's stitched transcript in order as soon as it is ready.
+
+        Takes the same arguments as transcribe_long_audio. Each yielded dict has 'chunk', 'num_chunks', 'start', 'end',
+        'text', 'segments', 'words' and 'language', with timestamps relative to the whole recording. Closing the
+        generator early cancels the chunks that have not started.
+        """
+        return WhisperTools._stream_chunks('transcriptions', file_path, model, max_chunk_seconds=max_chunk_seconds,
+                                           overlap_seconds=overlap_seconds, silence_search_seconds=silence_search_seconds,
+                                           max_concurrency=max_concurrency, temperature=temperature, language=language,
+                                           prompt=prompt, timestamp_granularities=timestamp_granularities)
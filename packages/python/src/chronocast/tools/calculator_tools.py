@@ -1,4 +1,358 @@
+import ast
+import math
+import operator
+import decimal
+from decimal import Decimal
 from datetime import timedelta, datetime
+from typing import Any, Callable, Dict, List, Optional, Union
+import numpy as np
+
+MAX_EXPRESSION_LENGTH = 10000
+# Integer results are kept exact, so bound their size: Python refuses to print ints above 4300 digits
+MAX_INTEGER_DIGITS = 4000
+MAX_INTEGER_BITS = int(MAX_INTEGER_DIGITS * math.log2(10))
+MAX_PRECISION = 1000
+
+CONSTANTS = {"pi": math.pi, "e": math.e, "tau": math.tau, "inf": math.inf, "nan": math.nan, "True": True, "False": False}
+
+BINARY_OPERATORS: Dict[type, Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.BitAnd: operator.and_,
+    ast.BitOr: operator.or_,
+}
+
+COMPARISON_OPERATORS: Dict[type, Callable[[Any, Any], Any]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+def _is_exact(value: Any) -> bool:
+    return isinstance(value, Decimal) or isinstance(value, np.ndarray) and value.dtype == object
+
+def _vector(value: Any) -> np.ndarray:
+    if isinstance(value, np.ndarray):
+        return value.ravel()
+    return np.array([value], dtype=object if isinstance(value, Decimal) else None)
+
+def _non_empty(value: Any, name: str) -> np.ndarray:
+    values = _vector(value)
+    if len(values) == 0:
+        raise ValueError(f"{name}() requires at least one value.")
+    return values
+
+def _integer(value: Any, name: str) -> int:
+    if isinstance(value, (bool, np.bool_)) or not isinstance(value, (int, np.integer, Decimal, float)) or value != int(value):
+        raise ValueError(f"{name} must be an integer.")
+    return int(value)
+
+def _check_integer_bits(bits: int) -> None:
+    if bits > MAX_INTEGER_BITS:
+        raise ValueError(f"Integer results are limited to {MAX_INTEGER_DIGITS} digits.")
+
+def _check_integer(value: Any) -> Any:
+    if isinstance(value, int) and not isinstance(value, bool):
+        _check_integer_bits(value.bit_length())
+    return value
+
+def _elementwise(value: Any, float_function: Callable[[Any], Any], decimal_function: Optional[Callable[[Decimal], Any]], name: str) -> Any:
+    if not _is_exact(value):
+        return float_function(value)
+    if decimal_function is None:
+        raise ValueError(f"{name}() is not available in exact mode.")
+    if isinstance(value, np.ndarray):
+        return np.array([decimal_function(v) for v in value.ravel()], dtype=object).reshape(value.shape)
+    return decimal_function(value)
+
+def _sum(*values: Any) -> Any:
+    data = np.concatenate([_vector(v) for v in values]) if len(values) > 1 else _vector(values[0])
+    return sum(data, Decimal(0)) if _is_exact(data) else np.sum(data)
+
+def _mean(value: Any) -> Any:
+    data = _non_empty(value, "mean")
+    return sum(data, Decimal(0)) / len(data) if _is_exact(data) else np.mean(data)
+
+def _var(value: Any) -> Any:
+    data = _non_empty(value, "var")
+    if len(data) < 2:
+        raise ValueError("var() and std() require at least two values.")
+    if not _is_exact(data):
+        return np.var(data, ddof=1)
+    mean = sum(data, Decimal(0)) / len(data)
+    return sum(((v - mean) ** 2 for v in data), Decimal(0)) / (len(data) - 1)
+
+def _std(value: Any) -> Any:
+    variance = _var(value)
+    return variance.sqrt() if isinstance(variance, Decimal) else np.sqrt(variance)
+
+def _percentile(value: Any, q: Any) -> Any:
+    data = _non_empty(value, "percentile")
+    if not _is_exact(data):
+        return np.percentile(data, q)
+
+    ordered = sorted(data)
+    def one(p):
+        if not 0 <= p <= 100:
+            raise ValueError("Percentiles must be between 0 and 100.")
+        # Linear interpolation between the closest ranks, matching NumPy's default
+        position = (len(ordered) - 1) * Decimal(p) / 100
+        lower = int(position)
+        if lower + 1 >= len(ordered):
+            return ordered[-1]
+        return ordered[lower] + (ordered[lower + 1] - ordered[lower]) * (position - lower)
+    if isinstance(q, np.ndarray):
+        return np.array([one(p) for p in q.ravel()], dtype=object)
+    return one(q)
+
+def _extreme(function: Callable[[np.ndarray], Any], name: str) -> Callable[..., Any]:
+    def aggregate(*values: Any) -> Any:
+        if not values:
+            raise ValueError(f"{name}() requires at least one value.")
+        data = np.concatenate([_vector(v) for v in values]) if len(values) > 1 else _non_empty(values[0], name)
+        return function(data)
+    return aggregate
+
+def _pct_change(value: Any) -> Any:
+    data = _vector(value)
+    if len(data) < 2:
+        raise ValueError("pct_change() requires at least two values.")
+    return data[1:] / data[:-1] - 1
+
+def _growth(value: Any) -> Any:
+    data = _vector(value)
+    if len(data) < 2:
+        raise ValueError("growth() requires at least two values.")
+    return data[-1] / data[0] - 1
+
+def _cagr(value: Any, periods: Any = None) -> Any:
+    data = _vector(value)
+    if len(data) < 2:
+        raise ValueError("cagr() requires at least two values.")
+    periods = len(data) - 1 if periods is None else periods
+    if periods <= 0:
+        raise ValueError("cagr() requires a positive number of periods.")
+    ratio = data[-1] / data[0]
+    return ratio ** (Decimal(1) / Decimal(periods)) - 1 if isinstance(ratio, Decimal) else ratio ** (1 / periods) - 1
+
+def _weighted_mean(value: Any, weights: Any) -> Any:
+    data, weights = _vector(value), _vector(weights)
+    if len(data) != len(weights):
+        raise ValueError("weighted_mean() requires values and weights of the same length.")
+    return _sum(data * weights) / _sum(weights)
+
+def _round(value: Any, digits: Any = 0) -> Any:
+    digits = _integer(digits, "The number of digits")
+    # Exact mode rounds half up, as is usual for money; float mode rounds half to even like NumPy
+    return _elementwise(value, lambda v: np.round(v, digits),
+                        lambda d: d.quantize(Decimal(1).scaleb(-digits), rounding=decimal.ROUND_HALF_UP), "round")
+
+def _factorial(value: Any) -> int:
+    n = _integer(value, "The factorial argument")
+    if n < 0:
+        raise ValueError("Factorial requires a non-negative integer.")
+    if math.lgamma(n + 1) / math.log(10) > MAX_INTEGER_DIGITS:
+        raise ValueError(f"The factorial of {n} has more than {MAX_INTEGER_DIGITS} digits.")
+    return math.factorial(n)
+
+def _log(value: Any, base: Any = None) -> Any:
+    natural = _elementwise(value, np.log, lambda d: d.ln(), "log")
+    if base is None:
+        return natural
+    return natural / (base.ln() if isinstance(base, Decimal) else np.log(base))
+
+FUNCTIONS: Dict[str, Callable[..., Any]] = {
+    # Aggregates over vectors (several arguments are combined into one vector)
+    "sum": _sum,
+    "mean": _mean,
+    "median": lambda v: _percentile(v, 50),
+    "min": _extreme(np.min, "min"),
+    "max": _extreme(np.max, "max"),
+    "prod": lambda v: np.prod(_vector(v)),
+    "count": lambda v: len(_vector(v)),
+    "var": _var,
+    "std": _std,
+    "percentile": _percentile,
+    "weighted_mean": _weighted_mean,
+    # Growth rates
+    "pct_change": _pct_change,
+    "growth": _growth,
+    "cagr": _cagr,
+    # Vector transforms
+    "cumsum": lambda v: np.cumsum(_vector(v)),
+    "diff": lambda v: np.diff(_vector(v)),
+    "sort": lambda v: np.sort(_vector(v)),
+    "where": lambda condition, a, b: np.where(np.asarray(condition, dtype=bool), a, b),
+    # Element-wise functions
+    "abs": lambda v: np.abs(v) if isinstance(v, np.ndarray) else abs(v),
+    "round": _round,
+    "floor": lambda v: _elementwise(v, np.floor, lambda d: d.to_integral_value(decimal.ROUND_FLOOR), "floor"),
+    "ceil": lambda v: _elementwise(v, np.ceil, lambda d: d.to_integral_value(decimal.ROUND_CEILING), "ceil"),
+    "sqrt": lambda v: _elementwise(v, np.sqrt, lambda d: d.sqrt(), "sqrt"),
+    "exp": lambda v: _elementwise(v, np.exp, lambda d: d.exp(), "exp"),
+    "log": _log,
+    "ln": lambda v: _log(v),
+    "log10": lambda v: _elementwise(v, np.log10, lambda d: d.log10(), "log10"),
+    "sin": lambda v: _elementwise(v, np.sin, None, "sin"),
+    "cos": lambda v: _elementwise(v, np.cos, None, "cos"),
+    "tan": lambda v: _elementwise(v, np.tan, None, "tan"),
+    "factorial": _factorial,
+}
+
+class _Evaluator:
+    """Evaluates a parsed expression, allowing only arithmetic, comparisons, vectors, indexing and FUNCTIONS."""
+
+    def __init__(self, names: Dict[str, Any], exact: bool):
+        self.names = names
+        self.exact = exact
+
+    def number(self, value: Any) -> Any:
+        if isinstance(value, (bool, np.bool_)):
+            return bool(value)
+        if isinstance(value, (list, tuple, np.ndarray)):
+            return self.vector([self.number(v) for v in value])
+        if isinstance(value, (int, float, Decimal, np.number, str)) and not isinstance(value, complex):
+            _check_integer(value)
+            try:
+                if self.exact:
+                    return Decimal(value) if isinstance(value, (int, Decimal, str)) else Decimal(repr(float(value)))
+                return value.item() if isinstance(value, np.number) else int(value) if isinstance(value, int) else float(value)
+            except (ValueError, decimal.InvalidOperation):
+                pass
+        raise ValueError(f"Unsupported value: {value!r}. Only numbers and lists of numbers are allowed.")
+
+    def vector(self, values: List[Any]) -> np.ndarray:
+        # Lists of booleans stay boolean so they index as masks rather than as positions 0 and 1
+        if values and all(isinstance(v, (bool, np.bool_)) for v in values):
+            return np.array(values, dtype=bool)
+        return np.array(values, dtype=object) if self.exact else np.asarray(values, dtype=float)
+
+    def visit(self, node: ast.AST) -> Any:
+        if isinstance(node, ast.Expression):
+            return self.visit(node.body)
+        if isinstance(node, ast.Constant):
+            if isinstance(node.value, str):
+                raise ValueError(f"Unsupported value: {node.value!r}. Only numbers and lists of numbers are allowed.")
+            return self.number(node.value)
+        if isinstance(node, ast.Name):
+            if node.id in self.names:
+                return self.names[node.id]
+            if node.id in CONSTANTS:
+                return self.number(CONSTANTS[node.id])
+            if node.id in FUNCTIONS:
+                raise ValueError(f"{node.id} is a function; call it as {node.id}(...).")
+            raise ValueError(f"Unknown name: {node.id}")
+        if isinstance(node, (ast.List, ast.Tuple)):
+            return self.vector([self.visit(element) for element in node.elts])
+        if isinstance(node, ast.BinOp):
+            left, right = self.visit(node.left), self.visit(node.right)
+            if isinstance(node.op, ast.Pow):
+                return self.power(left, right)
+            if type(node.op) not in BINARY_OPERATORS:
+                raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+            if isinstance(node.op, ast.Mult) and isinstance(left, int) and isinstance(right, int) and left and right:
+                # Check before multiplying: the product of two huge ints is slow to compute
+                _check_integer_bits(left.bit_length() + right.bit_length() - 1)
+            return _check_integer(BINARY_OPERATORS[type(node.op)](left, right))
+        if isinstance(node, ast.UnaryOp):
+            operand = self.visit(node.operand)
+            if isinstance(node.op, ast.USub):
+                return -operand
+            if isinstance(node.op, ast.UAdd):
+                return +operand
+            if isinstance(node.op, ast.Not):
+                return np.logical_not(operand)
+            raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+        if isinstance(node, ast.Compare):
+            result = None
+            left = self.visit(node.left)
+            for op, comparator in zip(node.ops, node.comparators):
+                if type(op) not in COMPARISON_OPERATORS:
+                    raise ValueError(f"Unsupported comparison: {type(op).__name__}")
+                right = self.visit(comparator)
+                outcome = COMPARISON_OPERATORS[type(op)](left, right)
+                result = outcome if result is None else np.logical_and(result, outcome)
+                left = right
+            return result
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS:
+                name = node.func.id if isinstance(node.func, ast.Name) else ast.unparse(node.func)
+                raise ValueError(f"Unknown function: {name}. Available functions: {', '.join(FUNCTIONS)}")
+            args = [self.visit(arg) for arg in node.args]
+            kwargs = {keyword.arg: self.visit(keyword.value) for keyword in node.keywords if keyword.arg}
+            try:
+                return FUNCTIONS[node.func.id](*args, **kwargs)
+            except TypeError as e:
+                raise ValueError(f"Invalid arguments for {node.func.id}(): {e}")
+        if isinstance(node, ast.Subscript):
+            value = self.visit(node.value)
+            if not isinstance(value, np.ndarray):
+                raise ValueError("Only vectors can be indexed.")
+            return value[self.index(node.slice)]
+        raise ValueError(f"Unsupported expression: {type(node).__name__}")
+
+    def index(self, node: ast.AST) -> Any:
+        if isinstance(node, ast.Slice):
+            bounds = [None if part is None else _integer(self.visit(part), "Slice bounds") for part in (node.lower, node.upper, node.step)]
+            return slice(*bounds)
+        index = self.visit(node)
+        if isinstance(index, np.ndarray):
+            return index.astype(bool) if index.dtype in (bool, object) else index.astype(int)
+        return _integer(index, "An index")
+
+    @staticmethod
+    def power(base: Any, exponent: Any) -> Any:
+        # Refuse integer powers whose exact result would be enormous, e.g. 9**9**9
+        if isinstance(base, int) and isinstance(exponent, int) and exponent > 0 and abs(base) > 1:
+            if exponent * math.log10(abs(base)) > MAX_INTEGER_DIGITS:
+                raise ValueError(f"The result of {base}**{exponent} has more than {MAX_INTEGER_DIGITS} digits.")
+        return _check_integer(base ** exponent)
+
+def _output(value: Any) -> Any:
+    """Convert a result to plain JSON-compatible values. Exact decimals become strings so no digits are lost."""
+    if isinstance(value, np.ndarray):
+        return [_output(v) for v in value.tolist()] if value.dtype != object else [_output(v) for v in value]
+    if isinstance(value, list):
+        return [_output(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, Decimal):
+        text = str(value)
+        return format(value, "f") if "E" in text and value.is_finite() and abs(value.adjusted()) < 40 else text
+    return value
+
+def _evaluate(evaluator: _Evaluator, expression: Any) -> Any:
+    if not isinstance(expression, str):
+        return evaluator.number(expression)
+    if len(expression) > MAX_EXPRESSION_LENGTH:
+        raise ValueError(f"Expressions are limited to {MAX_EXPRESSION_LENGTH} characters.")
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid expression {expression!r}: {e.msg}")
+    try:
+        return evaluator.visit(tree)
+    except ValueError as e:
+        raise ValueError(f"Could not evaluate {expression!r}: {e}")
+    except (ArithmeticError, TypeError, IndexError) as e:
+        if isinstance(e, ZeroDivisionError):
+            message = "division by zero"
+        elif isinstance(e, (OverflowError, decimal.Overflow)):
+            message = "the result is too large"
+        elif isinstance(e, decimal.InvalidOperation):
+            message = "the operation is undefined for these values"
+        else:
+            message = str(e)
+        raise ValueError(f"Could not evaluate {expression!r}: {message}")
+    except RecursionError:
+        raise ValueError(f"Could not evaluate {expression!r}: the expression is nested too deeply")
 
 class CalculatorTools:
     @staticmethod
@@ -65,15 +419,93 @@ class CalculatorTools:
         elif operation == 'factorial':
             if len(args) != 1 or args[0] < 0 or not isinstance(args[0], int):
                 raise ValueError("Factorial operation requires exactly one non-negative integer.")
-            result = 1
-            for i in range(1, args[0] + 1):
-                result *= i
+            result = math.factorial(args[0])
         else:
             raise ValueError("Invalid operation. Choose 'add', 'subtract', 'multiply', 'divide', 'exponent', 'root', 'modulo', or 'factorial'.")
 
         # Convert the result to a string before returning
         return str(result)
 
+    @staticmethod
+    def evaluate(expressions: Union[str, List[str], Dict[str, Any]], variables: Optional[Dict[str, Any]] = None,
+                 exact: bool = False, precision: int = 28) -> Any:
+        """
+        Safely evaluate math expressions over numbers and vectors, so many calculations take a single call.
+
+        Expressions use Python syntax: + - * / // % **, comparisons, [lists] as vectors, indexing and
+        slicing (x[0], x[-3:], x[x > 0]), and these functions: sum, mean, median, min, max, prod, count,
+        var, std (sample), percentile(x, q), weighted_mean(x, w), pct_change (period-over-period growth rates),
+        growth (first to last), cagr(x, periods), cumsum, diff, sort, where(condition, a, b), abs, round(x, digits),
+        floor, ceil, sqrt, exp, log(x, base), ln, log10, sin, cos, tan and factorial. Arithmetic on vectors is
+        element-wise. Nothing is passed to eval; anything else is rejected.
+
+        Args:
+            expressions (Union[str, List[str], Dict[str, Any]]): One expression, a list of expressions, or a dict of
+                named expressions evaluated in order, where each one can use the names defined before it.
+            variables (Dict[str, Any], optional): Numbers or lists of numbers available by name in the expressions.
+            exact (bool, optional): Compute with exact decimals instead of floats, e.g. for money. Results are returned
+                as strings and rounding with round() is half up. Defaults to False.
+            precision (int, optional): Significant digits for exact mode, at most 1000. Defaults to 28.
+
+        Returns:
+            Any: The result of each expression, with the same shape as `expressions`. Vectors are returned as lists.
+
+        Raises:
+            ValueError: If an expression is invalid, uses something that is not allowed, or cannot be computed.
+
+        Example:
+            evaluate({"revenue": "[120.5, 98.25, 143.0]", "total": "sum(revenue)", "growth": "pct_change(revenue)"})
+        """
+        if not 1 <= precision <= MAX_PRECISION:
+            raise ValueError(f"The precision must be between 1 and {MAX_PRECISION}.")
+        evaluator = _Evaluator({}, exact)
+        context = decimal.Context(prec=precision, traps=[decimal.InvalidOperation, decimal.DivisionByZero, decimal.Overflow])
+
+        with decimal.localcontext(context), np.errstate(divide="raise", invalid="raise", over="raise"):
+            for name, value in (variables or {}).items():
+                if not name.isidentifier():
+                    raise ValueError(f"Invalid variable name: {name}")
+                evaluator.names[name] = evaluator.number(value)
+
+            if isinstance(expressions, dict):
+                results = {}
+                for name, expression in expressions.items():
+                    if not name.isidentifier():
+                        raise ValueError(f"Invalid result name: {name}")
+                    results[name] = evaluator.names[name] = _evaluate(evaluator, expression)
+                return {name: _output(value) for name, value in results.items()}
+            if isinstance(expressions, str):
+                return _output(_evaluate(evaluator, expressions))
+            return [_output(_evaluate(evaluator, expression)) for expression in expressions]
+
+    @staticmethod
+    def describe_series(values: List[Union[float, str]], percentiles: Optional[List[float]] = None, exact: bool = False) -> Dict[str, Any]:
+        """
+        Compute summary statistics of a series in one call.
+
+        Args:
+            values (List[Union[float, str]]): The series, in time order for the growth figures.
+            percentiles (List[float], optional): Percentiles to include, between 0 and 100. Defaults to [25, 50, 75].
+            exact (bool, optional): Compute with exact decimals, e.g. for money. Defaults to False.
+
+        Returns:
+            Dict[str, Any]: 'count', 'sum', 'mean', 'min', 'max' and a 'p{q}' entry per percentile; with two or more
+                values also 'std', and when the first value is positive, 'growth' and 'cagr' from first to last value.
+        """
+        expressions = {"count": "count(x)", "sum": "sum(x)", "mean": "mean(x)", "min": "min(x)", "max": "max(x)"}
+        expressions.update({f"p{q:g}": f"percentile(x, {q!r})" for q in (percentiles or [25, 50, 75])})
+        if len(values) >= 2:
+            expressions["std"] = "std(x)"
+        summary = CalculatorTools.evaluate(expressions, variables={"x": values}, exact=exact)
+
+        if len(values) >= 2 and float(values[0]) > 0:
+            try:
+                summary.update(CalculatorTools.evaluate({"growth": "growth(x)", "cagr": "cagr(x)"}, variables={"x": values}, exact=exact))
+            except ValueError:
+                # e.g. a negative last value, which has no real compound growth rate
+                pass
+        return summary
+
     @staticmethod
     def get_current_time() -> str:
         """
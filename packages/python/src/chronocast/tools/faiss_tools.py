@@ -1,7 +1,7 @@
 import os
 import json
 import numpy as np
-from typing import Tuple, Any
+from typing import Tuple, Any, Optional
 
 class FAISSTools:
     def __init__(self, dimension: int, metric: str = "IP"):
@@ -101,13 +101,14 @@ class FAISSTools:
         
         self.index.add(vectors)
 
-    def search_vectors(self, query_vectors: np.ndarray, top_k: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+    def search_vectors(self, query_vectors: np.ndarray, top_k: int = 10, filter_ids: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Search for similar vectors in the FAISS index.
 
         Args:
             query_vectors (np.ndarray): Array of query vectors.
             top_k (int, optional): Number of results to return for each query vector. Defaults to 10.
+            filter_ids (np.ndarray, optional): If given, only vectors with these IDs are searched. Defaults to None.
 
         Returns:
             Tuple[np.ndarray, np.ndarray]: A tuple containing the distances and indices of the top-k results.
@@ -122,7 +123,12 @@ class FAISSTools:
             # Normalize query vectors for Inner Product similarity
             query_vectors = np.apply_along_axis(self.normalize_vector, 1, query_vectors)
         
-        distances, indices = self.index.search(query_vectors, top_k)
+        if filter_ids is not None:
+            selector = self.faiss.IDSelectorBatch(np.asarray(filter_ids, dtype=np.int64))
+            params = self.faiss.SearchParameters(sel=selector)
+            distances, indices = self.index.search(query_vectors, top_k, params=params)
+        else:
+            distances, indices = self.index.search(query_vectors, top_k)
         return distances, indices
 
     def remove_vectors(self, ids: np.ndarray) -> None:
@@ -1,13 +1,403 @@
 import os
 import csv
 import json
+import mmap
+import bisect
+import hashlib
+import threading
+import uuid
+import operator
+from collections import OrderedDict
 import xml.etree.ElementTree as ET
-from typing import Any, List, Dict, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Dict, Iterator, Optional, Sequence, Union
+import numpy as np
 import yaml
 
 debug_mode = False
 
+DEFAULT_IGNORE_LIST = {".DS_Store", ".gitignore", ".env", "node_modules", "__pycache__"}
+BINARY_SNIFF_BYTES = 8192
+# Bytes that occur in text; anything else in a file's first block counts towards it being binary
+TEXT_BYTES = bytes({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f})
+JSON_BLOCK_SIZE = 1024 * 1024
+COMPARISONS = {"==": operator.eq, "!=": operator.ne, "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge}
+
+class _OffsetLines:
+    """Line iterator over a binary file that tracks the byte offset of the next line, for csv.reader."""
+
+    def __init__(self, file, offset: int = 0):
+        self.file = file
+        self.offset = offset
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        line = self.file.readline()
+        if not line:
+            raise StopIteration
+        self.offset += len(line)
+        return line.decode("utf-8")
+
+class MappedLineIndex:
+    def __init__(self, file_path: str, chunk_size: int = 64 * 1024 * 1024):
+        """
+        Memory-mapped index of the line start offsets of a file, for random access to lines of large files.
+
+        Args:
+            file_path (str): The path to the file.
+            chunk_size (int, optional): Bytes scanned for line breaks per step while indexing. Defaults to 64 MiB.
+        """
+        self.file_path = file_path
+        stat = os.stat(file_path)
+        self.signature = (stat.st_mtime_ns, stat.st_size)
+        self._file = open(file_path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if stat.st_size else b""
+        except (OSError, ValueError):
+            self._file.close()
+            raise
+
+        breaks = [np.zeros(1, dtype=np.int64)]
+        for start in range(0, stat.st_size, chunk_size):
+            chunk = np.frombuffer(self._map, dtype=np.uint8, count=min(chunk_size, stat.st_size - start), offset=start)
+            breaks.append(np.flatnonzero(chunk == 10).astype(np.int64) + start + 1)
+        starts = np.concatenate(breaks)
+        # A trailing newline does not start another line
+        self.offsets = starts[:-1] if len(starts) > 1 and starts[-1] == stat.st_size else starts
+        if stat.st_size == 0:
+            self.offsets = starts[:0]
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def lines(self, start: int = 0, count: int = 1) -> List[str]:
+        """
+        Read consecutive lines without their line endings.
+
+        Args:
+            start (int, optional): Index of the first line (0-based). Defaults to 0.
+            count (int, optional): Number of lines to read. Defaults to 1.
+
+        Returns:
+            List[str]: The lines, decoded as UTF-8 with invalid bytes replaced.
+        """
+        stop = min(start + count, len(self.offsets))
+        if start >= stop:
+            return []
+        end = int(self.offsets[stop]) if stop < len(self.offsets) else len(self._map)
+        data = bytes(self._map[int(self.offsets[start]):end])
+        return data.decode("utf-8", errors="replace").splitlines()
+
+    def close(self) -> None:
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+class CSVColumnIndex:
+    def __init__(self, file_path: str, column: str, signature: tuple, rows: Dict[str, List[int]]):
+        """
+        Index of one CSV column mapping each value to the byte offsets of the rows holding it.
+
+        Equality lookups go through the value map; range lookups bisect sorted copies of the values,
+        compared as numbers where the bounds are numeric and as strings otherwise. Build one with build().
+        """
+        self.file_path = file_path
+        self.column = column
+        self.signature = signature
+        self.rows = rows
+        self._numeric: Optional[tuple] = None
+        self._strings: Optional[List[str]] = None
+
+    @staticmethod
+    def sidecar_path(file_path: str, column: str) -> str:
+        digest = hashlib.sha1(column.encode("utf-8")).hexdigest()[:12]
+        return f"{file_path}.index-{digest}.json"
+
+    @classmethod
+    def build(cls, file_path: str, column: str) -> "CSVColumnIndex":
+        """
+        Load the persisted index of a column, or build it with one pass over the file and persist it next to the file.
+
+        Raises:
+            KeyError: If the column doesn't exist in the CSV.
+        """
+        stat = os.stat(file_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        sidecar = cls.sidecar_path(file_path, column)
+        try:
+            with open(sidecar, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            if stored["column"] == column and tuple(stored["signature"]) == signature:
+                return cls(file_path, column, signature, stored["rows"])
+        except (OSError, ValueError, KeyError):
+            pass
+
+        rows: Dict[str, List[int]] = {}
+        with open(file_path, "rb") as f:
+            lines = _OffsetLines(f)
+            reader = csv.reader(lines)
+            header = next(reader, [])
+            if column not in header:
+                raise KeyError(f"Column '{column}' not found in the CSV file.")
+            position = header.index(column)
+            while True:
+                offset = lines.offset
+                row = next(reader, None)
+                if row is None:
+                    break
+                if position < len(row):
+                    rows.setdefault(row[position], []).append(offset)
+
+        try:
+            with open(sidecar, "w", encoding="utf-8") as f:
+                json.dump({"column": column, "signature": signature, "rows": rows}, f)
+        except OSError as e:
+            print(f"Could not persist CSV index {sidecar}: {e}")
+        return cls(file_path, column, signature, rows)
+
+    def equal(self, value: Any) -> List[int]:
+        return self.rows.get(str(value), [])
+
+    def between(self, min_value: Any = None, max_value: Any = None) -> List[int]:
+        """Offsets of rows whose value lies within the inclusive bounds; a bound of None is open."""
+        bounds = [bound for bound in (min_value, max_value) if bound is not None]
+        if all(isinstance(bound, (int, float)) for bound in bounds):
+            if self._numeric is None:
+                numeric = []
+                for value in self.rows:
+                    try:
+                        numeric.append((float(value), value))
+                    except ValueError:
+                        continue
+                numeric.sort()
+                self._numeric = ([key for key, _ in numeric], [value for _, value in numeric])
+            keys, values = self._numeric
+        else:
+            if self._strings is None:
+                self._strings = sorted(self.rows)
+            keys = values = self._strings
+            min_value = None if min_value is None else str(min_value)
+            max_value = None if max_value is None else str(max_value)
+
+        lo = 0 if min_value is None else bisect.bisect_left(keys, min_value)
+        hi = len(keys) if max_value is None else bisect.bisect_right(keys, max_value)
+        return [offset for value in values[lo:hi] for offset in self.rows[value]]
+
+    def read_rows(self, offsets: List[int]) -> List[Dict[str, Any]]:
+        """Read the rows starting at the given byte offsets, in file order."""
+        results = []
+        with open(self.file_path, "rb") as f:
+            header = next(csv.reader(_OffsetLines(f)), [])
+            for offset in sorted(offsets):
+                f.seek(offset)
+                row = next(csv.reader(_OffsetLines(f, offset)), None)
+                if row is not None:
+                    results.append(dict(zip(header, row)))
+        return results
+
+
+class ColumnarTable:
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        """
+        In-memory table stored as one NumPy array per column, with vectorized filter, project,
+        group-by and aggregate operations. Columns whose values all parse as numbers are numeric;
+        the others, and codes with leading zeros such as ZIP codes, hold strings.
+
+        Args:
+            columns (Dict[str, np.ndarray]): Equal-length arrays keyed by column name, in column order.
+        """
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+        self.columns = columns
+        self.num_rows = lengths.pop() if lengths else 0
+
+    @staticmethod
+    def _to_array(values: Sequence[Any]) -> np.ndarray:
+        if isinstance(values, np.ndarray) and values.dtype.kind == "U" or all(isinstance(value, str) for value in values):
+            strings = np.asarray(values, dtype=np.str_)
+        else:
+            strings = np.asarray(["" if value is None else str(value) for value in values], dtype=np.str_)
+        # Identifiers such as "00123" would lose their leading zeros as numbers
+        prefixes = np.char.lstrip(np.char.strip(strings), "+-").astype("U2")
+        if np.isin(prefixes, [f"0{digit}" for digit in range(10)]).any():
+            return strings
+        for dtype in (np.int64, np.float64):
+            try:
+                return strings.astype(dtype)
+            except (ValueError, OverflowError):
+                continue
+        # Numeric columns with missing values become floats with NaN
+        missing = np.char.strip(strings) == ""
+        if missing.any() and not missing.all():
+            try:
+                numbers = np.full(len(strings), np.nan)
+                numbers[~missing] = strings[~missing].astype(np.float64)
+                return numbers
+            except ValueError:
+                pass
+        return strings
+
+    @classmethod
+    def from_rows(cls, header: List[str], rows: List[List[Any]]) -> "ColumnarTable":
+        """Build a table from a header and row lists; short rows are padded with empty values."""
+        width = len(header)
+        if any(len(row) != width for row in rows):
+            rows = [list(row[:width]) + [""] * (width - len(row)) for row in rows]
+        values = list(zip(*rows)) if rows else [() for _ in header]
+        return cls({name: cls._to_array(column) for name, column in zip(header, values)})
+
+    @classmethod
+    def from_csv(cls, file_path: str, columns: Optional[List[str]] = None) -> "ColumnarTable":
+        """
+        Load a CSV file, keeping only the given columns. pyarrow's multithreaded CSV reader is used when installed.
+
+        Raises:
+            KeyError: If one of the requested columns doesn't exist in the CSV.
+        """
+        try:
+            from pyarrow import csv as pa_csv
+            import pyarrow as pa
+            import pyarrow.compute as pc
+        except ImportError:
+            pa_csv = None
+
+        if pa_csv is None:
+            with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
+                reader = csv.reader(csvfile)
+                header = next(reader, [])
+                selected = columns or header
+                missing = [column for column in selected if column not in header]
+                if missing:
+                    raise KeyError(f"Columns not found in the CSV file: {missing}")
+                return cls.from_rows(header, list(reader)).project(selected)
+
+        with open(file_path, 'rb') as csvfile:
+            available = next(csv.reader([csvfile.readline().decode('utf-8')]), [])
+        missing = [column for column in columns or [] if column not in available]
+        if missing:
+            raise KeyError(f"Columns not found in the CSV file: {missing}")
+        # Parse as text and type the columns like the fallback path, so codes such as "00123" stay strings
+        convert_options = pa_csv.ConvertOptions(include_columns=columns,
+                                                column_types={name: pa.string() for name in columns or available})
+        table = pa_csv.read_csv(file_path, convert_options=convert_options)
+        arrays = {}
+        for name, column in zip(table.column_names, table.columns):
+            strings = pc.fill_null(column, "")
+            arrays[name] = cls._to_array(np.asarray(strings.to_numpy(zero_copy_only=False), dtype=np.str_))
+        return cls(arrays)
+
+    def schema(self) -> Dict[str, str]:
+        return {name: ("integer" if values.dtype.kind == "i" else "float" if values.dtype.kind == "f" else "string")
+                for name, values in self.columns.items()}
+
+    def _column(self, name: str) -> np.ndarray:
+        if name not in self.columns:
+            raise KeyError(f"Column '{name}' not found in the table.")
+        return self.columns[name]
+
+    def rows(self, offset: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Rows as dictionaries of Python values."""
+        stop = self.num_rows if limit is None else min(self.num_rows, offset + limit)
+        columns = {name: values[offset:stop].tolist() for name, values in self.columns.items()}
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+    def project(self, columns: List[str]) -> "ColumnarTable":
+        """Table with only the given columns, in the given order. The arrays are shared, not copied."""
+        return ColumnarTable({name: self._column(name) for name in columns})
+
+    def filter(self, conditions: List[List[Any]]) -> "ColumnarTable":
+        """
+        Rows matching all conditions.
+
+        Args:
+            conditions (List[List[Any]]): [column, operator, value] triples. Operators are ==, !=, <, <=, >, >=,
+                "in" (value is a list) and "contains" (substring match on string columns).
+        """
+        mask = np.ones(self.num_rows, dtype=bool)
+        for column, op, value in conditions:
+            values = self._column(column)
+            cast = (lambda v: float(v) if isinstance(v, str) else v) if values.dtype.kind in "if" else str
+            if op == "in":
+                mask &= np.isin(values, [cast(v) for v in value])
+            elif op == "contains":
+                mask &= np.char.find(values.astype(np.str_), str(value)) >= 0
+            elif op in COMPARISONS:
+                mask &= COMPARISONS[op](values, cast(value))
+            else:
+                raise ValueError(f"Unsupported operator: {op}")
+        return ColumnarTable({name: values[mask] for name, values in self.columns.items()})
+
+    def _reduce(self, values: np.ndarray, function: str, inverse: np.ndarray, num_groups: int) -> np.ndarray:
+        # Missing numbers (NaN) are skipped, so count, sum and mean cover the valid values only
+        valid = ~np.isnan(values) if values.dtype.kind == "f" else None
+        if function == "count":
+            return np.bincount(inverse if valid is None else inverse[valid], minlength=num_groups)
+        if values.dtype.kind not in "if":
+            raise ValueError(f"Aggregation '{function}' requires a numeric column")
+        if function in ("sum", "mean"):
+            if valid is None:
+                sums = np.bincount(inverse, weights=values, minlength=num_groups)
+                counts = np.bincount(inverse, minlength=num_groups)
+            else:
+                sums = np.bincount(inverse[valid], weights=values[valid], minlength=num_groups)
+                counts = np.bincount(inverse[valid], minlength=num_groups)
+            if function == "sum":
+                return sums.astype(values.dtype) if values.dtype.kind == "i" else sums
+            with np.errstate(invalid="ignore", divide="ignore"):
+                return sums / counts
+        if function in ("min", "max"):
+            order = np.argsort(inverse, kind="stable")
+            starts = np.flatnonzero(np.r_[True, np.diff(inverse[order]) != 0])
+            # fmin/fmax ignore NaN unless a whole group is missing
+            reducer = np.fmin if function == "min" else np.fmax
+            return reducer.reduceat(values[order], starts)
+        raise ValueError(f"Unsupported aggregation: {function}")
+
+    @staticmethod
+    def _aggregation_items(aggregations: Dict[str, Union[str, List[str]]]) -> List[tuple]:
+        return [(column, function) for column, functions in aggregations.items()
+                for function in ([functions] if isinstance(functions, str) else functions)]
+
+    def group_by(self, by: List[str], aggregations: Dict[str, Union[str, List[str]]]) -> "ColumnarTable":
+        """
+        One row per distinct combination of the `by` columns, with aggregated columns named `{column}_{function}`.
+
+        Args:
+            by (List[str]): Columns to group on.
+            aggregations (Dict[str, Union[str, List[str]]]): Functions per column: count, sum, mean, min or max.
+                Missing numbers are skipped.
+        """
+        codes = np.zeros(self.num_rows, dtype=np.int64)
+        for name in by:
+            uniques, inverse = np.unique(self._column(name), return_inverse=True)
+            # Renumber the combined keys after each column so the codes stay below the row count
+            _, codes = np.unique(codes * len(uniques) + inverse.ravel(), return_inverse=True)
+            codes = codes.ravel()
+        _, first, inverse = np.unique(codes, return_index=True, return_inverse=True)
+        inverse = inverse.ravel()
+
+        result = {name: self.columns[name][first] for name in by}
+        for column, function in self._aggregation_items(aggregations):
+            result[f"{column}_{function}"] = self._reduce(self._column(column), function, inverse, len(first))
+        return ColumnarTable(result)
+
+    def aggregate(self, aggregations: Dict[str, Union[str, List[str]]]) -> Dict[str, Any]:
+        """Aggregate whole columns, returning a value per `{column}_{function}`."""
+        inverse = np.zeros(self.num_rows, dtype=np.int64)
+        return {f"{column}_{function}": (self._reduce(self._column(column), function, inverse, 1)[0].item() if self.num_rows else None)
+                for column, function in self._aggregation_items(aggregations)}
+
 class FileTools:
+    _line_indexes: "OrderedDict[str, MappedLineIndex]" = OrderedDict()
+    max_line_indexes = 16
+    _csv_indexes: Dict[tuple, CSVColumnIndex] = {}
+    _tables: "OrderedDict[str, ColumnarTable]" = OrderedDict()
+    max_tables = 32
+    _index_lock = threading.Lock()
+
     @staticmethod
     def save_code_to_file(code: str, file_path: str):
         """
@@ -39,18 +429,138 @@ class FileTools:
             print(f"Unexpected error at FileTools.save_code_to_file: {str(e)}")
     
     @staticmethod
-    def generate_directory_tree(base_path, additional_ignore=None):
+    def _resolve_base_path(base_path: str) -> str:
+        # Convert both paths to absolute and normalize them
+        abs_base_path = os.path.abspath(os.path.normpath(base_path))
+        abs_cwd = os.path.abspath(os.path.normpath(os.getcwd()))
+
+        # Check if the base_path is within or equal to the current working directory
+        if os.path.commonpath([abs_base_path, abs_cwd]) != abs_cwd:
+            raise ValueError(f"Access to the specified path is not allowed: {abs_base_path}")
+
+        if not os.path.exists(abs_base_path):
+            raise FileNotFoundError(f"The specified path does not exist: {abs_base_path}")
+
+        if not os.path.isdir(abs_base_path):
+            raise NotADirectoryError(f"The specified path is not a directory: {abs_base_path}")
+
+        return abs_base_path
+
+    @staticmethod
+    def _is_binary(path: str) -> bool:
+        """Sniff the first block of a file: NUL bytes or a high share of control bytes mark it as binary."""
+        with open(path, "rb") as file:
+            chunk = file.read(BINARY_SNIFF_BYTES)
+        if not chunk:
+            return False
+        if b"\0" in chunk:
+            return True
+        return len(chunk.translate(None, TEXT_BYTES)) / len(chunk) > 0.3
+
+    @staticmethod
+    def _scan_one(directory: str, relative: str, depth: int, ignore_list: set, detect_binary: bool) -> List[Dict[str, Any]]:
+        entries = []
+        try:
+            with os.scandir(directory) as iterator:
+                items = sorted(iterator, key=lambda item: item.name)
+        except PermissionError:
+            # Reported again under the directory's own path, flagged with the error
+            return [{"name": os.path.basename(directory), "path": relative, "type": "directory",
+                     "depth": depth - 1, "error": "Permission denied"}]
+
+        for item in items:
+            if item.name in ignore_list or item.name.startswith('.'):
+                continue  # Skip ignored and hidden files/directories
+
+            path = f"{relative}/{item.name}" if relative else item.name
+            try:
+                # Symlinked directories are listed as files so the scan cannot loop
+                if item.is_dir(follow_symlinks=False):
+                    entries.append({"name": item.name, "path": path, "type": "directory", "depth": depth})
+                    continue
+                entry = {"name": item.name, "path": path, "type": "file", "depth": depth, "size": item.stat().st_size}
+                if detect_binary:
+                    entry["binary"] = FileTools._is_binary(item.path)
+            except OSError as e:
+                entry = {"name": item.name, "path": path, "type": "file", "depth": depth, "error": str(e)}
+            entries.append(entry)
+        return entries
+
+    @staticmethod
+    def scan_directory(base_path: str, additional_ignore: Optional[List[str]] = None, max_depth: Optional[int] = None,
+                       max_entries: Optional[int] = None, detect_binary: bool = True, parallel: bool = False,
+                       max_workers: int = 8) -> Iterator[Dict[str, Any]]:
         """
-        Recursively generate a file structure dictionary for the given base path.
+        Stream the entries below a directory, breadth first, without reading file contents.
+
+        Args:
+            base_path (str): The root directory to scan. Must be within the current working directory.
+            additional_ignore (List[str], optional): Additional files or directories to ignore.
+            max_depth (int, optional): Deepest level to descend to; entries directly in base_path are at depth 1. Defaults to no limit.
+            max_entries (int, optional): Stop after yielding this many entries. Defaults to no limit.
+            detect_binary (bool, optional): Sniff the first block of each file to flag binaries. Defaults to True.
+            parallel (bool, optional): Scan the directories of each level concurrently, for large trees. Defaults to False.
+            max_workers (int, optional): Number of scanning threads in parallel mode. Defaults to 8.
+
+        Yields:
+            Dict[str, Any]: One entry per file or directory with 'name', 'path' (relative to base_path), 'type' and 'depth' keys.
+                Files also carry 'size' and, when detect_binary is set, 'binary'. Unreadable entries carry 'error'.
+
+        Raises:
+            ValueError: If the specified path is not within the current working directory.
+            FileNotFoundError: If the specified path does not exist.
+            NotADirectoryError: If the specified path is not a directory.
+        """
+        ignore_list = DEFAULT_IGNORE_LIST.union(additional_ignore or [])
+        abs_base_path = FileTools._resolve_base_path(base_path)
+
+        count = 0
+        level = [(abs_base_path, "")]
+        depth = 1
+        executor = ThreadPoolExecutor(max_workers=max_workers) if parallel else None
+        try:
+            while level and (max_depth is None or depth <= max_depth):
+                scan = lambda item: FileTools._scan_one(item[0], item[1], depth, ignore_list, detect_binary)
+                results = executor.map(scan, level) if executor else map(scan, level)
+                next_level = []
+                for entries in results:
+                    for entry in entries:
+                        if max_entries is not None and count >= max_entries:
+                            return
+                        count += 1
+                        yield entry
+                        if entry["type"] == "directory" and "error" not in entry:
+                            next_level.append((os.path.join(abs_base_path, entry["path"]), entry["path"]))
+                level = next_level
+                depth += 1
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def generate_directory_tree(base_path, additional_ignore=None, max_depth: Optional[int] = None,
+                                max_entries: Optional[int] = 2000, include_contents: bool = False,
+                                max_file_size: int = 100_000, parallel: bool = False):
+        """
+        Generate a file structure dictionary for the given base path.
+
+        Only metadata is collected by default; fetch the contents of individual files with
+        read_tree_file() using the 'path' of their entry.
 
         Args:
             base_path (str): The root directory path to start the file structure generation.
             additional_ignore (List[str], optional): Additional files or directories to ignore.
+            max_depth (int, optional): Deepest level to descend to. Defaults to no limit.
+            max_entries (int, optional): Maximum number of files and directories to include. Defaults to 2000.
+            include_contents (bool, optional): Inline the contents of text files up to max_file_size bytes. Defaults to False.
+            max_file_size (int, optional): Largest file, in bytes, whose contents are inlined. Defaults to 100,000.
+            parallel (bool, optional): Scan directories concurrently, for large trees. Defaults to False.
 
         Returns:
             dict: A nested dictionary representing the file structure, where each directory
-                is represented by a dict with 'name', 'type', and 'children' keys, and each
-                file is represented by a dict with 'name', 'type', and 'contents' keys.
+                is represented by a dict with 'name', 'type', 'path' and 'children' keys, and each
+                file by a dict with 'name', 'type', 'path', 'size' and 'binary' keys, plus 'contents'
+                when include_contents is set. The root has 'truncated' set to True if max_entries was reached.
 
         Raises:
             ValueError: If the specified path is not within the current working directory.
@@ -58,100 +568,63 @@ class FileTools:
             FileNotFoundError: If the specified path does not exist.
             OSError: If there's an error accessing the directory or its contents.
         """
-        default_ignore_list = {".DS_Store", ".gitignore", ".env", "node_modules", "__pycache__"}
-        
-        if additional_ignore:
-            ignore_list = default_ignore_list.union(set(additional_ignore))
-        else:
-            ignore_list = default_ignore_list
+        abs_base_path = FileTools._resolve_base_path(base_path)
+        file_structure = {
+            "name": os.path.basename(abs_base_path),
+            "type": "directory",
+            "path": "",
+            "children": [],
+            "truncated": False
+        }
+        directories = {"": file_structure}
 
-        #print(f"Starting file structure generation for path: {base_path}")
-        #print(f"Ignore list: {ignore_list}")
-        
-        try:
-            # Convert both paths to absolute and normalize them
-            abs_base_path = os.path.abspath(os.path.normpath(base_path))
-            abs_cwd = os.path.abspath(os.path.normpath(os.getcwd()))
+        limit = None if max_entries is None else max_entries + 1
+        for count, entry in enumerate(FileTools.scan_directory(abs_base_path, additional_ignore, max_depth, limit, parallel=parallel), start=1):
+            if max_entries is not None and count > max_entries:
+                file_structure["truncated"] = True
+                break
 
-            # Check if the base_path is within or equal to the current working directory
-            if not abs_base_path.startswith(abs_cwd):
-                raise ValueError(f"Access to the specified path is not allowed: {abs_base_path}")
-            
-            if not os.path.exists(abs_base_path):
-                raise FileNotFoundError(f"The specified path does not exist: {abs_base_path}")
-            
-            if not os.path.isdir(abs_base_path):
-                raise NotADirectoryError(f"The specified path is not a directory: {abs_base_path}")
-            
-            file_structure = {
-                "name": os.path.basename(abs_base_path),
-                "type": "directory",
-                "children": []
-            }
-
-            for item in os.listdir(abs_base_path):
-                if item in ignore_list or item.startswith('.'):
-                    print(f"Skipping ignored or hidden item: {item}")
-                    continue  # Skip ignored and hidden files/directories
-                
-                item_path = os.path.join(abs_base_path, item)
-                print(f"Processing item: {item_path}")
-                
-                if os.path.isdir(item_path):
-                    try:
-                        file_structure["children"].append(FileTools.generate_directory_tree(item_path))
-                    except PermissionError:
-                        print(f"Permission denied for directory: {item_path}")
-                        file_structure["children"].append({
-                            "name": item,
-                            "type": "directory",
-                            "error": "Permission denied"
-                        })
-                else:
-                    try:
-                        with open(item_path, "r", encoding="utf-8") as file:
-                            file_contents = file.read()
-                            #print(f"Successfully read file contents: {item_path}")
-                    except UnicodeDecodeError:
-                        print(f"UTF-8 decoding failed for {item_path}, attempting ISO-8859-1")
-                        try:
-                            with open(item_path, "r", encoding="iso-8859-1") as file:
-                                file_contents = file.read()
-                                #print(f"Successfully read file contents with ISO-8859-1: {item_path}")
-                        except Exception as e:
-                            print(f"Failed to read file: {item_path}, Error: {str(e)}")
-                            file_contents = f"Error reading file: {str(e)}"
-                    except PermissionError:
-                        print(f"Permission denied for file: {item_path}")
-                        file_contents = "Permission denied"
-                    except Exception as e:
-                        print(f"Unexpected error reading file: {item_path}, Error: {str(e)}")
-                        file_contents = f"Unexpected error: {str(e)}"
-                    
-                    file_structure["children"].append({
-                        "name": item,
-                        "type": "file",
-                        "contents": file_contents
-                    })
-
-            print(f"Completed file structure generation for path: {abs_base_path}")
-            return file_structure
-
-        except PermissionError as e:
-            print(f"Permission error accessing directory or its contents: {str(e)}")
-            raise
-        except FileNotFoundError as e:
-            print(f"File or directory not found: {str(e)}")
-            raise
-        except NotADirectoryError as e:
-            print(f"Not a directory error: {str(e)}")
-            raise
-        except OSError as e:
-            print(f"OS error accessing directory or its contents: {str(e)}")
-            raise
-        except Exception as e:
-            print(f"Unexpected error in generate_directory_tree: {str(e)}")
-            raise  
+            node = {key: value for key, value in entry.items() if key != "depth"}
+            if node["path"] in directories:
+                # A directory that was listed but could not be opened
+                directories[node["path"]]["error"] = node["error"]
+                continue
+            if node["type"] == "directory" and "error" not in node:
+                node["children"] = []
+                directories[node["path"]] = node
+            elif include_contents and not node.get("binary") and node.get("size", max_file_size + 1) <= max_file_size:
+                node["contents"] = FileTools.read_tree_file(abs_base_path, node["path"], max_file_size)
+            directories[os.path.dirname(node["path"]).replace(os.sep, "/")]["children"].append(node)
+
+        return file_structure
+
+    @staticmethod
+    def read_tree_file(base_path: str, path: str, max_bytes: int = 1_000_000) -> str:
+        """
+        Read one file from a tree returned by generate_directory_tree() or scan_directory().
+
+        Args:
+            base_path (str): The root directory the tree was generated for.
+            path (str): The 'path' of the file entry, relative to base_path.
+            max_bytes (int, optional): Maximum number of bytes to read. Defaults to 1,000,000.
+
+        Returns:
+            str: The file contents, decoded as UTF-8 with invalid bytes replaced. Longer files are cut off after max_bytes.
+
+        Raises:
+            ValueError: If the path is outside base_path or the file is binary.
+            FileNotFoundError: If the file does not exist.
+        """
+        abs_base_path = FileTools._resolve_base_path(base_path)
+        full_path = os.path.abspath(os.path.join(abs_base_path, path))
+        if os.path.commonpath([full_path, abs_base_path]) != abs_base_path:
+            raise ValueError(f"Access to the specified path is not allowed: {full_path}")
+        if FileTools._is_binary(full_path):
+            raise ValueError(f"Refusing to read binary file: {path}")
+
+        with open(full_path, "rb") as file:
+            data = file.read(max_bytes)
+        return data.decode("utf-8", errors="replace")
 
     @staticmethod
     def read_file_contents(full_file_path):
@@ -300,6 +773,164 @@ class FileTools:
             print(f"Error parsing YAML file: {e}")
             return (f"Error parsing YAML file: {e}")
 
+    @staticmethod
+    def iter_csv(file_path: str, columns: Optional[List[str]] = None, chunk_size: int = 10000) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream a CSV file in chunks of rows, so files larger than memory can be processed.
+
+        Args:
+            file_path (str): The path to the CSV file.
+            columns (List[str], optional): Columns to keep in each row. Defaults to all columns.
+            chunk_size (int, optional): Number of rows per chunk. Defaults to 10,000.
+
+        Yields:
+            List[Dict[str, Any]]: Consecutive chunks of rows as dictionaries.
+
+        Raises:
+            FileNotFoundError: If the specified file is not found.
+            KeyError: If one of the requested columns doesn't exist in the CSV.
+        """
+        with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, [])
+            selected = columns or header
+            missing = [column for column in selected if column not in header]
+            if missing:
+                raise KeyError(f"Columns not found in the CSV file: {missing}")
+            positions = [header.index(column) for column in selected]
+
+            chunk = []
+            for row in reader:
+                chunk.append({column: row[position] if position < len(row) else None
+                              for column, position in zip(selected, positions)})
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+
+    @staticmethod
+    def iter_json(file_path: str, prefix: str = "item") -> Iterator[Any]:
+        """
+        Stream the items of a large JSON file one at a time instead of loading the whole document.
+
+        JSON Lines files (.jsonl, .ndjson) yield one item per line. Otherwise items are taken from the
+        given ijson prefix; "item" selects the elements of a top-level array, which is supported without
+        ijson installed.
+
+        Args:
+            file_path (str): The path to the JSON file.
+            prefix (str, optional): ijson prefix of the items to yield, e.g. "item" or "results.item". Defaults to "item".
+
+        Yields:
+            Any: The parsed items.
+
+        Raises:
+            FileNotFoundError: If the specified file is not found.
+            json.JSONDecodeError: If there's an error parsing the JSON file.
+            ImportError: If a prefix other than "item" is used without ijson installed.
+        """
+        if file_path.endswith((".jsonl", ".ndjson")):
+            with open(file_path, 'r', encoding='utf-8') as jsonfile:
+                for line in jsonfile:
+                    if line.strip():
+                        yield json.loads(line)
+            return
+
+        try:
+            import ijson
+        except ImportError:
+            ijson = None
+        if ijson is not None:
+            with open(file_path, 'rb') as jsonfile:
+                yield from ijson.items(jsonfile, prefix)
+            return
+        if prefix != "item":
+            raise ImportError("ijson is required to stream JSON prefixes other than 'item'. Install with `pip install ijson`")
+
+        decoder = json.JSONDecoder()
+        with open(file_path, 'r', encoding='utf-8') as jsonfile:
+            buffer = ""
+            position = 0
+            started = False
+            while True:
+                # Skip whitespace, the opening bracket and separators
+                while position < len(buffer) and (buffer[position].isspace() or buffer[position] == ","
+                                                  or (not started and buffer[position] == "[")):
+                    started = started or buffer[position] == "["
+                    position += 1
+                if position < len(buffer) and buffer[position] == "]":
+                    return
+                if position < len(buffer) and not started:
+                    raise json.JSONDecodeError("Expected a top-level array", buffer, position)
+                try:
+                    item, end = decoder.raw_decode(buffer, position)
+                    # A number at the end of the buffer may continue in the next block
+                    if end < len(buffer):
+                        yield item
+                        position = end
+                        continue
+                except json.JSONDecodeError:
+                    pass
+                block = jsonfile.read(JSON_BLOCK_SIZE)
+                if not block:
+                    if position < len(buffer):
+                        item, position = decoder.raw_decode(buffer, position)
+                        yield item
+                        continue
+                    raise json.JSONDecodeError("Unterminated array", buffer, position)
+                buffer = buffer[position:] + block
+                position = 0
+
+    @staticmethod
+    def read_lines(file_path: str, start: int = 0, count: int = 100) -> Union[List[str], str]:
+        """
+        Read a range of lines from a large file through a memory-mapped line index.
+
+        The index is built once per file and reused until the file changes, so any range of lines
+        is read without scanning the lines before it. The indexes of the most recently read
+        FileTools.max_line_indexes files are kept open; older ones are closed.
+
+        Args:
+            file_path (str): The path to the file.
+            start (int, optional): Index of the first line (0-based). Defaults to 0.
+            count (int, optional): Number of lines to read. Defaults to 100.
+
+        Returns:
+            Union[List[str], str]: The lines without line endings, or an error message as a string.
+        """
+        try:
+            abs_path = os.path.abspath(file_path)
+            stat = os.stat(abs_path)
+            with FileTools._index_lock:
+                index = FileTools._line_indexes.get(abs_path)
+                if index is None or index.signature != (stat.st_mtime_ns, stat.st_size):
+                    if index is not None:
+                        FileTools._line_indexes.pop(abs_path).close()
+                    index = MappedLineIndex(abs_path)
+                    FileTools._line_indexes[abs_path] = index
+                    while len(FileTools._line_indexes) > FileTools.max_line_indexes:
+                        FileTools._line_indexes.popitem(last=False)[1].close()
+                FileTools._line_indexes.move_to_end(abs_path)
+                return index.lines(start, count)
+        except FileNotFoundError:
+            FileTools._drop_line_index(os.path.abspath(file_path))
+            error_msg = f"Error: File not found at {file_path}"
+            print(error_msg)
+            return error_msg
+        except OSError as e:
+            FileTools._drop_line_index(os.path.abspath(file_path))
+            error_msg = f"Error: Could not read lines from {file_path}: {e}"
+            print(error_msg)
+            return error_msg
+
+    @staticmethod
+    def _drop_line_index(abs_path: str) -> None:
+        with FileTools._index_lock:
+            index = FileTools._line_indexes.pop(abs_path, None)
+        if index is not None:
+            index.close()
+
     @staticmethod
     def search_csv(file_path: str, search_column: str, search_value: Any) -> List[Dict[str, Any]]:
         """
@@ -334,6 +965,53 @@ class FileTools:
             print(f"Error: {e}")
             return (f"Error: {e}")
 
+    @staticmethod
+    def search_csv_indexed(file_path: str, search_column: str, search_value: Any = None,
+                           min_value: Any = None, max_value: Any = None) -> List[Dict[str, Any]]:
+        """
+        Search a CSV file through a persisted column index, for repeated lookups in large files.
+
+        The first search on a column scans the file once and stores an index next to it
+        (`{file_path}.index-<hash>.json`); later searches, also from other processes, reuse it
+        until the file changes. Equality lookups take constant time and range lookups are
+        binary searches, and only the matching rows are read from the file.
+
+        Args:
+            file_path (str): The path to the CSV file.
+            search_column (str): The name of the column to search in.
+            search_value (Any, optional): The value to match exactly.
+            min_value (Any, optional): Inclusive lower bound, used when search_value is not given. Numbers compare numerically.
+            max_value (Any, optional): Inclusive upper bound, used when search_value is not given.
+
+        Returns:
+            List[Dict[str, Any]]: A list of dictionaries representing matching rows, in file order.
+
+        Raises:
+            FileNotFoundError: If the specified file is not found.
+            KeyError: If the specified search column doesn't exist in the CSV.
+        """
+        try:
+            abs_path = os.path.abspath(file_path)
+            stat = os.stat(abs_path)
+            key = (abs_path, search_column)
+            with FileTools._index_lock:
+                index = FileTools._csv_indexes.get(key)
+                if index is None or index.signature != (stat.st_mtime_ns, stat.st_size):
+                    index = CSVColumnIndex.build(abs_path, search_column)
+                    FileTools._csv_indexes[key] = index
+
+            if search_value is not None:
+                offsets = index.equal(search_value)
+            else:
+                offsets = index.between(min_value, max_value)
+            return index.read_rows(offsets)
+        except FileNotFoundError:
+            print(f"Error: CSV file not found at {file_path}")
+            return (f"Error: CSV file not found at {file_path}")
+        except KeyError as e:
+            print(f"Error: {e}")
+            return (f"Error: {e}")
+
     @staticmethod
     def search_json(data: Union[Dict[str, Any], List[Any]], search_key: str, search_value: Any) -> List[Any]:
         """
@@ -444,17 +1122,26 @@ class FileTools:
             return error_msg
 
     @staticmethod
-    def get_column(data: List[List[str]], column_index: int) -> Union[List[str], str]:
+    def get_column(data: Union[List[List[str]], str], column_index: Union[int, str]) -> Union[List[str], str]:
         """
-        Extract a specific column from a list of lists representing CSV data.
+        Extract a specific column from a list of lists representing CSV data, or from a table by ID.
 
         Args:
-            data (List[List[str]]): The CSV data as a list of lists.
-            column_index (int): The index of the column to extract (0-based).
+            data (Union[List[List[str]], str]): The CSV data as a list of lists, or a table ID from load_table.
+            column_index (Union[int, str]): The index of the column to extract (0-based), or its name for a table.
 
         Returns:
-            Union[List[str], str]: The extracted column as a list of strings, or an error message as a string.
+            Union[List[str], str]: The extracted column as a list, or an error message as a string.
         """
+        if isinstance(data, str):
+            try:
+                table = FileTools._get_table(data)
+                names = list(table.columns)
+                name = names[column_index] if isinstance(column_index, int) and 0 <= column_index < len(names) else column_index
+                return table.project([name]).columns[name].tolist()
+            except KeyError as e:
+                return f"Error: {e.args[0]}"
+
         try:
             if not data:
                 error_msg = "Error: Input data is empty."
@@ -479,18 +1166,27 @@ class FileTools:
             return error_msg
 
     @staticmethod
-    def filter_rows(data: List[List[str]], column_index: int, value: str) -> Union[List[List[str]], str]:
+    def filter_rows(data: Union[List[List[str]], str], column_index: Union[int, str], value: str) -> Union[List[List[str]], Dict[str, Any], str]:
         """
-        Filter rows in a list of lists representing CSV data based on a specific column value.
+        Filter rows in a list of lists representing CSV data, or in a table by ID, based on a specific column value.
 
         Args:
-            data (List[List[str]]): The CSV data as a list of lists.
-            column_index (int): The index of the column to filter on (0-based).
+            data (Union[List[List[str]], str]): The CSV data as a list of lists, or a table ID from load_table.
+            column_index (Union[int, str]): The index of the column to filter on (0-based), or its name for a table.
             value (str): The value to match in the specified column.
 
         Returns:
-            Union[List[List[str]], str]: The filtered rows as a list of lists, or an error message as a string.
+            Union[List[List[str]], Dict[str, Any], str]: The filtered rows as a list of lists, a description of the
+                filtered table when a table ID was given, or an error message as a string.
         """
+        if isinstance(data, str):
+            try:
+                names = list(FileTools._get_table(data).columns)
+            except KeyError as e:
+                return f"Error: {e.args[0]}"
+            name = names[column_index] if isinstance(column_index, int) and 0 <= column_index < len(names) else column_index
+            return FileTools.filter_table(data, [[name, "==", value]])
+
         try:
             if not data:
                 error_msg = "Error: Input data is empty."
@@ -514,6 +1210,206 @@ class FileTools:
             print(error_msg)
             return error_msg
 
+    @staticmethod
+    def _register_table(table: ColumnarTable) -> Dict[str, Any]:
+        table_id = f"table_{uuid.uuid4().hex[:12]}"
+        with FileTools._index_lock:
+            FileTools._tables[table_id] = table
+            while len(FileTools._tables) > FileTools.max_tables:
+                FileTools._tables.popitem(last=False)
+        return FileTools.describe_table(table_id)
+
+    @staticmethod
+    def _get_table(table_id: str) -> ColumnarTable:
+        with FileTools._index_lock:
+            if table_id not in FileTools._tables:
+                raise KeyError(f"Table '{table_id}' not found. It may have been dropped or evicted.")
+            FileTools._tables.move_to_end(table_id)
+            return FileTools._tables[table_id]
+
+    @staticmethod
+    def load_table(file_path: str, columns: Optional[List[str]] = None) -> Union[Dict[str, Any], str]:
+        """
+        Load a CSV file into an in-memory columnar table and return a reference to it instead of its rows.
+
+        Pass the returned table_id to filter_table, project_table, group_table, aggregate_table,
+        get_table_rows, get_column or filter_rows to work with the data without reading it into the conversation.
+
+        Args:
+            file_path (str): The path to the CSV file.
+            columns (List[str], optional): Columns to load. Defaults to all columns.
+
+        Returns:
+            Union[Dict[str, Any], str]: The table's 'table_id', 'num_rows', 'schema' and a 'preview' of its
+                first rows, or an error message as a string.
+        """
+        try:
+            return FileTools._register_table(ColumnarTable.from_csv(file_path, columns))
+        except FileNotFoundError:
+            error_msg = f"Error: CSV file not found at {file_path}"
+            print(error_msg)
+            return error_msg
+        except KeyError as e:
+            error_msg = f"Error: {e.args[0]}"
+            print(error_msg)
+            return error_msg
+        except csv.Error as e:
+            error_msg = f"Error parsing CSV file: {e}"
+            print(error_msg)
+            return error_msg
+
+    @staticmethod
+    def create_table(data: List[List[str]]) -> Union[Dict[str, Any], str]:
+        """
+        Create an in-memory columnar table from CSV data as a list of lists, whose first row is the header.
+
+        Args:
+            data (List[List[str]]): The header row followed by the data rows.
+
+        Returns:
+            Union[Dict[str, Any], str]: The table's 'table_id', 'num_rows', 'schema' and a 'preview' of its
+                first rows, or an error message as a string.
+        """
+        if not data:
+            error_msg = "Error: Input data is empty."
+            print(error_msg)
+            return error_msg
+        return FileTools._register_table(ColumnarTable.from_rows([str(name) for name in data[0]], data[1:]))
+
+    @staticmethod
+    def describe_table(table_id: str, preview_rows: int = 5) -> Union[Dict[str, Any], str]:
+        """
+        Describe a table by ID.
+
+        Args:
+            table_id (str): The table ID.
+            preview_rows (int, optional): Number of leading rows to include. Defaults to 5.
+
+        Returns:
+            Union[Dict[str, Any], str]: The table's 'table_id', 'num_rows', 'schema' and 'preview', or an error message as a string.
+        """
+        try:
+            table = FileTools._get_table(table_id)
+        except KeyError as e:
+            return f"Error: {e.args[0]}"
+        return {
+            "table_id": table_id,
+            "num_rows": table.num_rows,
+            "schema": table.schema(),
+            "preview": table.rows(0, preview_rows)
+        }
+
+    @staticmethod
+    def get_table_rows(table_id: str, offset: int = 0, limit: int = 20) -> Union[List[Dict[str, Any]], str]:
+        """
+        Get a page of rows from a table.
+
+        Args:
+            table_id (str): The table ID.
+            offset (int, optional): Index of the first row. Defaults to 0.
+            limit (int, optional): Maximum number of rows. Defaults to 20.
+
+        Returns:
+            Union[List[Dict[str, Any]], str]: The rows as dictionaries, or an error message as a string.
+        """
+        try:
+            return FileTools._get_table(table_id).rows(offset, limit)
+        except KeyError as e:
+            return f"Error: {e.args[0]}"
+
+    @staticmethod
+    def filter_table(table_id: str, conditions: List[List[Any]]) -> Union[Dict[str, Any], str]:
+        """
+        Keep the rows of a table matching all conditions, as a new table.
+
+        Args:
+            table_id (str): The table ID.
+            conditions (List[List[Any]]): [column, operator, value] triples, e.g. [["event", "==", "play"], ["seconds", ">", 60]].
+                Operators are ==, !=, <, <=, >, >=, "in" (value is a list) and "contains" (substring match).
+
+        Returns:
+            Union[Dict[str, Any], str]: A description of the new table, or an error message as a string.
+        """
+        try:
+            return FileTools._register_table(FileTools._get_table(table_id).filter(conditions))
+        except KeyError as e:
+            return f"Error: {e.args[0]}"
+        except (ValueError, TypeError) as e:
+            return f"Error: Invalid filter conditions: {e}"
+
+    @staticmethod
+    def project_table(table_id: str, columns: List[str]) -> Union[Dict[str, Any], str]:
+        """
+        Select columns of a table, as a new table.
+
+        Args:
+            table_id (str): The table ID.
+            columns (List[str]): The columns to keep, in order.
+
+        Returns:
+            Union[Dict[str, Any], str]: A description of the new table, or an error message as a string.
+        """
+        try:
+            return FileTools._register_table(FileTools._get_table(table_id).project(columns))
+        except KeyError as e:
+            return f"Error: {e.args[0]}"
+
+    @staticmethod
+    def group_table(table_id: str, by: List[str], aggregations: Dict[str, Union[str, List[str]]]) -> Union[Dict[str, Any], str]:
+        """
+        Group a table by one or more columns and aggregate the others, as a new table.
+
+        Args:
+            table_id (str): The table ID.
+            by (List[str]): The columns to group on.
+            aggregations (Dict[str, Union[str, List[str]]]): Functions per column, e.g. {"seconds": ["sum", "mean"]}.
+                Supported functions are count, sum, mean, min and max. Results are named `{column}_{function}`.
+
+        Returns:
+            Union[Dict[str, Any], str]: A description of the new table, or an error message as a string.
+        """
+        try:
+            return FileTools._register_table(FileTools._get_table(table_id).group_by(by, aggregations))
+        except KeyError as e:
+            return f"Error: {e.args[0]}"
+        except ValueError as e:
+            return f"Error: {e}"
+
+    @staticmethod
+    def aggregate_table(table_id: str, aggregations: Dict[str, Union[str, List[str]]]) -> Union[Dict[str, Any], str]:
+        """
+        Aggregate whole columns of a table.
+
+        Args:
+            table_id (str): The table ID.
+            aggregations (Dict[str, Union[str, List[str]]]): Functions per column: count, sum, mean, min or max.
+                Missing numbers are skipped.
+
+        Returns:
+            Union[Dict[str, Any], str]: A value per `{column}_{function}`, or an error message as a string.
+        """
+        try:
+            return FileTools._get_table(table_id).aggregate(aggregations)
+        except KeyError as e:
+            return f"Error: {e.args[0]}"
+        except ValueError as e:
+            return f"Error: {e}"
+
+    @staticmethod
+    def drop_table(table_id: str) -> str:
+        """
+        Release a table's memory.
+
+        Args:
+            table_id (str): The table ID.
+
+        Returns:
+            str: Confirmation message.
+        """
+        with FileTools._index_lock:
+            FileTools._tables.pop(table_id, None)
+        return f"Dropped table {table_id}"
+
     @staticmethod
     def peek_csv(file_path: str, num_lines: int = 5) -> Union[List[List[str]], str]:
         """
@@ -1,5 +1,11 @@
 import os
-from typing import Dict, Any, List
+import json
+import time
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 
 def check_pandas():
     try:
@@ -16,7 +22,277 @@ def check_fredapi():
         raise ImportError("fredapi is required for FredTools. Install with `pip install fredapi`")
 
 
+class FredSeriesStore:
+    def __init__(self, directory: Optional[str] = None, refresh_interval: float = 12 * 60 * 60):
+        """
+        Local SQLite store of FRED observations and series metadata.
+
+        Args:
+            directory (str, optional): Directory for the database. Defaults to the CHRONOCAST_FRED_CACHE_DIR
+                environment variable, or ~/.cache/chronocast.
+            refresh_interval (float, optional): Seconds before a stored series is checked for new observations.
+                FRED series update at most daily. Defaults to 12 hours.
+        """
+        self.directory = directory or os.getenv("CHRONOCAST_FRED_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "chronocast")
+        self.refresh_interval = refresh_interval
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._db is None:
+            os.makedirs(self.directory, exist_ok=True)
+            db = sqlite3.connect(os.path.join(self.directory, "fred_series.sqlite"), check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS observations (
+                    series_id TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    value REAL,
+                    PRIMARY KEY (series_id, date)
+                )
+            """)
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS series (
+                    series_id TEXT PRIMARY KEY,
+                    info TEXT NOT NULL,
+                    last_checked REAL NOT NULL
+                )
+            """)
+            self._db = db
+        return self._db
+
+    def get_info(self, series_id: str) -> Optional[Dict[str, Any]]:
+        """Stored metadata for a series with its 'last_checked' time, or None if the series is not stored."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT info, last_checked FROM series WHERE series_id = ?", (series_id,)).fetchone()
+        if row is None:
+            return None
+        return {**json.loads(row[0]), "last_checked": row[1]}
+
+    def is_stale(self, series_id: str) -> bool:
+        info = self.get_info(series_id)
+        return info is None or time.time() - info["last_checked"] > self.refresh_interval
+
+    def last_date(self, series_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT MAX(date) FROM observations WHERE series_id = ?", (series_id,)).fetchone()
+        return row[0]
+
+    def save(self, series_id: str, info: Dict[str, Any], observations: Any = None) -> None:
+        """
+        Store series metadata and upsert observations.
+
+        Args:
+            series_id (str): The series ID.
+            info (Dict[str, Any]): Series metadata.
+            observations (Series, optional): Values indexed by date. Existing dates are overwritten.
+        """
+        rows = []
+        if observations is not None:
+            rows = [(series_id, date.strftime("%Y-%m-%d"), None if value != value else float(value))
+                    for date, value in observations.items()]
+        with self._lock:
+            db = self._connection()
+            with db:
+                db.executemany("INSERT OR REPLACE INTO observations (series_id, date, value) VALUES (?, ?, ?)", rows)
+                db.execute("INSERT OR REPLACE INTO series (series_id, info, last_checked) VALUES (?, ?, ?)",
+                           (series_id, json.dumps(info, default=str), time.time()))
+
+    def load(self, series_id: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> Any:
+        """
+        Load stored observations.
+
+        Args:
+            series_id (str): The series ID.
+            start_date (str, optional): First date to include (YYYY-MM-DD).
+            end_date (str, optional): Last date to include (YYYY-MM-DD).
+
+        Returns:
+            Series: Values indexed by date.
+        """
+        pd = check_pandas()
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT date, value FROM observations WHERE series_id = ? AND date >= ? AND date <= ? ORDER BY date",
+                (series_id, start_date or "0000-00-00", end_date or "9999-99-99")).fetchall()
+        index = pd.DatetimeIndex([row[0] for row in rows])
+        return pd.Series([row[1] for row in rows], index=index, dtype="float64", name=series_id)
+
+    def clear(self, series_id: Optional[str] = None) -> None:
+        """Remove stored data for one series, or for all series."""
+        with self._lock:
+            db = self._connection()
+            with db:
+                if series_id is None:
+                    db.execute("DELETE FROM observations")
+                    db.execute("DELETE FROM series")
+                else:
+                    db.execute("DELETE FROM observations WHERE series_id = ?", (series_id,))
+                    db.execute("DELETE FROM series WHERE series_id = ?", (series_id,))
+
+
+class FixtureFredClient:
+    def __init__(self, series: Optional[Dict[str, Any]] = None, info: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        Offline stand-in for fredapi.Fred serving series from memory, for tests and offline runs.
+
+        Args:
+            series (Dict[str, Series], optional): Observations per series ID, indexed by date.
+            info (Dict[str, Dict[str, Any]], optional): Metadata per series ID. Defaults to a title equal to the ID.
+        """
+        self.series = dict(series or {})
+        self.info = dict(info or {})
+        self.calls: List[tuple] = []
+
+    @classmethod
+    def from_directory(cls, directory: str) -> "FixtureFredClient":
+        """
+        Load fixtures from a directory holding `{series_id}.csv` files with `date,value` columns, and optional
+        `{series_id}.json` metadata files.
+        """
+        pd = check_pandas()
+        series = {}
+        info = {}
+        for filename in sorted(os.listdir(directory)):
+            series_id, extension = os.path.splitext(filename)
+            path = os.path.join(directory, filename)
+            if extension == ".csv":
+                frame = pd.read_csv(path, parse_dates=["date"])
+                series[series_id] = pd.Series(frame["value"].values, index=pd.DatetimeIndex(frame["date"]), name=series_id)
+            elif extension == ".json":
+                with open(path) as f:
+                    info[series_id] = json.load(f)
+        return cls(series, info)
+
+    def get_series(self, series_id: str, observation_start: Optional[str] = None, observation_end: Optional[str] = None, **kwargs) -> Any:
+        self.calls.append(("get_series", series_id, observation_start, observation_end))
+        if series_id not in self.series:
+            raise ValueError("Bad Request.  The series does not exist.")
+        series = self.series[series_id].sort_index()
+        return series.loc[observation_start:observation_end]
+
+    def get_series_info(self, series_id: str) -> Any:
+        pd = check_pandas()
+        self.calls.append(("get_series_info", series_id))
+        if series_id not in self.series:
+            raise ValueError("Bad Request.  The series does not exist.")
+        series = self.series[series_id]
+        info = {
+            "id": series_id,
+            "title": series_id,
+            "observation_start": series.index.min().strftime("%Y-%m-%d") if len(series) else None,
+            "observation_end": series.index.max().strftime("%Y-%m-%d") if len(series) else None,
+            "last_updated": series.index.max().strftime("%Y-%m-%d") if len(series) else None,
+            **self.info.get(series_id, {})
+        }
+        return pd.Series(info)
+
+
 class FredTools:
+    _client: Any = None
+    _store: Optional[FredSeriesStore] = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def configure(client: Any = None, store: Optional[FredSeriesStore] = None) -> None:
+        """
+        Set the FRED client and series store used by the tools.
+
+        Args:
+            client (Any, optional): A fredapi.Fred compatible client, e.g. FixtureFredClient for offline use.
+                Defaults to fredapi.Fred with FRED_API_KEY.
+            store (FredSeriesStore, optional): The local series store. Defaults to FredSeriesStore().
+        """
+        with FredTools._lock:
+            FredTools._client = client
+            FredTools._store = store
+
+    @staticmethod
+    def _get_client() -> Any:
+        with FredTools._lock:
+            if FredTools._client is None:
+                Fred = check_fredapi()
+                FredTools._client = Fred(api_key=os.getenv('FRED_API_KEY'))
+            return FredTools._client
+
+    @staticmethod
+    def _get_store() -> FredSeriesStore:
+        with FredTools._lock:
+            if FredTools._store is None:
+                FredTools._store = FredSeriesStore()
+            return FredTools._store
+
+    @staticmethod
+    def _sync_series(series_id: str, force: bool = False) -> None:
+        """
+        Bring a stored series up to date. Metadata is checked first, and observations are only requested when
+        FRED reports an update, and then only those after the last stored date.
+        """
+        store = FredTools._get_store()
+        if not force and not store.is_stale(series_id):
+            return
+
+        client = FredTools._get_client()
+        info = {key: (value if isinstance(value, (int, float, type(None))) else str(value))
+                for key, value in dict(client.get_series_info(series_id)).items()}
+        stored = store.get_info(series_id)
+        last_date = store.last_date(series_id)
+
+        if stored is not None and last_date is not None and stored.get("last_updated") == info.get("last_updated"):
+            store.save(series_id, info)
+            return
+
+        start = None
+        if last_date is not None:
+            start = (datetime.strptime(last_date, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+        observations = client.get_series(series_id, observation_start=start)
+        store.save(series_id, info, observations)
+
+    @staticmethod
+    def fetch_series(series_ids: List[str], start_date: Optional[str] = None, end_date: Optional[str] = None,
+                     max_workers: int = 8, force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        Fetch several FRED series concurrently through the local store.
+
+        Series are downloaded once and then updated incrementally: once the store's refresh interval has passed,
+        metadata is re-checked and only observations after the last stored date are requested.
+
+        Args:
+            series_ids (List[str]): FRED series IDs.
+            start_date (str, optional): Start date (YYYY-MM-DD).
+            end_date (str, optional): End date (YYYY-MM-DD).
+            max_workers (int, optional): Maximum concurrent requests. Defaults to 8.
+            force_refresh (bool, optional): Check every series for updates regardless of the refresh interval. Defaults to False.
+
+        Returns:
+            Dict[str, Series]: Observations indexed by date for each series, in the order requested.
+        """
+        series_ids = list(dict.fromkeys(series_ids))
+        store = FredTools._get_store()
+        pending = [series_id for series_id in series_ids if force_refresh or store.is_stale(series_id)]
+        if pending:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as executor:
+                list(executor.map(lambda series_id: FredTools._sync_series(series_id, force=True), pending))
+        return {series_id: store.load(series_id, start_date, end_date) for series_id in series_ids}
+
+    @staticmethod
+    def get_series_info(series_id: str) -> Dict[str, Any]:
+        """
+        Get metadata for a FRED series, such as its title, units, frequency and last update, from the local store.
+
+        Args:
+            series_id (str): The series ID.
+
+        Returns:
+            Dict[str, Any]: The series metadata.
+        """
+        FredTools._sync_series(series_id)
+        info = FredTools._get_store().get_info(series_id)
+        info.pop("last_checked", None)
+        return info
+
     @staticmethod
     def economic_indicator_analysis(indicator_ids: List[str], start_date: str, end_date: str) -> Dict[str, Any]:
         """
@@ -30,14 +306,13 @@ class FredTools:
         Returns:
             Dict[str, Any]: A dictionary containing the analysis results for each indicator.
         """
-        Fred = check_fredapi()
-        fred = Fred(api_key=os.getenv('FRED_API_KEY'))
-        
+        all_series = FredTools.fetch_series(indicator_ids, start_date, end_date)
+        store = FredTools._get_store()
+
         results = {}
 
         for indicator_id in indicator_ids:
-            series = fred.get_series(indicator_id, observation_start=start_date, observation_end=end_date)
-            series = series.dropna()
+            series = all_series[indicator_id].dropna()
 
             if len(series) > 0:
                 pct_change = series.pct_change()
@@ -45,7 +320,7 @@ class FredTools:
 
                 results[indicator_id] = {
                     "indicator": indicator_id,
-                    "title": fred.get_series_info(indicator_id).title,
+                    "title": store.get_info(indicator_id)["title"],
                     "start_date": start_date,
                     "end_date": end_date,
                     "min_value": series.min(),
@@ -79,14 +354,8 @@ class FredTools:
             Dict[str, Any]: A dictionary containing the yield curve analysis results.
         """
         pd = check_pandas()
-        Fred = check_fredapi()
-        fred = Fred(api_key=os.getenv('FRED_API_KEY'))
-        
-        yield_data = {}
 
-        for maturity in treasury_maturities:
-            series = fred.get_series(maturity, observation_start=start_date, observation_end=end_date)
-            yield_data[maturity] = series
+        yield_data = FredTools.fetch_series(treasury_maturities, start_date, end_date)
 
         yield_df = pd.DataFrame(yield_data)
         yield_df = yield_df.dropna()
@@ -126,10 +395,7 @@ class FredTools:
         Returns:
             Dict[str, Any]: A dictionary containing the sentiment analysis results.
         """
-        Fred = check_fredapi()
-        fred = Fred(api_key=os.getenv('FRED_API_KEY'))
-        
-        series = fred.get_series(news_series_id, observation_start=start_date, observation_end=end_date)
+        series = FredTools.fetch_series([news_series_id], start_date, end_date)[news_series_id]
         series = series.dropna()
 
         if len(series) > 0:
@@ -138,7 +404,7 @@ class FredTools:
 
             results = {
                 "series_id": news_series_id,
-                "title": fred.get_series_info(news_series_id).title,
+                "title": FredTools._get_store().get_info(news_series_id)["title"],
                 "start_date": start_date,
                 "end_date": end_date,
                 "positive_sentiment_count": sentiment_counts.get(1, 0),
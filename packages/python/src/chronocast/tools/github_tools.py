@@ -1,12 +1,47 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterator, Callable
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import hashlib
+import time
 import requests
+from requests.structures import CaseInsensitiveDict
 import base64
 import os
+from .http_utils import get_session
+
+DEFAULT_GITHUB_API_URL = "https://api.github.com"
+
+# Maximum number of issues/PRs fetched per GraphQL request
+GRAPHQL_BATCH_SIZE = 50
+
+GRAPHQL_ISSUE_FIELDS = """
+    number title state body createdAt updatedAt url
+    author { login }
+    comments(first: %(comments)d) { totalCount nodes { databaseId author { login } body createdAt updatedAt } }
+"""
+
+GRAPHQL_PULL_REQUEST_FIELDS = GRAPHQL_ISSUE_FIELDS + """
+    isDraft mergeable headRefName headRefOid baseRefName baseRefOid additions deletions changedFiles
+    commits(first: %(commits)d) { totalCount nodes { commit { oid message authoredDate author { name email } } } }
+    files(first: %(files)d) { totalCount nodes { path additions deletions changeType } }
+"""
 
 # Define custom tools
 class GitHubTools:
     _owner: Optional[str] = None
     _repo: Optional[str] = None
+    # Responses kept for conditional requests, keyed by request; 304 responses don't count against the rate limit
+    _etag_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+    _etag_cache_size: int = 512
+    _etag_cache_lock = threading.Lock()
+    # Request budget from the last X-RateLimit-Remaining / X-RateLimit-Reset headers seen
+    _rate_limit_remaining: Optional[int] = None
+    _rate_limit_reset: float = 0.0
+    _rate_limit_lock = threading.Lock()
+    # Requests kept in hand before waiting for the window to reset, and the longest wait before giving up
+    rate_limit_reserve: int = 5
+    rate_limit_max_wait: float = 60.0
 
     @staticmethod
     def configure() -> None:
@@ -43,6 +78,170 @@ class GitHubTools:
             headers["Authorization"] = f"Bearer {token}"
         return headers
 
+    @staticmethod
+    def _api_url() -> str:
+        """Base URL of the REST API. Set GITHUB_API_URL to target GitHub Enterprise or a local test server."""
+        return os.getenv('GITHUB_API_URL', DEFAULT_GITHUB_API_URL).rstrip("/")
+
+    @staticmethod
+    def _repo_url() -> str:
+        return f"{GitHubTools._api_url()}/repos/{GitHubTools._owner}/{GitHubTools._repo}"
+
+    @staticmethod
+    def _get(url: str, headers: Dict[str, str], params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """
+        Send a GET request on the pooled session, revalidating any previous response with If-None-Match /
+        If-Modified-Since. A 304 is turned back into the stored 200 response with `from_cache` set to True.
+        """
+        url = requests.Request("GET", url, params=params).prepare().url
+        key = hashlib.sha256("\n".join([url, headers.get("Accept", ""), headers.get("Authorization", "")]).encode()).hexdigest()
+
+        with GitHubTools._etag_cache_lock:
+            entry = GitHubTools._etag_cache.get(key)
+
+        request_headers = dict(headers)
+        if entry is not None:
+            if entry["etag"]:
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+
+        GitHubTools._acquire_rate_limit()
+        response = get_session().get(url, headers=request_headers)
+        GitHubTools._record_rate_limit(response)
+        response.from_cache = False
+
+        if response.status_code == 304 and entry is not None:
+            cached = requests.Response()
+            cached.status_code = entry["status_code"]
+            cached._content = entry["content"]
+            cached.encoding = entry["encoding"]
+            cached.headers = CaseInsensitiveDict(entry["headers"])
+            # Keep the fresh rate limit headers
+            cached.headers.update({k: v for k, v in response.headers.items() if k.lower().startswith("x-ratelimit")})
+            cached.url = url
+            cached.request = response.request
+            cached.reason = "OK"
+            cached.from_cache = True
+            with GitHubTools._etag_cache_lock:
+                if key in GitHubTools._etag_cache:
+                    GitHubTools._etag_cache.move_to_end(key)
+            return cached
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code == 200 and (etag or last_modified):
+            with GitHubTools._etag_cache_lock:
+                GitHubTools._etag_cache[key] = {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "status_code": response.status_code,
+                    "content": response.content,
+                    "encoding": response.encoding,
+                    "headers": dict(response.headers),
+                }
+                GitHubTools._etag_cache.move_to_end(key)
+                while len(GitHubTools._etag_cache) > GitHubTools._etag_cache_size:
+                    GitHubTools._etag_cache.popitem(last=False)
+        return response
+
+    @staticmethod
+    def _acquire_rate_limit() -> None:
+        """
+        Reserve one request from the known rate limit budget, sleeping until the window resets when only
+        `rate_limit_reserve` requests are left. The budget is decremented before the request is sent so that
+        concurrent workers don't overrun it between responses.
+        """
+        while True:
+            with GitHubTools._rate_limit_lock:
+                now = time.time()
+                if GitHubTools._rate_limit_remaining is not None and now >= GitHubTools._rate_limit_reset:
+                    GitHubTools._rate_limit_remaining = None
+                if GitHubTools._rate_limit_remaining is None or GitHubTools._rate_limit_remaining > GitHubTools.rate_limit_reserve:
+                    if GitHubTools._rate_limit_remaining is not None:
+                        GitHubTools._rate_limit_remaining -= 1
+                    return
+                wait = GitHubTools._rate_limit_reset - now
+
+            if wait > GitHubTools.rate_limit_max_wait:
+                raise Exception(f"GitHub API rate limit exhausted; it resets in {int(wait)} seconds")
+            print(f"GitHub API rate limit nearly exhausted, waiting {wait:.1f} seconds")
+            time.sleep(wait)
+
+    @staticmethod
+    def _record_rate_limit(response: requests.Response) -> None:
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if remaining is None or not remaining.isdigit():
+            return
+        reset_at = float(reset) if reset and reset.isdigit() else time.time() + 60
+        with GitHubTools._rate_limit_lock:
+            if GitHubTools._rate_limit_remaining is None or reset_at > GitHubTools._rate_limit_reset:
+                GitHubTools._rate_limit_remaining = int(remaining)
+                GitHubTools._rate_limit_reset = reset_at
+            else:
+                # Responses can arrive out of order; keep the lowest count seen in this window
+                GitHubTools._rate_limit_remaining = min(GitHubTools._rate_limit_remaining, int(remaining))
+
+    @staticmethod
+    def get_rate_limit_status() -> Dict[str, Any]:
+        """
+        Get the API request budget reported by the most recent response.
+
+        Returns:
+            Dict[str, Any]: 'remaining' requests (None if unknown) and 'reset_in' seconds until the window resets.
+        """
+        with GitHubTools._rate_limit_lock:
+            return {
+                "remaining": GitHubTools._rate_limit_remaining,
+                "reset_in": max(0.0, GitHubTools._rate_limit_reset - time.time()) if GitHubTools._rate_limit_remaining is not None else None
+            }
+
+    @staticmethod
+    def _run_concurrently(tasks: List[Callable[[], Any]], max_concurrency: int) -> List[Any]:
+        """Run tasks on a thread pool and return their results, or the exception each raised, in task order."""
+        def run(task: Callable[[], Any]) -> Any:
+            try:
+                return task()
+            except Exception as e:
+                return e
+
+        if max_concurrency <= 1 or len(tasks) <= 1:
+            return [run(task) for task in tasks]
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(tasks))) as executor:
+            return list(executor.map(run, tasks))
+
+    @staticmethod
+    def _iter_pages(url: str, headers: Dict[str, str], params: Optional[Dict[str, Any]] = None,
+                    max_results: Optional[int] = None) -> Iterator[Any]:
+        """Yield the decoded JSON of each page, following the Link header's rel="next" URL."""
+        params = dict(params or {})
+        params.setdefault("per_page", 100 if max_results is None else max(1, min(max_results, 100)))
+        while url:
+            response = GitHubTools._get(url, headers, params)
+            response.raise_for_status()
+            yield response.json()
+            # The next URL already carries the query parameters
+            url = response.links.get("next", {}).get("url")
+            params = None
+
+    @staticmethod
+    def _get_paginated(url: str, headers: Dict[str, str], params: Optional[Dict[str, Any]] = None,
+                       max_results: Optional[int] = None) -> List[Any]:
+        """Collect the items of every page of a list endpoint, stopping once max_results items are collected."""
+        items = []
+        for page in GitHubTools._iter_pages(url, headers, params, max_results):
+            items.extend(page)
+            if max_results is not None and len(items) >= max_results:
+                return items[:max_results]
+        return items
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget the responses kept for conditional requests."""
+        with GitHubTools._etag_cache_lock:
+            GitHubTools._etag_cache.clear()
+
 
     @staticmethod
     def get_user_info(username: str) -> Dict[str, Any]:
@@ -58,20 +257,21 @@ class GitHubTools:
         Raises:
             requests.exceptions.HTTPError: If the API request fails.
         """
-        base_url = "https://api.github.com"
+        base_url = GitHubTools._api_url()
         headers = GitHubTools._get_headers()
         url = f"{base_url}/users/{username}"
-        response = requests.get(url, headers=headers)
+        response = GitHubTools._get(url, headers)
         response.raise_for_status()
         return response.json()
 
     @staticmethod
-    def list_user_repos(username: str) -> List[Dict[str, Any]]:
+    def list_user_repos(username: str, max_results: Optional[int] = 100) -> List[Dict[str, Any]]:
         """
         List public repositories for the specified user.
 
         Args:
             username (str): The GitHub username of the user.
+            max_results (int, optional): Maximum number of repositories to return. Defaults to 100; pass None to fetch every page.
 
         Returns:
             List[Dict[str, Any]]: List of repository information.
@@ -79,12 +279,10 @@ class GitHubTools:
         Raises:
             requests.exceptions.HTTPError: If the API request fails.
         """
-        base_url = "https://api.github.com"
+        base_url = GitHubTools._api_url()
         headers = GitHubTools._get_headers()
         url = f"{base_url}/users/{username}/repos"
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        return GitHubTools._get_paginated(url, headers, max_results=max_results)
 
     @staticmethod
     def get_repo_details(owner: str, repo: str) -> Dict[str, Any]:
@@ -101,21 +299,22 @@ class GitHubTools:
         Raises:
             requests.exceptions.HTTPError: If the API request fails.
         """
-        base_url = "https://api.github.com"
+        base_url = GitHubTools._api_url()
         headers = GitHubTools._get_headers()
         url = f"{base_url}/repos/{owner}/{repo}"
-        response = requests.get(url, headers=headers)
+        response = GitHubTools._get(url, headers)
         response.raise_for_status()
         return response.json()
 
     @staticmethod
-    def list_repo_contributors(owner: str, repo: str) -> List[Dict[str, Any]]:
+    def list_repo_contributors(owner: str, repo: str, max_results: Optional[int] = 100) -> List[Dict[str, Any]]:
         """
         List contributors to a specific GitHub repository.
 
         Args:
             owner (str): Repository owner username/organization.
             repo (str): Repository name.
+            max_results (int, optional): Maximum number of contributors to return. Defaults to 100; pass None to fetch every page.
 
         Returns:
             List[Dict[str, Any]]: List of contributor information.
@@ -123,12 +322,10 @@ class GitHubTools:
         Raises:
             requests.exceptions.HTTPError: If the API request fails.
         """
-        base_url = "https://api.github.com"
+        base_url = GitHubTools._api_url()
         headers = GitHubTools._get_headers()
         url = f"{base_url}/repos/{owner}/{repo}/contributors"
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        return GitHubTools._get_paginated(url, headers, max_results=max_results)
 
     @staticmethod
     def get_repo_readme(owner: str, repo: str) -> Dict[str, str]:
@@ -145,10 +342,10 @@ class GitHubTools:
         Raises:
             requests.exceptions.HTTPError: If the API request fails.
         """
-        base_url = "https://api.github.com"
+        base_url = GitHubTools._api_url()
         headers = GitHubTools._get_headers()
         url = f"{base_url}/repos/{owner}/{repo}/readme"
-        response = requests.get(url, headers=headers)
+        response = GitHubTools._get(url, headers)
         response.raise_for_status()
         data = response.json()
         return {
@@ -173,25 +370,16 @@ class GitHubTools:
         Raises:
             requests.exceptions.HTTPError: If the API request fails.
         """
-        base_url = "https://api.github.com"
+        base_url = GitHubTools._api_url()
         headers = GitHubTools._get_headers()
         url = f"{base_url}/search/repositories"
         params = {
             "q": query,
             "sort": sort,
-            "order": "desc",
-            "per_page": min(max_results, 100)
+            "order": "desc"
         }
 
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        data = response.json()
-
-        return {
-            "total_count": data["total_count"],
-            "incomplete_results": data["incomplete_results"],
-            "items": data["items"][:max_results]
-        }
+        return GitHubTools._search(url, headers, params, max_results)
 
     @staticmethod
     def search_code(query: str, owner: str = None, repo: str = None, max_results: int = 10) -> Dict[str, Any]:
@@ -213,7 +401,7 @@ class GitHubTools:
         if repo and not owner:
             raise ValueError("Repository name provided without owner")
 
-        base_url = "https://api.github.com"
+        base_url = GitHubTools._api_url()
         headers = GitHubTools._get_headers()
         
         # Add repo scope if provided
@@ -223,28 +411,31 @@ class GitHubTools:
             query = f"{query} user:{owner}"
 
         url = f"{base_url}/search/code"
-        params = {
-            "q": query,
-            "per_page": min(max_results, 100)
-        }
-        
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        data = response.json()
-        
-        return {
-            "total_count": data["total_count"],
-            "incomplete_results": data["incomplete_results"],
-            "items": data["items"][:max_results]
-        }
+        params = {"q": query}
+
+        return GitHubTools._search(url, headers, params, max_results)
+
+    @staticmethod
+    def _search(url: str, headers: Dict[str, str], params: Dict[str, Any], max_results: int) -> Dict[str, Any]:
+        """Page through a search endpoint until max_results items are collected."""
+        result = {"total_count": 0, "incomplete_results": False, "items": []}
+        for page in GitHubTools._iter_pages(url, headers, params, max_results):
+            result["total_count"] = page["total_count"]
+            result["incomplete_results"] = result["incomplete_results"] or page["incomplete_results"]
+            result["items"].extend(page["items"])
+            if len(result["items"]) >= max_results:
+                break
+        result["items"] = result["items"][:max_results]
+        return result
 
     @staticmethod
-    def list_pull_requests(state: str = "open") -> List[Dict[str, Any]]:
+    def list_pull_requests(state: str = "open", max_results: Optional[int] = 100) -> List[Dict[str, Any]]:
         """
         List pull requests in a repository.
 
         Args:
             state (str, optional): State of PRs to return ('open', 'closed', 'all'). Defaults to 'open'.
+            max_results (int, optional): Maximum number of pull requests to return. Defaults to 100; pass None to fetch every page.
 
         Returns:
             List[Dict[str, Any]]: A list of dictionaries containing pull request information.
@@ -254,13 +445,10 @@ class GitHubTools:
             requests.exceptions.HTTPError: If the API request fails.
         """
         GitHubTools.configure()    
-        base_url = "https://api.github.com"
         headers = GitHubTools._get_headers()
-        url = f"{base_url}/repos/{GitHubTools._owner}/{GitHubTools._repo}/pulls"
+        url = f"{GitHubTools._repo_url()}/pulls"
         params = {"state": state}
-
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
+        pulls = GitHubTools._get_paginated(url, headers, params, max_results)
 
         def simplify_pr(pr: Dict[str, Any]) -> Dict[str, Any]:
             return {
@@ -286,7 +474,7 @@ class GitHubTools:
                 "draft": pr["draft"]
             }
 
-        return [simplify_pr(pr) for pr in response.json()]
+        return [simplify_pr(pr) for pr in pulls]
 
     @staticmethod
     def get_pull_request(pull_number: int) -> Dict[str, Any]:
@@ -304,11 +492,10 @@ class GitHubTools:
             requests.exceptions.HTTPError: If the API request fails.
         """
         GitHubTools.configure() 
-        base_url = "https://api.github.com"
         headers = GitHubTools._get_headers()
-        url = f"{base_url}/repos/{GitHubTools._owner}/{GitHubTools._repo}/pulls/{pull_number}"
+        url = f"{GitHubTools._repo_url()}/pulls/{pull_number}"
 
-        response = requests.get(url, headers=headers)
+        response = GitHubTools._get(url, headers)
         response.raise_for_status()
         return response.json()
 
@@ -328,26 +515,23 @@ class GitHubTools:
             requests.exceptions.HTTPError: If the API request fails.
         """
         GitHubTools.configure() 
-        base_url = "https://api.github.com"
         headers = GitHubTools._get_headers()
-        url = f"{base_url}/repos/{GitHubTools._owner}/{GitHubTools._repo}/pulls/{pull_number}/commits"
-
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
+        url = f"{GitHubTools._repo_url()}/pulls/{pull_number}/commits"
+        commits = GitHubTools._get_paginated(url, headers)
+        return [GitHubTools._simplify_commit(commit) for commit in commits]
 
-        def simplify_commit(commit: Dict[str, Any]) -> Dict[str, Any]:
-            return {
-                "sha": commit["sha"],
-                "message": commit["commit"]["message"],
-                "author": {
-                    "name": commit["commit"]["author"]["name"],
-                    "email": commit["commit"]["author"]["email"],
-                    "date": commit["commit"]["author"]["date"]
-                },
-                "url": commit["html_url"]
-            }
-
-        return [simplify_commit(commit) for commit in response.json()]
+    @staticmethod
+    def _simplify_commit(commit: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "sha": commit["sha"],
+            "message": commit["commit"]["message"],
+            "author": {
+                "name": commit["commit"]["author"]["name"],
+                "email": commit["commit"]["author"]["email"],
+                "date": commit["commit"]["author"]["date"]
+            },
+            "url": commit["html_url"]
+        }
 
     @staticmethod
     def list_pull_request_files(pull_number: int) -> List[Dict[str, Any]]:
@@ -365,34 +549,33 @@ class GitHubTools:
             requests.exceptions.HTTPError: If the API request fails.
         """
         GitHubTools.configure() 
-        base_url = "https://api.github.com"
         headers = GitHubTools._get_headers()
-        url = f"{base_url}/repos/{GitHubTools._owner}/{GitHubTools._repo}/pulls/{pull_number}/files"
-
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-
-        def simplify_file(file: Dict[str, Any]) -> Dict[str, Any]:
-            return {
-                "filename": file["filename"],
-                "status": file["status"],
-                "additions": file["additions"],
-                "deletions": file["deletions"],
-                "changes": file["changes"],
-                "blob_url": file["blob_url"],
-                "raw_url": file["raw_url"],
-                "patch": file.get("patch")
-            }
+        url = f"{GitHubTools._repo_url()}/pulls/{pull_number}/files"
+        files = GitHubTools._get_paginated(url, headers)
+        return [GitHubTools._simplify_file(file) for file in files]
 
-        return [simplify_file(file) for file in response.json()]
+    @staticmethod
+    def _simplify_file(file: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "filename": file["filename"],
+            "status": file["status"],
+            "additions": file["additions"],
+            "deletions": file["deletions"],
+            "changes": file["changes"],
+            "blob_url": file["blob_url"],
+            "raw_url": file["raw_url"],
+            "patch": file.get("patch")
+        }
 
     @staticmethod
-    def get_directory_structure(path: str = "") -> Dict[str, Any]:
+    def get_directory_structure(path: str = "", ref: Optional[str] = None) -> Dict[str, Any]:
         """
         Get the directory structure of a repository.
+        Uses the Git Trees API, so the whole tree is usually fetched in a single request.
 
         Args:
             path (str, optional): The directory path. Defaults to root directory.
+            ref (str, optional): Branch, tag or commit SHA to read. Defaults to the default branch.
 
         Returns:
             Dict[str, Any]: A nested dictionary representing the directory structure.
@@ -402,13 +585,55 @@ class GitHubTools:
             requests.exceptions.HTTPError: If the API request fails.
         """
         GitHubTools.configure() 
-        contents = GitHubTools.get_repo_contents(path)
-        structure = {}
-        for item in contents:
-            if item['type'] == 'dir':
-                structure[item['name']] = GitHubTools.get_directory_structure(item['path'])
-            else:
-                structure[item['name']] = item['type']
+        headers = GitHubTools._get_headers()
+        trees_url = f"{GitHubTools._repo_url()}/git/trees"
+
+        def entry_type(entry: Dict[str, Any]) -> str:
+            if entry["type"] == "commit":
+                return "submodule"
+            if entry["type"] == "blob":
+                return "symlink" if entry.get("mode") == "120000" else "file"
+            return "dir"
+
+        def get_tree(sha: str, recursive: bool = False) -> Dict[str, Any]:
+            response = GitHubTools._get(f"{trees_url}/{sha}", headers, {"recursive": 1} if recursive else None)
+            response.raise_for_status()
+            return response.json()
+
+        # Walk down to the requested directory one level at a time
+        sha = ref or "HEAD"
+        for name in [part for part in path.strip("/").split("/") if part]:
+            entries = {entry["path"]: entry for entry in get_tree(sha)["tree"]}
+            if name not in entries:
+                raise requests.exceptions.HTTPError(f"404 Client Error: path not found: {path}")
+            if entries[name]["type"] != "tree":
+                return {name: entry_type(entries[name])}
+            sha = entries[name]["sha"]
+
+        structure: Dict[str, Any] = {}
+        data = get_tree(sha, recursive=True)
+        if not data.get("truncated"):
+            for entry in data["tree"]:
+                *parents, name = entry["path"].split("/")
+                node = structure
+                for parent in parents:
+                    node = node.setdefault(parent, {})
+                if entry["type"] == "tree":
+                    node.setdefault(name, {})
+                else:
+                    node[name] = entry_type(entry)
+            return structure
+
+        # Trees too large for one response are read one directory at a time
+        pending = [(sha, structure)]
+        while pending:
+            tree_sha, node = pending.pop()
+            for entry in get_tree(tree_sha)["tree"]:
+                if entry["type"] == "tree":
+                    node[entry["path"]] = {}
+                    pending.append((entry["sha"], node[entry["path"]]))
+                else:
+                    node[entry["path"]] = entry_type(entry)
         return structure
 
     @staticmethod
@@ -428,10 +653,9 @@ class GitHubTools:
             requests.exceptions.HTTPError: If the API request fails.
         """
         GitHubTools.configure() 
-        base_url = "https://api.github.com"
         headers = GitHubTools._get_headers()
-        url = f"{base_url}/repos/{GitHubTools._owner}/{GitHubTools._repo}/contents/{path}"
-        response = requests.get(url, headers=headers)
+        url = f"{GitHubTools._repo_url()}/contents/{path}"
+        response = GitHubTools._get(url, headers)
         response.raise_for_status()
 
         contents = response.json()
@@ -464,10 +688,9 @@ class GitHubTools:
             requests.exceptions.HTTPError: If the API request fails.
         """
         GitHubTools.configure()   
-        base_url = "https://api.github.com"
         headers = GitHubTools._get_headers()
-        url = f"{base_url}/repos/{GitHubTools._owner}/{GitHubTools._repo}/contents/{path}"
-        response = requests.get(url, headers=headers)
+        url = f"{GitHubTools._repo_url()}/contents/{path}"
+        response = GitHubTools._get(url, headers)
         response.raise_for_status()
         data = response.json()
 
@@ -495,39 +718,344 @@ class GitHubTools:
             requests.exceptions.HTTPError: If the API request fails.
         """
         GitHubTools.configure() 
-        base_url = "https://api.github.com"
         headers = GitHubTools._get_headers()
 
-        # Get issue details
-        issue_url = f"{base_url}/repos/{GitHubTools._owner}/{GitHubTools._repo}/issues/{issue_number}"
-        issue_response = requests.get(issue_url, headers=headers)
-        issue_response.raise_for_status()
-        issue_data = issue_response.json()
+        # Fetch the issue and its comments at the same time
+        issue_data, comments_data = GitHubTools._run_concurrently([
+            lambda: GitHubTools._get_issue(issue_number, headers),
+            lambda: GitHubTools._get_comments(issue_number, headers)
+        ], max_concurrency=2)
+        for data in (issue_data, comments_data):
+            if isinstance(data, Exception):
+                raise data
 
-        # Get comments
-        comments_url = f"{issue_url}/comments"
-        comments_response = requests.get(comments_url, headers=headers)
-        comments_response.raise_for_status()
-        comments_data = comments_response.json()
+        result = [GitHubTools._simplify_comment(issue_data, is_issue=True)]
+        result.extend([GitHubTools._simplify_comment(comment) for comment in comments_data])
 
-        def simplify_data(data: Dict[str, Any], is_issue: bool = False) -> Dict[str, Any]:
-            return {
-                "id": data["id"],
-                "user": {
-                    "login": data["user"]["login"],
-                    "id": data["user"]["id"]
-                },
-                "created_at": data["created_at"],
-                "updated_at": data["updated_at"],
-                "body": data["body"],
-                "type": "issue" if is_issue else "comment"
+        return result
+
+    @staticmethod
+    def _get_issue(issue_number: int, headers: Dict[str, str]) -> Dict[str, Any]:
+        response = GitHubTools._get(f"{GitHubTools._repo_url()}/issues/{issue_number}", headers)
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _get_comments(issue_number: int, headers: Dict[str, str]) -> List[Dict[str, Any]]:
+        return GitHubTools._get_paginated(f"{GitHubTools._repo_url()}/issues/{issue_number}/comments", headers)
+
+    @staticmethod
+    def _simplify_comment(data: Dict[str, Any], is_issue: bool = False) -> Dict[str, Any]:
+        return {
+            "id": data["id"],
+            "user": {
+                "login": data["user"]["login"],
+                "id": data["user"]["id"]
+            },
+            "created_at": data["created_at"],
+            "updated_at": data["updated_at"],
+            "body": data["body"],
+            "type": "issue" if is_issue else "comment"
+        }
+
+    @staticmethod
+    def get_pull_requests_bulk(pull_numbers: List[int], include_commits: bool = True, include_files: bool = True,
+                               include_comments: bool = True, include_patches: bool = False,
+                               max_concurrency: int = 8) -> List[Dict[str, Any]]:
+        """
+        Fetch several pull requests with their commits, changed files and conversation comments concurrently.
+        Prefer this over calling get_pull_request, list_pull_request_commits, list_pull_request_files and
+        get_issue_comments for each pull request in turn.
+
+        Args:
+            pull_numbers (List[int]): The pull request numbers.
+            include_commits (bool, optional): Whether to include commits. Defaults to True.
+            include_files (bool, optional): Whether to include changed files. Defaults to True.
+            include_comments (bool, optional): Whether to include conversation comments. Defaults to True.
+            include_patches (bool, optional): Whether to include each file's patch. Defaults to False.
+            max_concurrency (int, optional): Maximum number of requests in flight. Defaults to 8.
+
+        Returns:
+            List[Dict[str, Any]]: One compact record per pull request, in the order requested. Pull requests
+                that could not be fetched have 'number' and 'error' only.
+
+        Raises:
+            ValueError: If owner and repo are not configured
+        """
+        GitHubTools.configure()
+        headers = GitHubTools._get_headers()
+        repo_url = GitHubTools._repo_url()
+
+        def get_details(number: int) -> Dict[str, Any]:
+            response = GitHubTools._get(f"{repo_url}/pulls/{number}", headers)
+            response.raise_for_status()
+            return response.json()
+
+        parts = {"details": get_details}
+        if include_commits:
+            parts["commits"] = lambda number: GitHubTools._get_paginated(f"{repo_url}/pulls/{number}/commits", headers)
+        if include_files:
+            parts["files"] = lambda number: GitHubTools._get_paginated(f"{repo_url}/pulls/{number}/files", headers)
+        if include_comments:
+            parts["comments"] = lambda number: GitHubTools._get_comments(number, headers)
+
+        # One task per (pull request, part) on a single pool, so all requests share the concurrency limit
+        tasks = [(number, name, fetch) for number in pull_numbers for name, fetch in parts.items()]
+        results = GitHubTools._run_concurrently(
+            [lambda number=number, fetch=fetch: fetch(number) for number, _, fetch in tasks], max_concurrency)
+        fetched: Dict[int, Dict[str, Any]] = {}
+        for (number, name, _), result in zip(tasks, results):
+            fetched.setdefault(number, {})[name] = result
+
+        records = []
+        for number in pull_numbers:
+            data = fetched[number]
+            error = next((result for result in data.values() if isinstance(result, Exception)), None)
+            if error is not None:
+                records.append({"number": number, "error": str(error)})
+                continue
+
+            pr = data["details"]
+            record = {
+                "number": pr["number"],
+                "title": pr["title"],
+                "state": pr["state"],
+                "merged": pr.get("merged", False),
+                "draft": pr.get("draft", False),
+                "user": pr["user"]["login"],
+                "created_at": pr["created_at"],
+                "updated_at": pr["updated_at"],
+                "html_url": pr["html_url"],
+                "head": pr["head"]["ref"],
+                "base": pr["base"]["ref"],
+                "body": pr.get("body"),
+                "additions": pr.get("additions"),
+                "deletions": pr.get("deletions"),
+                "changed_files": pr.get("changed_files")
             }
+            if include_commits:
+                record["commits"] = [{
+                    "sha": commit["sha"][:12],
+                    "message": commit["commit"]["message"],
+                    "author": commit["commit"]["author"]["name"],
+                    "date": commit["commit"]["author"]["date"]
+                } for commit in data["commits"]]
+            if include_files:
+                record["files"] = [{
+                    "filename": file["filename"],
+                    "status": file["status"],
+                    "additions": file["additions"],
+                    "deletions": file["deletions"],
+                    **({"patch": file.get("patch")} if include_patches else {})
+                } for file in data["files"]]
+            if include_comments:
+                record["comments"] = [GitHubTools._compact_comment(comment) for comment in data["comments"]]
+            records.append(record)
+
+        return records
+
+    @staticmethod
+    def get_issues_bulk(issue_numbers: List[int], include_comments: bool = True, max_concurrency: int = 8) -> List[Dict[str, Any]]:
+        """
+        Fetch several issues and their comments concurrently.
+        Prefer this over calling get_issue_comments for each issue in turn.
+
+        Args:
+            issue_numbers (List[int]): The issue numbers.
+            include_comments (bool, optional): Whether to include comments. Defaults to True.
+            max_concurrency (int, optional): Maximum number of requests in flight. Defaults to 8.
+
+        Returns:
+            List[Dict[str, Any]]: One compact record per issue, in the order requested. Issues that could not
+                be fetched have 'number' and 'error' only.
 
-        result = [simplify_data(issue_data, is_issue=True)]
-        result.extend([simplify_data(comment) for comment in comments_data])
+        Raises:
+            ValueError: If owner and repo are not configured
+        """
+        GitHubTools.configure()
+        headers = GitHubTools._get_headers()
 
+        tasks = []
+        for number in issue_numbers:
+            tasks.append(lambda number=number: GitHubTools._get_issue(number, headers))
+            if include_comments:
+                tasks.append(lambda number=number: GitHubTools._get_comments(number, headers))
+        results = iter(GitHubTools._run_concurrently(tasks, max_concurrency))
+
+        records = []
+        for number in issue_numbers:
+            issue = next(results)
+            comments = next(results) if include_comments else []
+            error = next((result for result in (issue, comments) if isinstance(result, Exception)), None)
+            if error is not None:
+                records.append({"number": number, "error": str(error)})
+                continue
+
+            record = {
+                "number": issue["number"],
+                "title": issue["title"],
+                "state": issue["state"],
+                "user": issue["user"]["login"],
+                "created_at": issue["created_at"],
+                "updated_at": issue["updated_at"],
+                "html_url": issue["html_url"],
+                "labels": [label["name"] for label in issue.get("labels", [])],
+                "pull_request": "pull_request" in issue,
+                "body": issue.get("body")
+            }
+            if include_comments:
+                record["comments"] = [GitHubTools._compact_comment(comment) for comment in comments]
+            records.append(record)
+
+        return records
+
+    @staticmethod
+    def _compact_comment(comment: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "user": comment["user"]["login"],
+            "created_at": comment["created_at"],
+            "body": comment["body"]
+        }
+
+    @staticmethod
+    def _graphql_url() -> str:
+        api_url = GitHubTools._api_url()
+        # GitHub Enterprise serves REST under /api/v3 and GraphQL under /api/graphql
+        default = f"{api_url[:-len('/v3')]}/graphql" if api_url.endswith("/v3") else f"{api_url}/graphql"
+        return os.getenv('GITHUB_GRAPHQL_URL', default)
+
+    @staticmethod
+    def graphql(query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Run a query against the GitHub GraphQL API.
+
+        Args:
+            query (str): The GraphQL query.
+            variables (Dict[str, Any], optional): Values for the query's variables.
+
+        Returns:
+            Dict[str, Any]: The response payload with 'data' and, when some fields failed, 'errors'.
+
+        Raises:
+            ValueError: If GITHUB_TOKEN is not set
+            requests.exceptions.HTTPError: If the API request fails
+            Exception: If the query fails as a whole
+        """
+        headers = GitHubTools._get_headers(auth_required=True)
+        response = get_session().post(GitHubTools._graphql_url(), headers=headers,
+                                      json={"query": query, "variables": variables or {}})
+        response.raise_for_status()
+        payload = response.json()
+        if payload.get("data") is None:
+            messages = "; ".join(error.get("message", "") for error in payload.get("errors", []))
+            raise Exception(f"GitHub GraphQL error: {messages}")
+        return payload
+
+    @staticmethod
+    def get_issues_and_pull_requests(issue_numbers: Optional[List[int]] = None, pull_numbers: Optional[List[int]] = None,
+                                     max_comments: int = 50, max_commits: int = 100, max_files: int = 100) -> Dict[str, Any]:
+        """
+        Fetch several issues and pull requests, with their comments, commits and changed files, using GraphQL.
+        Up to 50 items are fetched per request, instead of several REST requests per item.
+
+        Args:
+            issue_numbers (List[int], optional): Issue numbers to fetch.
+            pull_numbers (List[int], optional): Pull request numbers to fetch.
+            max_comments (int, optional): Maximum comments per item. Defaults to 50.
+            max_commits (int, optional): Maximum commits per pull request. Defaults to 100.
+            max_files (int, optional): Maximum changed files per pull request. Defaults to 100.
+
+        Returns:
+            Dict[str, Any]: A dictionary containing:
+                - issues: The issues, in the order requested
+                - pull_requests: The pull requests, in the order requested
+                - errors: Messages for items that could not be fetched, if any
+
+        Raises:
+            ValueError: If owner and repo are not configured, or GITHUB_TOKEN is not set
+            requests.exceptions.HTTPError: If the API request fails
+        """
+        GitHubTools.configure()
+        items = [("issue", number) for number in issue_numbers or []]
+        items += [("pullRequest", number) for number in pull_numbers or []]
+        limits = {"comments": max_comments, "commits": max_commits, "files": max_files}
+
+        result = {"issues": [], "pull_requests": [], "errors": []}
+        for start in range(0, len(items), GRAPHQL_BATCH_SIZE):
+            batch = items[start:start + GRAPHQL_BATCH_SIZE]
+            fields = []
+            for i, (kind, number) in enumerate(batch):
+                selection = (GRAPHQL_PULL_REQUEST_FIELDS if kind == "pullRequest" else GRAPHQL_ISSUE_FIELDS) % limits
+                fields.append(f"item{i}: {kind}(number: {int(number)}) {{{selection}}}")
+            query = "query($owner: String!, $repo: String!) { repository(owner: $owner, name: $repo) { %s } }" % " ".join(fields)
+
+            payload = GitHubTools.graphql(query, {"owner": GitHubTools._owner, "repo": GitHubTools._repo})
+            repository = payload["data"].get("repository") or {}
+            result["errors"].extend(error.get("message", "") for error in payload.get("errors", []))
+
+            for i, (kind, number) in enumerate(batch):
+                node = repository.get(f"item{i}")
+                if node is None:
+                    continue
+                if kind == "pullRequest":
+                    result["pull_requests"].append(GitHubTools._simplify_graphql_pull_request(node))
+                else:
+                    result["issues"].append(GitHubTools._simplify_graphql_issue(node))
+
+        if not result["errors"]:
+            del result["errors"]
         return result
 
+    @staticmethod
+    def _simplify_graphql_issue(node: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "number": node["number"],
+            "title": node["title"],
+            "state": node["state"].lower(),
+            "created_at": node["createdAt"],
+            "updated_at": node["updatedAt"],
+            "html_url": node["url"],
+            "user": {"login": (node.get("author") or {}).get("login")},
+            "body": node["body"],
+            "comments_count": node["comments"]["totalCount"],
+            "comments": [{
+                "id": comment["databaseId"],
+                "user": {"login": (comment.get("author") or {}).get("login")},
+                "created_at": comment["createdAt"],
+                "updated_at": comment["updatedAt"],
+                "body": comment["body"]
+            } for comment in node["comments"]["nodes"]]
+        }
+
+    @staticmethod
+    def _simplify_graphql_pull_request(node: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            **GitHubTools._simplify_graphql_issue(node),
+            "draft": node["isDraft"],
+            "mergeable": node["mergeable"].lower(),
+            "head": {"ref": node["headRefName"], "sha": node["headRefOid"]},
+            "base": {"ref": node["baseRefName"], "sha": node["baseRefOid"]},
+            "additions": node["additions"],
+            "deletions": node["deletions"],
+            "changed_files": node["changedFiles"],
+            "commits_count": node["commits"]["totalCount"],
+            "commits": [{
+                "sha": item["commit"]["oid"],
+                "message": item["commit"]["message"],
+                "author": {
+                    "name": item["commit"]["author"]["name"],
+                    "email": item["commit"]["author"]["email"],
+                    "date": item["commit"]["authoredDate"]
+                }
+            } for item in node["commits"]["nodes"]],
+            "files": [{
+                "filename": file["path"],
+                "status": file["changeType"].lower(),
+                "additions": file["additions"],
+                "deletions": file["deletions"]
+            } for file in node["files"]["nodes"]]
+        }
+
     @staticmethod
     def create_issue_comment(issue_number: int, body: str) -> Dict[str, Any]:
         """
@@ -545,22 +1073,22 @@ class GitHubTools:
             requests.exceptions.HTTPError: If the API request fails.
         """
         GitHubTools.configure() 
-        base_url = "https://api.github.com"
         headers = GitHubTools._get_headers(auth_required=True)
-        url = f"{base_url}/repos/{GitHubTools._owner}/{GitHubTools._repo}/issues/{issue_number}/comments"
+        url = f"{GitHubTools._repo_url()}/issues/{issue_number}/comments"
 
         data = {"body": body}
-        response = requests.post(url, headers=headers, json=data)
+        response = get_session().post(url, headers=headers, json=data)
         response.raise_for_status()
         return response.json()
 
     @staticmethod
-    def list_repo_issues(state: str = "open") -> List[Dict[str, Any]]:
+    def list_repo_issues(state: str = "open", max_results: Optional[int] = 100) -> List[Dict[str, Any]]:
         """
         List issues in the specified repository.
 
         Args:
             state (str, optional): The state of the issues to return. Can be either 'open', 'closed', or 'all'. Defaults to 'open'.
+            max_results (int, optional): Maximum number of issues to return. Defaults to 100; pass None to fetch every page.
 
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, each containing essential information about an issue.
@@ -570,12 +1098,10 @@ class GitHubTools:
             requests.exceptions.HTTPError: If the API request fails.
         """
         GitHubTools.configure() 
-        base_url = "https://api.github.com"
         headers = GitHubTools._get_headers()
-        url = f"{base_url}/repos/{GitHubTools._owner}/{GitHubTools._repo}/issues"
+        url = f"{GitHubTools._repo_url()}/issues"
         params = {"state": state}
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
+        issues = GitHubTools._get_paginated(url, headers, params, max_results)
 
         def simplify_issue(issue: Dict[str, Any]) -> Dict[str, Any]:
             return {
@@ -593,7 +1119,7 @@ class GitHubTools:
                 "pull_request": "pull_request" in issue
             }
 
-        return [simplify_issue(issue) for issue in response.json()]
+        return [simplify_issue(issue) for issue in issues]
 
     @staticmethod
     def check_github_diff(base: str, head: str, file_path: Optional[str] = None) -> Dict[str, Any]:
@@ -620,9 +1146,9 @@ class GitHubTools:
         headers = GitHubTools._get_headers(auth_required=True)
 
         # Construct URL for the comparison
-        url = f"https://api.github.com/repos/{GitHubTools._owner}/{GitHubTools._repo}/compare/{base}...{head}"
+        url = f"{GitHubTools._repo_url()}/compare/{base}...{head}"
 
-        response = requests.get(url, headers=headers)
+        response = GitHubTools._get(url, headers)
         if response.status_code != 200:
             raise Exception(f"GitHub API error ({response.status_code}): {response.text}")
 
@@ -643,7 +1169,7 @@ class GitHubTools:
         # Get diff content if specific file is requested
         if file_path:
             diff_headers = {**headers, "Accept": "application/vnd.github.v3.diff"}
-            diff_response = requests.get(url, headers=diff_headers)
+            diff_response = GitHubTools._get(url, diff_headers)
             full_diff = diff_response.text
             # Extract specific file diff (basic implementation)
             for diff_section in full_diff.split("diff --git"):
@@ -653,7 +1179,7 @@ class GitHubTools:
         else:
             # Get full diff
             diff_headers = {**headers, "Accept": "application/vnd.github.v3.diff"}
-            diff_response = requests.get(url, headers=diff_headers)
+            diff_response = GitHubTools._get(url, diff_headers)
             result["diff"] = diff_response.text
 
         # Process files and stats
@@ -694,9 +1220,8 @@ class GitHubTools:
         """
         GitHubTools.configure() 
         headers = GitHubTools._get_headers(auth_required=True)
-        base_url = "https://api.github.com"
 
-        url = f"{base_url}/repos/{GitHubTools._owner}/{GitHubTools._repo}/contents/{path}"
+        url = f"{GitHubTools._repo_url()}/contents/{path}"
 
         # Try to get existing file's SHA
         try:
@@ -716,7 +1241,7 @@ class GitHubTools:
         if sha:
             data["sha"] = sha
 
-        response = requests.put(url, headers=headers, json=data)
+        response = get_session().put(url, headers=headers, json=data)
         response.raise_for_status()
         return response.json()
     
@@ -733,11 +1258,10 @@ class GitHubTools:
             requests.exceptions.HTTPError: If the API request fails
         """
         GitHubTools.configure() 
-        base_url = "https://api.github.com"
         headers = GitHubTools._get_headers()
-        url = f"{base_url}/repos/{GitHubTools._owner}/{GitHubTools._repo}"
+        url = f"{GitHubTools._repo_url()}"
 
-        response = requests.get(url, headers=headers)
+        response = GitHubTools._get(url, headers)
         response.raise_for_status()
         return response.json()["default_branch"]
 
@@ -759,23 +1283,22 @@ class GitHubTools:
         GitHubTools.configure() 
         # Get the default branch's SHA
         default_branch = GitHubTools.get_default_branch()
-        base_url = "https://api.github.com"
         headers = GitHubTools._get_headers(auth_required=True)
 
         # Get the SHA of the default branch's HEAD
-        ref_url = f"{base_url}/repos/{GitHubTools._owner}/{GitHubTools._repo}/git/ref/heads/{default_branch}"
-        ref_response = requests.get(ref_url, headers=headers)
+        ref_url = f"{GitHubTools._repo_url()}/git/ref/heads/{default_branch}"
+        ref_response = GitHubTools._get(ref_url, headers)
         ref_response.raise_for_status()
         base_sha = ref_response.json()["object"]["sha"]
 
         # Create new branch
-        create_url = f"{base_url}/repos/{GitHubTools._owner}/{GitHubTools._repo}/git/refs"
+        create_url = f"{GitHubTools._repo_url()}/git/refs"
         data = {
             "ref": f"refs/heads/{branch_name}",
             "sha": base_sha
         }
 
-        response = requests.post(create_url, headers=headers, json=data)
+        response = get_session().post(create_url, headers=headers, json=data)
         response.raise_for_status()
         return response.json()
 
@@ -798,10 +1321,9 @@ class GitHubTools:
             requests.exceptions.HTTPError: If the API request fails
         """
         GitHubTools.configure() 
-        base_url = "https://api.github.com"
         headers = GitHubTools._get_headers(auth_required=True)
 
-        url = f"{base_url}/repos/{GitHubTools._owner}/{GitHubTools._repo}/contents/{path}"
+        url = f"{GitHubTools._repo_url()}/contents/{path}"
 
         # Get current file info if it exists
         try:
@@ -821,7 +1343,7 @@ class GitHubTools:
         if sha:
             data["sha"] = sha
 
-        response = requests.put(url, headers=headers, json=data)
+        response = get_session().put(url, headers=headers, json=data)
         response.raise_for_status()
         return response.json()
 
@@ -844,9 +1366,8 @@ class GitHubTools:
             requests.exceptions.HTTPError: If the API request fails
         """
         GitHubTools.configure() 
-        base_url = "https://api.github.com"
         headers = GitHubTools._get_headers(auth_required=True)
-        url = f"{base_url}/repos/{GitHubTools._owner}/{GitHubTools._repo}/pulls"
+        url = f"{GitHubTools._repo_url()}/pulls"
 
         data = {
             "title": title,
@@ -855,7 +1376,7 @@ class GitHubTools:
             "base": base
         }
 
-        response = requests.post(url, headers=headers, json=data)
+        response = get_session().post(url, headers=headers, json=data)
         response.raise_for_status()
         return response.json()
 
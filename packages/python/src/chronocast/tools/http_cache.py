@@ -0,0 +1,332 @@
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+import requests
+from requests.structures import CaseInsensitiveDict
+from .http_utils import get_session
+
+# Default freshness lifetimes (seconds) per tool namespace. These override the server's Cache-Control
+# headers, which most JSON APIs omit. Edit this dict or use configure_http_cache to change them.
+DEFAULT_TTLS: Dict[str, int] = {
+    "weather": 10 * 60,
+    "serper": 30 * 60,
+    "exa": 30 * 60,
+    "arxiv": 6 * 60 * 60,
+    "wikipedia": 24 * 60 * 60,
+}
+
+# How long (seconds) an expired entry may still be served while it is refreshed in the background
+DEFAULT_STALE_WHILE_REVALIDATE: Dict[str, int] = {
+    "weather": 5 * 60,
+    "serper": 30 * 60,
+    "exa": 30 * 60,
+    "arxiv": 24 * 60 * 60,
+    "wikipedia": 7 * 24 * 60 * 60,
+}
+
+CACHEABLE_STATUS_CODES = {200, 203}
+
+class HTTPCache:
+    def __init__(self, directory: Optional[str] = None, ttls: Optional[Dict[str, int]] = None,
+                 stale_while_revalidate: Optional[Dict[str, int]] = None, enabled: bool = True):
+        """
+        Initialize an on-disk HTTP response cache.
+
+        Args:
+            directory (str, optional): Directory for the cache database. Defaults to the CHRONOCAST_HTTP_CACHE_DIR
+                environment variable, or ~/.cache/chronocast.
+            ttls (Dict[str, int], optional): Freshness lifetime in seconds per namespace. Defaults to DEFAULT_TTLS.
+            stale_while_revalidate (Dict[str, int], optional): Seconds per namespace an expired response may be served
+                while it is revalidated in the background. Defaults to DEFAULT_STALE_WHILE_REVALIDATE.
+            enabled (bool, optional): Whether responses are cached. Defaults to True.
+        """
+        self.directory = directory or os.getenv("CHRONOCAST_HTTP_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "chronocast")
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.stale_while_revalidate = dict(DEFAULT_STALE_WHILE_REVALIDATE if stale_while_revalidate is None else stale_while_revalidate)
+        self.enabled = enabled
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._stats_lock = threading.Lock()
+        self._revalidating: set = set()
+
+    def request(self, method: str, url: str, namespace: str = "default", ttl: Optional[int] = None,
+                stale_while_revalidate: Optional[int] = None, **kwargs) -> requests.Response:
+        """
+        Send a request through the cache. Takes the same keyword arguments as requests.request.
+
+        Fresh cached responses are returned without a request. Expired responses are served immediately while
+        being refreshed in the background if they are within their stale-while-revalidate window, and are otherwise
+        revalidated with If-None-Match / If-Modified-Since when the server provided an ETag or Last-Modified header.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Request URL.
+            namespace (str, optional): Tool namespace used for TTL defaults and metrics. Defaults to "default".
+            ttl (int, optional): Freshness lifetime override in seconds for this call.
+            stale_while_revalidate (int, optional): Stale-while-revalidate window override in seconds for this call.
+
+        Returns:
+            requests.Response: The live or cached response.
+        """
+        if not self.enabled:
+            return get_session().request(method, url, **kwargs)
+
+        key = self._cache_key(method, url, kwargs)
+        entry = self._load(key)
+        now = time.time()
+
+        if entry is not None:
+            if now < entry["fresh_until"]:
+                self._record(namespace, "hits")
+                return self._to_response(entry, url)
+
+            swr = entry["stale_until"] - entry["fresh_until"] if stale_while_revalidate is None else stale_while_revalidate
+            if now < entry["fresh_until"] + swr:
+                self._record(namespace, "stale_hits")
+                self._revalidate_in_background(key, method, url, namespace, ttl, stale_while_revalidate, entry, kwargs)
+                return self._to_response(entry, url)
+
+        return self._fetch(key, method, url, namespace, ttl, stale_while_revalidate, entry, kwargs)
+
+    def get(self, url: str, namespace: str = "default", **kwargs) -> requests.Response:
+        """Send a cached GET request."""
+        return self.request("GET", url, namespace=namespace, **kwargs)
+
+    def post(self, url: str, namespace: str = "default", **kwargs) -> requests.Response:
+        """Send a cached POST request. Only use this for side-effect-free APIs such as search endpoints."""
+        return self.request("POST", url, namespace=namespace, **kwargs)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get cache metrics per namespace since the process started.
+
+        Returns:
+            Dict[str, Dict[str, int]]: For each namespace, counts of 'hits', 'stale_hits', 'revalidated' (304 responses)
+                and 'misses'.
+        """
+        with self._stats_lock:
+            return {namespace: dict(counts) for namespace, counts in self._stats.items()}
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """
+        Remove cached responses.
+
+        Args:
+            namespace (str, optional): Only clear this namespace. Defaults to clearing everything.
+        """
+        with self._db_lock:
+            db = self._connection()
+            if namespace is None:
+                db.execute("DELETE FROM responses")
+            else:
+                db.execute("DELETE FROM responses WHERE namespace = ?", (namespace,))
+            db.commit()
+
+    def _fetch(self, key: str, method: str, url: str, namespace: str, ttl: Optional[int],
+               stale_while_revalidate: Optional[int], entry: Optional[Dict[str, Any]], kwargs: Dict[str, Any]) -> requests.Response:
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry is not None:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = get_session().request(method, url, headers=headers, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            self._record(namespace, "revalidated")
+            # Merge refreshed headers (e.g. a new Cache-Control) into the stored ones
+            merged = CaseInsensitiveDict(entry["headers"])
+            merged.update(response.headers)
+            entry["headers"] = self._storable_headers(merged)
+            self._store(key, namespace, merged, entry["status"], entry["body"], ttl, stale_while_revalidate)
+            return self._to_response(entry, url)
+
+        self._record(namespace, "misses")
+        if response.status_code in CACHEABLE_STATUS_CODES:
+            self._store(key, namespace, response.headers, response.status_code, response.content, ttl, stale_while_revalidate)
+        return response
+
+    def _revalidate_in_background(self, key: str, method: str, url: str, namespace: str, ttl: Optional[int],
+                                  stale_while_revalidate: Optional[int], entry: Dict[str, Any], kwargs: Dict[str, Any]) -> None:
+        with self._stats_lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+
+        def revalidate():
+            try:
+                self._fetch(key, method, url, namespace, ttl, stale_while_revalidate, entry, dict(kwargs))
+            except requests.exceptions.RequestException:
+                pass  # Keep serving the stale entry; the next request will retry
+            finally:
+                with self._stats_lock:
+                    self._revalidating.discard(key)
+
+        threading.Thread(target=revalidate, daemon=True).start()
+
+    def _store(self, key: str, namespace: str, headers: Any, status: int, body: bytes,
+               ttl: Optional[int], stale_while_revalidate: Optional[int]) -> None:
+        headers = CaseInsensitiveDict(headers)
+        directives = self._cache_control(headers.get("Cache-Control", ""))
+        if "no-store" in directives or "private" in directives:
+            return
+
+        if ttl is None:
+            ttl = self.ttls.get(namespace)
+        if ttl is None:
+            ttl = self._server_freshness(headers, directives)
+        if "no-cache" in directives and namespace not in self.ttls:
+            ttl = 0
+
+        if stale_while_revalidate is None:
+            stale_while_revalidate = self.stale_while_revalidate.get(namespace)
+        if stale_while_revalidate is None:
+            stale_while_revalidate = self._int_directive(directives, "stale-while-revalidate")
+
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if ttl <= 0 and stale_while_revalidate <= 0 and not etag and not last_modified:
+            return  # Nothing would ever be served from this entry
+
+        now = time.time()
+        with self._db_lock:
+            db = self._connection()
+            db.execute(
+                "INSERT OR REPLACE INTO responses (key, namespace, status, headers, body, etag, last_modified, fresh_until, stale_until) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, namespace, status, json.dumps(self._storable_headers(headers)), body, etag, last_modified,
+                 now + ttl, now + ttl + stale_while_revalidate)
+            )
+            db.commit()
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._db_lock:
+            row = self._connection().execute(
+                "SELECT status, headers, body, etag, last_modified, fresh_until, stale_until FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        status, headers, body, etag, last_modified, fresh_until, stale_until = row
+        return {"status": status, "headers": json.loads(headers), "body": body, "etag": etag,
+                "last_modified": last_modified, "fresh_until": fresh_until, "stale_until": stale_until}
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._db is None:
+            os.makedirs(self.directory, exist_ok=True)
+            db = sqlite3.connect(os.path.join(self.directory, "http_cache.sqlite"), check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, namespace TEXT, status INTEGER, headers TEXT, "
+                "body BLOB, etag TEXT, last_modified TEXT, fresh_until REAL, stale_until REAL)"
+            )
+            self._db = db
+        return self._db
+
+    def _record(self, namespace: str, event: str) -> None:
+        with self._stats_lock:
+            counts = self._stats.setdefault(namespace, {"hits": 0, "stale_hits": 0, "revalidated": 0, "misses": 0})
+            counts[event] += 1
+
+    @staticmethod
+    def _storable_headers(headers: Any) -> Dict[str, str]:
+        # Drop transfer-level headers: the stored body is already decoded
+        return {k: v for k, v in headers.items() if k.lower() not in ("content-encoding", "transfer-encoding", "content-length")}
+
+    @staticmethod
+    def _cache_key(method: str, url: str, kwargs: Dict[str, Any]) -> str:
+        # Request headers (which carry API keys) are deliberately left out of the key
+        prepared = requests.Request(method.upper(), url, params=kwargs.get("params"), data=kwargs.get("data"),
+                                    json=kwargs.get("json")).prepare()
+        body = prepared.body or b""
+        if isinstance(body, str):
+            body = body.encode()
+        return hashlib.sha256(f"{prepared.method} {prepared.url}\n".encode() + body).hexdigest()
+
+    @staticmethod
+    def _cache_control(value: str) -> Dict[str, Optional[str]]:
+        directives = {}
+        for part in value.split(","):
+            name, _, argument = part.strip().partition("=")
+            if name:
+                directives[name.lower()] = argument.strip('"') or None
+        return directives
+
+    @staticmethod
+    def _int_directive(directives: Dict[str, Optional[str]], name: str) -> int:
+        value = directives.get(name)
+        return int(value) if value and re.fullmatch(r"\d+", value) else 0
+
+    @classmethod
+    def _server_freshness(cls, headers: CaseInsensitiveDict, directives: Dict[str, Optional[str]]) -> int:
+        if "s-maxage" in directives or "max-age" in directives:
+            return cls._int_directive(directives, "s-maxage") or cls._int_directive(directives, "max-age")
+        if headers.get("Expires"):
+            try:
+                expires = parsedate_to_datetime(headers["Expires"]).timestamp()
+                date = parsedate_to_datetime(headers["Date"]).timestamp() if headers.get("Date") else time.time()
+                return max(0, int(expires - date))
+            except (TypeError, ValueError):
+                return 0
+        return 0
+
+    @staticmethod
+    def _to_response(entry: Dict[str, Any], url: str) -> requests.Response:
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = entry["body"]
+        response.url = url
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        return response
+
+
+_default_cache: Optional[HTTPCache] = None
+_default_cache_lock = threading.Lock()
+
+def get_http_cache() -> HTTPCache:
+    """Return the HTTP cache shared by the tools package. Set CHRONOCAST_HTTP_CACHE=0 to disable it."""
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                enabled = os.getenv("CHRONOCAST_HTTP_CACHE", "1").lower() not in ("0", "false", "no")
+                _default_cache = HTTPCache(enabled=enabled)
+    return _default_cache
+
+def configure_http_cache(directory: Optional[str] = None, ttls: Optional[Dict[str, int]] = None,
+                         stale_while_revalidate: Optional[Dict[str, int]] = None, enabled: bool = True) -> HTTPCache:
+    """
+    Replace the shared HTTP cache used by the tools package.
+
+    Args:
+        directory (str, optional): Directory for the cache database.
+        ttls (Dict[str, int], optional): Freshness lifetimes per namespace, merged over DEFAULT_TTLS.
+        stale_while_revalidate (Dict[str, int], optional): Stale-while-revalidate windows per namespace,
+            merged over DEFAULT_STALE_WHILE_REVALIDATE.
+        enabled (bool, optional): Whether responses are cached. Defaults to True.
+
+    Returns:
+        HTTPCache: The new shared cache.
+    """
+    global _default_cache
+    with _default_cache_lock:
+        _default_cache = HTTPCache(
+            directory=directory,
+            ttls={**DEFAULT_TTLS, **(ttls or {})},
+            stale_while_revalidate={**DEFAULT_STALE_WHILE_REVALIDATE, **(stale_while_revalidate or {})},
+            enabled=enabled,
+        )
+    return _default_cache
+
+def get_http_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Return hit and miss counts per tool namespace for the shared HTTP cache."""
+    return get_http_cache().stats()
@@ -0,0 +1,106 @@
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from fake_useragent import UserAgent
+
+_user_agent: Optional[UserAgent] = None
+_user_agent_lock = threading.Lock()
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+def get_session() -> requests.Session:
+    """Return the process-wide requests session shared by the tools, so connections are pooled and kept alive across calls."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+def get_user_agent() -> UserAgent:
+    """Return a process-wide UserAgent instance; building one loads its browser database from disk."""
+    global _user_agent
+    if _user_agent is None:
+        with _user_agent_lock:
+            if _user_agent is None:
+                _user_agent = UserAgent()
+    return _user_agent
+
+def run_sync(coroutine: Awaitable[Any]) -> Any:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Tools are called synchronously from inside the host's running event loop, where asyncio.run
+    is not allowed, so in that case the coroutine runs on its own loop in a worker thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+def request_with_backoff(send: Callable[[], requests.Response], retries: int = 3, base_delay: float = 0.5,
+                         max_delay: float = 8.0) -> requests.Response:
+    """
+    Call `send` until it returns a non-retryable response, backing off exponentially with jitter.
+
+    Rate-limit (429) and transient server errors (5xx) are retried, honouring a numeric Retry-After header;
+    connection errors and timeouts are retried as well. The last response is returned, or the last
+    exception re-raised, once the retries are exhausted.
+    """
+    for attempt in range(retries + 1):
+        try:
+            response = send()
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if attempt == retries:
+                raise
+            time.sleep(min(max_delay, base_delay * 2 ** attempt) * random.uniform(0.5, 1.5))
+            continue
+
+        if response.status_code not in RETRYABLE_STATUS_CODES or attempt == retries:
+            return response
+
+        retry_after = response.headers.get("Retry-After", "")
+        delay = float(retry_after) if retry_after.replace(".", "", 1).isdigit() else base_delay * 2 ** attempt
+        time.sleep(min(max_delay, delay) * random.uniform(0.5, 1.5))
+
+class RateLimiter:
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Thread-safe token bucket limiting callers to `rate` acquisitions per second.
+
+        Args:
+            rate (float): Sustained acquisitions per second.
+            burst (int, optional): Acquisitions allowed back to back after an idle period. Defaults to 1.
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
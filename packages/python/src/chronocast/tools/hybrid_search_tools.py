@@ -0,0 +1,275 @@
+import os
+import re
+import json
+import math
+from collections import Counter
+from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
+from .embedding_tools import EmbeddingsTools
+from .faiss_tools import FAISSTools
+from .pinecone_tools import _matches_filter
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokenizer used for BM25 indexing and queries."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+class BM25Index:
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        Initialize an in-memory BM25 inverted index.
+
+        Args:
+            k1 (float, optional): Term frequency saturation parameter. Defaults to 1.5.
+            b (float, optional): Document length normalization parameter. Defaults to 0.75.
+        """
+        self.k1 = k1
+        self.b = b
+        self.doc_lengths: List[int] = []
+        self._postings: Dict[str, Tuple[List[int], List[int]]] = {}
+        # Postings converted to arrays on first search after an update
+        self._arrays: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def add_documents(self, texts: List[str]) -> None:
+        """
+        Add documents to the index. Document IDs are assigned sequentially in insertion order.
+
+        Args:
+            texts (List[str]): The documents to index.
+        """
+        for text in texts:
+            doc_id = len(self.doc_lengths)
+            tokens = tokenize(text)
+            self.doc_lengths.append(len(tokens))
+            for term, count in Counter(tokens).items():
+                doc_ids, counts = self._postings.setdefault(term, ([], []))
+                doc_ids.append(doc_id)
+                counts.append(count)
+                self._arrays.pop(term, None)
+
+    def search(self, query: str, top_k: int = 10, allowed: Optional[np.ndarray] = None) -> List[Tuple[int, float]]:
+        """
+        Score documents against a query with BM25.
+
+        Args:
+            query (str): The query text.
+            top_k (int, optional): Number of results to return. Defaults to 10.
+            allowed (np.ndarray, optional): Boolean mask over document IDs; documents outside it are skipped.
+
+        Returns:
+            List[Tuple[int, float]]: (document ID, score) pairs, best first. Documents sharing no terms with the query are omitted.
+        """
+        num_docs = len(self.doc_lengths)
+        if num_docs == 0:
+            return []
+
+        lengths = np.asarray(self.doc_lengths, dtype=np.float32)
+        avg_length = lengths.mean() or 1.0
+        scores = np.zeros(num_docs, dtype=np.float32)
+        matched = np.zeros(num_docs, dtype=bool)
+
+        for term in set(tokenize(query)):
+            postings = self._term_arrays(term)
+            if postings is None:
+                continue
+            doc_ids, counts = postings
+            idf = math.log(1 + (num_docs - len(doc_ids) + 0.5) / (len(doc_ids) + 0.5))
+            norm = self.k1 * (1 - self.b + self.b * lengths[doc_ids] / avg_length)
+            scores[doc_ids] += idf * counts * (self.k1 + 1) / (counts + norm)
+            matched[doc_ids] = True
+
+        if allowed is not None:
+            matched &= allowed
+        candidates = np.flatnonzero(matched)
+        if len(candidates) > top_k:
+            candidates = candidates[np.argpartition(-scores[candidates], top_k - 1)[:top_k]]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(int(doc_id), float(scores[doc_id])) for doc_id in candidates]
+
+    def _term_arrays(self, term: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        arrays = self._arrays.get(term)
+        if arrays is None:
+            postings = self._postings.get(term)
+            if postings is None:
+                return None
+            arrays = (np.asarray(postings[0], dtype=np.int64), np.asarray(postings[1], dtype=np.float32))
+            self._arrays[term] = arrays
+        return arrays
+
+class HybridSearchTools:
+    def __init__(self, embedding_provider: str = "openai", embedding_model: str = "text-embedding-3-small",
+                 rrf_k: int = 60, bm25_weight: float = 1.0, vector_weight: float = 1.0,
+                 candidates: int = 50, k1: float = 1.5, b: float = 0.75, batch_size: int = 512):
+        """
+        Initialize a local hybrid retriever combining BM25 lexical search with FAISS vector search.
+
+        Args:
+            embedding_provider (str, optional): The embedding provider. Defaults to "openai".
+            embedding_model (str, optional): The embedding model. Defaults to "text-embedding-3-small".
+            rrf_k (int, optional): Reciprocal-rank fusion constant; larger values flatten the influence of top ranks. Defaults to 60.
+            bm25_weight (float, optional): Weight of the BM25 ranking in the fused score. Defaults to 1.0.
+            vector_weight (float, optional): Weight of the vector ranking in the fused score. Defaults to 1.0.
+            candidates (int, optional): Number of candidates taken from each retriever before fusion. Defaults to 50.
+            k1 (float, optional): BM25 term frequency saturation parameter. Defaults to 1.5.
+            b (float, optional): BM25 document length normalization parameter. Defaults to 0.75.
+            batch_size (int, optional): Number of texts per embedding request when indexing. Defaults to 512.
+        """
+        self.embedding_provider = embedding_provider
+        self.embedding_model = embedding_model
+        self.rrf_k = rrf_k
+        self.bm25_weight = bm25_weight
+        self.vector_weight = vector_weight
+        self.candidates = candidates
+        self.batch_size = batch_size
+
+        self.bm25 = BM25Index(k1=k1, b=b)
+        self.vectors = FAISSTools(EmbeddingsTools.get_model_dimension(embedding_provider, embedding_model), metric="IP")
+        self.vectors.create_index()
+        self.vectors.set_embedding_info(embedding_provider, embedding_model)
+
+        self.documents: List[str] = []
+        self.doc_ids: List[str] = []
+        self.metadatas: List[Dict[str, Any]] = []
+
+    def add_documents(self, texts: List[str], metadatas: Optional[List[Dict[str, Any]]] = None,
+                      ids: Optional[List[str]] = None, embeddings: Optional[np.ndarray] = None) -> None:
+        """
+        Index documents for both lexical and vector search.
+
+        Args:
+            texts (List[str]): The documents to index.
+            metadatas (List[Dict[str, Any]], optional): Metadata for each document, used by search filters.
+            ids (List[str], optional): Identifiers for each document. Defaults to their position in the index.
+            embeddings (np.ndarray, optional): Precomputed embeddings. If not provided, texts are embedded in batches.
+        """
+        if metadatas is not None and len(metadatas) != len(texts):
+            raise ValueError("metadatas must have the same length as texts")
+        if ids is not None and len(ids) != len(texts):
+            raise ValueError("ids must have the same length as texts")
+        if not texts:
+            return
+
+        if embeddings is None:
+            embeddings = self._embed(texts)
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+
+        start = len(self.documents)
+        self.vectors.add_vectors(embeddings)
+        self.bm25.add_documents(texts)
+        self.documents.extend(texts)
+        self.metadatas.extend(metadatas or [{} for _ in texts])
+        self.doc_ids.extend(ids or [str(start + i) for i in range(len(texts))])
+
+    def hybrid_search(self, query: str, top_k: int = 5, filter: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Search the local knowledge base with combined keyword (BM25) and semantic (vector) retrieval.
+        Exact names, tickers and titles are matched by keyword search while paraphrased questions are matched semantically.
+
+        Args:
+            query (str): The search query.
+            top_k (int, optional): Number of results to return. Defaults to 5.
+            filter (Dict[str, Any], optional): Metadata filter, e.g. {"show": "markets"} or {"year": {"$gte": 2024}}.
+
+        Returns:
+            List[Dict[str, Any]]: Results with 'id', 'text', 'metadata', 'score', 'bm25_rank' and 'vector_rank', best first.
+        """
+        return self.hybrid_search_batch([query], top_k=top_k, filter=filter)[0]
+
+    def hybrid_search_batch(self, queries: List[str], top_k: int = 5, filter: Optional[Dict[str, Any]] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Run several hybrid searches at once, embedding all queries in a single request.
+
+        Args:
+            queries (List[str]): The search queries.
+            top_k (int, optional): Number of results to return per query. Defaults to 5.
+            filter (Dict[str, Any], optional): Metadata filter applied to every query.
+
+        Returns:
+            List[List[Dict[str, Any]]]: The results for each query, in the same order as the queries.
+        """
+        if not queries:
+            return []
+        if not self.documents:
+            return [[] for _ in queries]
+
+        allowed = None
+        filter_ids = None
+        if filter:
+            allowed = np.array([_matches_filter(metadata, filter) for metadata in self.metadatas], dtype=bool)
+            filter_ids = np.flatnonzero(allowed)
+            if len(filter_ids) == 0:
+                return [[] for _ in queries]
+
+        pool = max(self.candidates, top_k)
+        query_vectors = np.asarray(self._embed(queries), dtype=np.float32)
+        _, vector_hits = self.vectors.search_vectors(query_vectors, min(pool, len(self.documents)), filter_ids=filter_ids)
+
+        results = []
+        for query, hits in zip(queries, vector_hits):
+            vector_ranking = [int(doc_id) for doc_id in hits if doc_id >= 0]
+            bm25_ranking = [doc_id for doc_id, _ in self.bm25.search(query, pool, allowed)]
+            results.append(self._fuse(bm25_ranking, vector_ranking, top_k))
+        return results
+
+    def save(self, path: str) -> None:
+        """
+        Save the index, documents and metadata to disk.
+
+        Args:
+            path (str): Path of the FAISS index file. Documents are stored alongside it in `{path}.documents`.
+        """
+        self.vectors.save_index(path)
+        with open(f"{path}.documents", 'w') as f:
+            json.dump({"documents": self.documents, "ids": self.doc_ids, "metadatas": self.metadatas}, f)
+
+    def load(self, path: str) -> None:
+        """
+        Load an index saved with `save`. The BM25 index is rebuilt from the stored documents.
+
+        Args:
+            path (str): Path of the FAISS index file.
+
+        Raises:
+            FileNotFoundError: If the index or documents file is not found.
+        """
+        documents_path = f"{path}.documents"
+        if not os.path.exists(documents_path):
+            raise FileNotFoundError(f"Documents file not found: {documents_path}")
+        self.vectors.load_index(path)
+        with open(documents_path, 'r') as f:
+            data = json.load(f)
+
+        self.documents = data["documents"]
+        self.doc_ids = data["ids"]
+        self.metadatas = data["metadatas"]
+        self.bm25 = BM25Index(k1=self.bm25.k1, b=self.bm25.b)
+        self.bm25.add_documents(self.documents)
+
+    def _fuse(self, bm25_ranking: List[int], vector_ranking: List[int], top_k: int) -> List[Dict[str, Any]]:
+        scores: Dict[int, float] = {}
+        ranks: Dict[int, Dict[str, Optional[int]]] = {}
+        for name, weight, ranking in (("bm25_rank", self.bm25_weight, bm25_ranking),
+                                      ("vector_rank", self.vector_weight, vector_ranking)):
+            for rank, doc_id in enumerate(ranking, start=1):
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight / (self.rrf_k + rank)
+                ranks.setdefault(doc_id, {"bm25_rank": None, "vector_rank": None})[name] = rank
+
+        best = sorted(scores, key=scores.get, reverse=True)[:top_k]
+        return [
+            {
+                "id": self.doc_ids[doc_id],
+                "text": self.documents[doc_id],
+                "metadata": self.metadatas[doc_id],
+                "score": scores[doc_id],
+                **ranks[doc_id],
+            }
+            for doc_id in best
+        ]
+
+    def _embed(self, texts: List[str]) -> List[List[float]]:
+        embeddings = []
+        for i in range(0, len(texts), self.batch_size):
+            batch, _ = EmbeddingsTools.get_embeddings(texts[i:i + self.batch_size], self.embedding_provider, self.embedding_model)
+            embeddings.extend(batch)
+        return embeddings
@@ -1,8 +1,149 @@
 import os
-import requests
-from typing import Dict, List, Optional, Union
+import re
+import time
+import asyncio
+import threading
+import weakref
+import httpx
+from typing import Any, Dict, List, Optional, Tuple, Union
+from .http_utils import get_session
+
+LINEAR_API_URL = 'https://api.linear.app/graphql'
+
+# Matches an operation's header: `query Name($a: String!) {`, `mutation {` or the shorthand `{`
+OPERATION_HEADER = re.compile(r"^\s*(?:(query|mutation)\b\s*(\w+)?\s*(?:\((?P<definitions>[^)]*)\))?\s*)?\{", re.S)
+NAME_START = re.compile(r"[_A-Za-z]")
+NAME = re.compile(r"[_A-Za-z][_0-9A-Za-z]*")
+ALIAS_SEPARATOR = re.compile(r"\s*:\s*")
+VARIABLE = re.compile(r"\$(\w+)")
+
+def _skip_string(text: str, i: int) -> int:
+    """Return the index just past the string literal starting at text[i]."""
+    quote = '"""' if text.startswith('"""', i) else '"'
+    i += len(quote)
+    while i < len(text):
+        if text[i] == "\\":
+            i += 2
+        elif text.startswith(quote, i):
+            return i + len(quote)
+        else:
+            i += 1
+    return i
+
+def _selection_end(text: str, i: int) -> int:
+    """Return the index of the brace closing the selection set whose body starts at text[i], or -1."""
+    depth = 1
+    while i < len(text):
+        char = text[i]
+        if char == '"':
+            i = _skip_string(text, i)
+            continue
+        if char == "#":
+            newline = text.find("\n", i)
+            i = len(text) if newline == -1 else newline
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return -1
+
+def _alias_root_fields(body: str, prefix: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Prefix the response key of every root field in a selection set, so that several operations' fields
+    can share one document. Returns the rewritten selection set and a map of new to original keys.
+    """
+    out = []
+    keys = {}
+    depth = parens = 0
+    previous = ""
+    i = 0
+    while i < len(body):
+        char = body[i]
+        if char == '"':
+            end = _skip_string(body, i)
+            out.append(body[i:end])
+            i = end
+            previous = '"'
+            continue
+        if char == "#":
+            # Comments run to the end of the line; copy them through untouched
+            newline = body.find("\n", i)
+            end = len(body) if newline == -1 else newline
+            out.append(body[i:end])
+            i = end
+            continue
+        if char in "{}()":
+            depth += {"{": 1, "}": -1}.get(char, 0)
+            parens += {"(": 1, ")": -1}.get(char, 0)
+        elif depth == 0 and parens == 0 and NAME_START.match(char):
+            name = NAME.match(body, i).group(0)
+            i += len(name)
+            if previous == "@":
+                # Directive, not a field
+                out.append(name)
+                previous = name[-1]
+                continue
+            alias = name
+            # An existing alias is followed by ':' and the field name
+            separator = ALIAS_SEPARATOR.match(body, i)
+            if separator:
+                i = separator.end()
+                name = NAME.match(body, i).group(0)
+                i += len(name)
+            keys[f"{prefix}{alias}"] = alias
+            out.append(f"{prefix}{alias}: {name}")
+            previous = name[-1]
+            continue
+        out.append(char)
+        if not char.isspace():
+            previous = char
+        i += 1
+    return "".join(out), keys
+
+def _merge_operations(operations: List[Tuple[str, Optional[Dict[str, Any]]]], kind: str,
+                      indices: List[int]) -> Tuple[str, Dict[str, Any], Dict[str, Tuple[int, str]]]:
+    """
+    Merge operations of one kind into a single document. Variables and root fields are prefixed with the
+    operation's index; the returned map gives each merged response key's operation index and original key.
+    """
+    definitions = []
+    selections = []
+    variables = {}
+    keys = {}
+    for index in indices:
+        query, operation_variables = operations[index]
+        match = OPERATION_HEADER.match(query)
+        if not match:
+            raise ValueError(f"Cannot batch operation {index}: expected a query or mutation document")
+        end = _selection_end(query, match.end())
+        if end == -1:
+            raise ValueError(f"Cannot batch operation {index}: unbalanced braces")
+        if re.sub(r"#[^\n]*", "", query[end + 1:]).strip():
+            raise ValueError(f"Cannot batch operation {index}: documents with fragments or several definitions cannot be batched")
+        prefix = f"op{index}_"
+        rename = lambda m: f"${prefix}{m.group(1)}"
+        body, operation_keys = _alias_root_fields(VARIABLE.sub(rename, query[match.end():end]), prefix)
+        selections.append(body)
+        keys.update({key: (index, original) for key, original in operation_keys.items()})
+        if match.group("definitions"):
+            definitions.append(VARIABLE.sub(rename, match.group("definitions")))
+        variables.update({f"{prefix}{name}": value for name, value in (operation_variables or {}).items()})
+
+    header = f"{kind} Batch({', '.join(definitions)})" if definitions else kind
+    return f"{header} {{\n{''.join(selections)}\n}}", variables, keys
 
 class LinearTools:
+    _instance: Optional["LinearTools"] = None
+    _instance_lock = threading.Lock()
+    # Slow-changing data (teams, workflow states) cached as key -> (expiry time, value)
+    _cache: Dict[str, Tuple[float, Any]] = {}
+    _cache_lock = threading.Lock()
+    cache_ttl: float = 300.0
+
     def __init__(self):
         """
         Initialize Linear API client with authentication.
@@ -15,17 +156,29 @@ class LinearTools:
         if not self.team_id:
             raise ValueError("LINEAR_TEAM_ID environment variable is required")
         
-        self.url = 'https://api.linear.app/graphql'
+        self.url = os.getenv('LINEAR_API_URL', LINEAR_API_URL)
         self.headers = {
             'Authorization': self.api_key,
             'Content-Type': 'application/json'
         }
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def _shared(cls) -> "LinearTools":
+        """Return the client shared by the class methods, rebuilt only when the environment changes."""
+        with cls._instance_lock:
+            instance = cls._instance
+            if (instance is None or instance.api_key != os.getenv('LINEAR_API_KEY')
+                    or instance.team_id != os.getenv('LINEAR_TEAM_ID')
+                    or instance.url != os.getenv('LINEAR_API_URL', LINEAR_API_URL)):
+                instance = cls._instance = cls()
+            return instance
 
     def _execute_query(self, query: str, variables: Dict = None) -> Dict:
         """
-        Execute a GraphQL query using requests
+        Execute a GraphQL query on the pooled session
         """
-        response = requests.post(
+        response = get_session().post(
             self.url,
             headers=self.headers,
             json={'query': query, 'variables': variables}
@@ -33,10 +186,127 @@ class LinearTools:
         response.raise_for_status()
         return response.json()
 
+    async def _aexecute_query(self, query: str, variables: Dict = None) -> Dict:
+        """
+        Execute a GraphQL query with an async client pooled per event loop
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = httpx.AsyncClient(headers=self.headers, timeout=30)
+        response = await client.post(self.url, json={'query': query, 'variables': variables})
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _plan_batch(operations: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Tuple[str, Dict[str, Any], Dict[str, Tuple[int, str]]]]:
+        # Queries and mutations can't share a document, so each kind becomes one request
+        kinds = {}
+        for index, (query, _) in enumerate(operations):
+            match = OPERATION_HEADER.match(query)
+            kinds.setdefault((match.group(1) if match else None) or "query", []).append(index)
+        return [_merge_operations(operations, kind, indices) for kind, indices in kinds.items()]
+
+    @staticmethod
+    def _split_batch(results: List[Tuple[Dict[str, Any], Dict[str, Tuple[int, str]]]], count: int) -> List[Dict[str, Any]]:
+        split = [{"data": {}} for _ in range(count)]
+        for payload, keys in results:
+            for key, value in (payload.get("data") or {}).items():
+                index, original = keys[key]
+                split[index]["data"][original] = value
+            for error in payload.get("errors", []):
+                path = error.get("path") or []
+                targets = [keys[path[0]][0]] if path and path[0] in keys else {index for index, _ in keys.values()}
+                for index in targets:
+                    split[index].setdefault("errors", []).append(error)
+        return split
+
+    @classmethod
+    def execute_batch(cls, operations: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """
+        Run several GraphQL operations in a single request by merging them into one document.
+        Queries and mutations are sent as separate requests; mutations run in the order given.
+
+        Args:
+            operations (List[Tuple[str, Optional[Dict[str, Any]]]]): (query, variables) pairs.
+
+        Returns:
+            List[Dict[str, Any]]: One response per operation, in order, with 'data' and any 'errors' for its fields.
+
+        Raises:
+            ValueError: If an operation cannot be parsed, or its document has fragments or several definitions.
+            requests.exceptions.HTTPError: If a request fails.
+        """
+        client = cls._shared()
+        results = [(client._execute_query(document, variables), keys)
+                   for document, variables, keys in cls._plan_batch(operations)]
+        return cls._split_batch(results, len(operations))
+
+    @classmethod
+    async def aexecute_batch(cls, operations: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """
+        Async version of execute_batch, using a connection pool per event loop.
+
+        Args:
+            operations (List[Tuple[str, Optional[Dict[str, Any]]]]): (query, variables) pairs.
+
+        Returns:
+            List[Dict[str, Any]]: One response per operation, in order, with 'data' and any 'errors' for its fields.
+        """
+        client = cls._shared()
+        results = []
+        for document, variables, keys in cls._plan_batch(operations):
+            results.append((await client._aexecute_query(document, variables), keys))
+        return cls._split_batch(results, len(operations))
+
+    @classmethod
+    def _cached(cls, key: str, load):
+        """Return a cached value, calling `load` to refresh it once it is older than cache_ttl."""
+        with cls._cache_lock:
+            entry = cls._cache.get(key)
+            if entry is not None and time.time() < entry[0]:
+                return entry[1]
+        value = load()
+        with cls._cache_lock:
+            cls._cache[key] = (time.time() + cls.cache_ttl, value)
+        return value
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget cached teams and workflow states."""
+        with cls._cache_lock:
+            cls._cache.clear()
+
+    @classmethod
+    def _get_teams(cls, client: "LinearTools") -> List[Dict]:
+        """Teams with their workflow states, fetched together in one request and cached."""
+        def load() -> List[Dict]:
+            query = """
+                query GetTeams {
+                    teams {
+                        nodes {
+                            id
+                            name
+                            key
+                            states {
+                                nodes {
+                                    id
+                                    name
+                                    type
+                                }
+                            }
+                        }
+                    }
+                }
+            """
+            result = client._execute_query(query)
+            return result["data"]["teams"]["nodes"]
+        return cls._cached(f"teams:{client.api_key}", load)
+
     @classmethod
     def get_team_issues(cls, team_id: str = None, status: Optional[str] = None) -> Union[List[Dict], str]:
         try:
-            client = cls()
+            client = cls._shared()
             query = """
                 query TeamIssues($teamId: String!, $status: String) {
                     team(id: $teamId) {
@@ -82,7 +352,7 @@ class LinearTools:
             Union[Dict, str]: Updated issue data if successful, error message if failed
         """
         try:
-            client = cls()  # Create instance within the method
+            client = cls._shared()
             mutation = """
                 mutation UpdateIssueStatus($issueId: String!, $statusId: String!) {
                     issueUpdate(
@@ -121,7 +391,7 @@ class LinearTools:
             Union[List[Dict], str]: List of matching issues if successful, error message if failed
         """
         try:
-            client = cls()  # Create instance within the method
+            client = cls._shared()
             search_gql = """
                 query SearchIssues($query: String!) {
                     issueSearch(query: $query) {
@@ -158,21 +428,8 @@ class LinearTools:
             Union[Dict, str]: Team data if successful, error message if failed
         """
         try:
-            client = cls()  # Create instance within the method
-            query = """
-                query GetTeams {
-                    teams {
-                        nodes {
-                            id
-                            name
-                            key
-                        }
-                    }
-                }
-            """
-            
-            result = client._execute_query(query)
-            teams = result["data"]["teams"]["nodes"]
+            client = cls._shared()
+            teams = cls._get_teams(client)
             
             print("Available teams:")
             for team in teams:
@@ -182,7 +439,7 @@ class LinearTools:
             if not matching_team:
                 return f"No team found with key: {team_name}"
             
-            return matching_team
+            return {"id": matching_team["id"], "name": matching_team["name"], "key": matching_team["key"]}
         except Exception as e:
             return f"Error fetching team: {str(e)}"
 
@@ -191,9 +448,16 @@ class LinearTools:
         """
         Get all workflow states for a team.
         If team_id is not provided, uses LINEAR_TEAM_ID from env.
+        States are cached for `cache_ttl` seconds.
         """
         try:
-            client = cls()  # Create instance within the method
+            client = cls._shared()
+            team_id = team_id or client.team_id
+            team = next((team for team in cls._get_teams(client) if team_id in (team["id"], team["key"])), None)
+            if team is not None:
+                return team["states"]["nodes"]
+
+            # Not one of the listed teams, so ask for it directly
             query = """
                 query WorkflowStates($teamId: String!) {
                     team(id: $teamId) {
@@ -208,16 +472,18 @@ class LinearTools:
                 }
             """
             
-            result = client._execute_query(query, {"teamId": team_id or client.team_id})
-            return result["data"]["team"]["states"]["nodes"]
+            return cls._cached(f"states:{client.api_key}:{team_id}", lambda: client._execute_query(
+                query, {"teamId": team_id})["data"]["team"]["states"]["nodes"])
         except Exception as e:
             return f"Error fetching workflow states: {str(e)}"
 
     @classmethod
-    def create_issue(cls, title: str, description: str, team_id: str = None, priority: Optional[int] = None, state_id: Optional[str] = None) -> Union[Dict, str]:
+    def create_issue(cls, title: str, description: str, team_id: str = None, priority: Optional[int] = None, state_id: Optional[str] = None,
+                     state_name: Optional[str] = None) -> Union[Dict, str]:
         """
         Create a new issue in Linear.
         If team_id is not provided, uses TEAM_ID from env.
+        Team keys and state names are resolved from the cached team list, so usually only the creation request is sent.
 
         Args:
             title (str): Title of the issue
@@ -225,12 +491,13 @@ class LinearTools:
             team_id (str, optional): Team key or ID. If not provided, uses LINEAR_TEAM_ID from env
             priority (int, optional): Priority level (0-4, where 0 is no priority, 4 is urgent)
             state_id (str, optional): ID of the initial state (if not provided, will use team's default)
+            state_name (str, optional): Name of the initial state, e.g. "In Progress", used when state_id is not given
 
         Returns:
             Union[Dict, str]: Issue data if successful, error message if failed
         """
         try:
-            client = cls()
+            client = cls._shared()
             
             # Use the team_id directly if it looks like a UUID
             team_uuid = team_id or client.team_id
@@ -246,6 +513,14 @@ class LinearTools:
                 if not team_uuid:
                     return "Could not find team UUID"
 
+            if state_name and not state_id:
+                states = cls.get_workflow_states(team_uuid)
+                if isinstance(states, str):
+                    return f"Error getting workflow states: {states}"
+                state_id = next((state['id'] for state in states if state['name'].lower() == state_name.lower()), None)
+                if not state_id:
+                    return f"No workflow state found with name: {state_name}"
+
             query = """
                 mutation CreateIssue($title: String!, $description: String!, $teamId: String!, $priority: Int, $stateId: String) {
                     issueCreate(input: {
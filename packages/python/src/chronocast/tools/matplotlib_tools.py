@@ -1,85 +1,329 @@
-from typing import List, Union, Any
+import io
+import os
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Union, Any, Optional, Tuple
+import numpy as np
 
 def check_matplotlib_dependencies():
     try:
         import numpy as np
-        import matplotlib.pyplot as plt
         import matplotlib.dates as mdates
-        return np, plt, mdates
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        return np, Figure, FigureCanvasAgg, mdates
     except ImportError:
         raise ImportError("Matplotlib dependencies are not installed. To use MatplotlibTools, install the required packages with 'pip install matplotlib'")
 
+# Figure templates: reusable styling applied to every chart rendered with them. A figsize of None
+# uses the chart type's default size. Add templates with MatplotlibTools.register_template.
+FIGURE_TEMPLATES: Dict[str, Dict[str, Any]] = {
+    "default": {
+        "figsize": None,
+        "dpi": 100,
+        "facecolor": "white",
+        "axes_facecolor": "white",
+        "text_color": "black",
+        "grid": False,
+        "font_size": 10,
+        "title_size": 12,
+        "colors": None,
+        "linewidth": 1.5,
+        "cmap": "viridis",
+        "date_format": "%Y-%m-%d",
+    },
+}
+FIGURE_TEMPLATES["broadcast"] = {
+    **FIGURE_TEMPLATES["default"],
+    "figsize": (16, 9),
+    "dpi": 120,
+    "grid": True,
+    "font_size": 14,
+    "title_size": 22,
+    "linewidth": 3.0,
+}
+FIGURE_TEMPLATES["dark"] = {
+    **FIGURE_TEMPLATES["broadcast"],
+    "facecolor": "#111418",
+    "axes_facecolor": "#111418",
+    "text_color": "#e8eaed",
+    "colors": ["#4cc9f0", "#f72585", "#ffd166", "#06d6a0", "#b388eb"],
+    "cmap": "magma",
+}
+FIGURE_TEMPLATES["thumbnail"] = {
+    **FIGURE_TEMPLATES["default"],
+    "figsize": (4, 2.25),
+    "font_size": 7,
+    "title_size": 9,
+    "linewidth": 1.0,
+}
+
+DEFAULT_FIGSIZES = {"line": (10, 6)}
+CHART_TYPES = ("line", "scatter", "bar", "histogram", "heatmap")
+
+def _numeric(values: Any, name: str) -> Any:
+    array = np.asarray(values)
+    if array.dtype.kind not in "biuf":
+        raise TypeError(f"All values in {name} must be numbers. Check your data and try again.")
+    return array
+
+def _x_values(values: Any, name: str) -> Tuple[Any, bool]:
+    """Convert x values to a float array, parsing strings as dates. Returns the array and whether it holds dates."""
+    mdates = check_matplotlib_dependencies()[3]
+    array = np.asarray(values)
+    if array.dtype.kind in "biuf":
+        return array, False
+    if array.dtype.kind != "U":
+        raise TypeError(f"All values in {name} must be numbers or strings. Check your data and try again.")
+    try:
+        # ISO dates parse in one vectorized call; anything else goes through dateutil
+        return mdates.date2num(array.astype("datetime64[ms]")), True
+    except ValueError:
+        return mdates.datestr2num(array.tolist()), True
+
+def _draw(ax: Any, fig: Any, chart: Dict[str, Any], template: Dict[str, Any]) -> None:
+    mdates = check_matplotlib_dependencies()[3]
+    kind = chart["kind"]
+    linewidth = template["linewidth"]
+
+    if kind == "line":
+        x, y = chart["x"], chart["y"]
+        if len(x) != len(y):
+            raise ValueError(f"The number of x and y lists must be equal. Got {len(x)} x-lists and {len(y)} y-lists. Check your data and try again.")
+        dates = False
+        for i, (xi, yi) in enumerate(zip(x, y)):
+            if not all(isinstance(values, (list, tuple, np.ndarray)) for values in (xi, yi)):
+                raise TypeError(f"Both x[{i}] and y[{i}] must be lists. Check your data and try again.")
+            if len(xi) != len(yi):
+                raise ValueError(f"The lengths of x[{i}] and y[{i}] must be equal. Got lengths {len(xi)} and {len(yi)}. Check your data and try again.")
+            xi, is_dates = _x_values(xi, f"x[{i}]")
+            dates = dates or is_dates
+            ax.plot(xi, _numeric(yi, f"y[{i}]"), linewidth=linewidth)
+        if dates:
+            ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+            ax.xaxis.set_major_formatter(mdates.DateFormatter(template["date_format"]))
+            fig.autofmt_xdate()  # Rotate and align the tick labels
+    elif kind in ("scatter", "bar"):
+        x, y = chart["x"], chart["y"]
+        if len(x) != len(y):
+            raise ValueError("The lengths of x and y must be equal. Please ensure x and y have the same length.")
+        if kind == "scatter":
+            ax.scatter(_numeric(x, "x"), _numeric(y, "y"))
+        else:
+            ax.bar(x, _numeric(y, "y"))
+    elif kind == "histogram":
+        ax.hist(_numeric(chart["data"], "data"), bins=chart.get("bins", 10))
+    elif kind == "heatmap":
+        data = _numeric(chart["data"], "data")
+        if data.ndim != 2:
+            raise ValueError("The heatmap data must be a 2D list of numbers.")
+        image = ax.imshow(data, cmap=template["cmap"])
+        colorbar = fig.colorbar(image, ax=ax)
+        colorbar.ax.tick_params(colors=template["text_color"], labelsize=template["font_size"])
+    else:
+        raise ValueError(f"Unsupported chart type: {kind}. Use one of {', '.join(CHART_TYPES)}.")
+
+def _render_chart(chart: Dict[str, Any]) -> bytes:
+    """
+    Render a chart description to image bytes with the object-oriented Agg API.
+
+    No pyplot global state is touched, so this is safe to call from threads and worker processes.
+    """
+    _, Figure, FigureCanvasAgg, _ = check_matplotlib_dependencies()
+    template = chart["template"]
+    fig = Figure(figsize=template["figsize"] or DEFAULT_FIGSIZES.get(chart["kind"], (8, 6)), dpi=template["dpi"],
+                 facecolor=template["facecolor"])
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.set_facecolor(template["axes_facecolor"])
+    if template["colors"]:
+        ax.set_prop_cycle(color=template["colors"])
+
+    _draw(ax, fig, chart, template)
+
+    text_color = template["text_color"]
+    if chart.get("title"):
+        ax.set_title(chart["title"], fontsize=template["title_size"], color=text_color)
+    if chart.get("xlabel"):
+        ax.set_xlabel(chart["xlabel"], fontsize=template["font_size"], color=text_color)
+    if chart.get("ylabel"):
+        ax.set_ylabel(chart["ylabel"], fontsize=template["font_size"], color=text_color)
+    ax.tick_params(colors=text_color, labelsize=template["font_size"])
+    for spine in ax.spines.values():
+        spine.set_edgecolor(text_color)
+    if template["grid"]:
+        ax.grid(True, alpha=0.3)
+
+    fig.tight_layout()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=chart.get("format", "png"), facecolor=template["facecolor"])
+    return buffer.getvalue()
+
 class MatplotlibTools:
+    # Worker processes used by render_charts; None uses one per CPU
+    max_workers: Optional[int] = None
+    _pool: Optional[ProcessPoolExecutor] = None
+    _pool_lock = threading.Lock()
+
     @staticmethod
     def _check_dependencies():
-        if 'np' not in globals() or 'plt' not in globals():
-            raise ImportError("Matplotlib is not installed. To use MatplotlibTools, install the required packages with 'pip install matplotlib'")
+        check_matplotlib_dependencies()
+
+    @staticmethod
+    def _get_pool() -> ProcessPoolExecutor:
+        if MatplotlibTools._pool is None:
+            with MatplotlibTools._pool_lock:
+                if MatplotlibTools._pool is None:
+                    # Spawned workers do not inherit the host's threads and event loop, which fork would copy mid-flight
+                    MatplotlibTools._pool = ProcessPoolExecutor(max_workers=MatplotlibTools.max_workers or os.cpu_count(),
+                                                                mp_context=multiprocessing.get_context("spawn"))
+        return MatplotlibTools._pool
 
     @staticmethod
-    def create_line_plot(x: List[List[Union[float, str]]], y: List[List[float]], title: str = None, xlabel: str = "X", ylabel: str = "Y", 
-                         output_file: str = "line_plot.png") -> Union[Any, str]:
+    def shutdown_pool() -> None:
+        """Stop the rendering worker processes. They are started again on the next render_charts call."""
+        with MatplotlibTools._pool_lock:
+            if MatplotlibTools._pool is not None:
+                MatplotlibTools._pool.shutdown()
+                MatplotlibTools._pool = None
+
+    @staticmethod
+    def register_template(name: str, base: str = "default", **settings) -> Dict[str, Any]:
         """
-        Create a line plot using the provided x and y data.
+        Register a reusable figure template.
 
         Args:
-            x (List[List[Union[float, str]]]): The x-coordinates of the data points for each line.
-            y (List[List[float]]): The y-coordinates of the data points for each line.
-            title (str, optional): The title of the plot. Defaults to None.
-            xlabel (str, optional): The label for the x-axis. Defaults to "X".
-            ylabel (str, optional): The label for the y-axis. Defaults to "Y".
-            output_file (str, optional): The output file name. Defaults to "line_plot.png".
+            name (str): The template name, used as the `template` argument of the chart methods.
+            base (str, optional): The template to start from. Defaults to "default".
+            **settings: Settings overriding the base template: figsize, dpi, facecolor, axes_facecolor, text_color,
+                grid, font_size, title_size, colors, linewidth, cmap and date_format.
 
         Returns:
-            Union[Any, str]: The matplotlib figure object, or an error message as a string.
+            Dict[str, Any]: The complete template.
+
+        Raises:
+            ValueError: If the base template does not exist or a setting is unknown.
         """
-        fig = None
-        try:
-            np, plt, mdates = check_matplotlib_dependencies()
-            if len(x) != len(y):
-                raise ValueError(f"The number of x and y lists must be equal. Got {len(x)} x-lists and {len(y)} y-lists. Check your data and try again.")
-            
-            for i, (xi, yi) in enumerate(zip(x, y)):
-                if not isinstance(xi, list) or not isinstance(yi, list):
-                    raise TypeError(f"Both x[{i}] and y[{i}] must be lists. Check your data and try again.")
-                if len(xi) != len(yi):
-                    raise ValueError(f"The lengths of x[{i}] and y[{i}] must be equal. Got lengths {len(xi)} and {len(yi)}. Check your data and try again.")
-                if not all(isinstance(val, (int, float, str)) for val in xi):
-                    raise TypeError(f"All values in x[{i}] must be numbers or strings. Check your data and try again.")
-                if not all(isinstance(val, (int, float)) for val in yi):
-                    raise TypeError(f"All values in y[{i}] must be numbers. Check your data and try again.")
-
-            fig, ax = plt.subplots(figsize=(10, 6))
-            for xi, yi in zip(x, y):
-                # Convert dates to numerical values
-                if all(isinstance(val, str) for val in xi):
-                    xi = [mdates.datestr2num(val) for val in xi]
-                ax.plot(xi, yi)
-
-            ax.set_title(title)
-            ax.set_xlabel(xlabel)
-            ax.set_ylabel(ylabel)
-
-            # Format x-axis as dates
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-            ax.xaxis.set_major_locator(mdates.MonthLocator())
-            plt.gcf().autofmt_xdate()  # Rotate and align the tick labels
-
-            fig.tight_layout()
-            plt.savefig(output_file)
-            return fig
+        unknown = set(settings) - set(FIGURE_TEMPLATES["default"])
+        if unknown:
+            raise ValueError(f"Unknown template settings: {', '.join(sorted(unknown))}")
+        FIGURE_TEMPLATES[name] = {**MatplotlibTools._template(base), **settings}
+        return FIGURE_TEMPLATES[name]
 
+    @staticmethod
+    def _template(template: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+        if isinstance(template, dict):
+            return {**FIGURE_TEMPLATES["default"], **template}
+        if template not in FIGURE_TEMPLATES:
+            raise ValueError(f"Unknown figure template: {template}. Available templates: {', '.join(FIGURE_TEMPLATES)}")
+        return FIGURE_TEMPLATES[template]
+
+    @staticmethod
+    def _prepare(chart: Dict[str, Any], format: str, template: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+        if chart.get("kind") not in CHART_TYPES:
+            raise ValueError(f"Unsupported chart type: {chart.get('kind')}. Use one of {', '.join(CHART_TYPES)}.")
+        return {**chart, "format": chart.get("format", format), "template": MatplotlibTools._template(chart.get("template", template))}
+
+    @staticmethod
+    def _render(chart: Dict[str, Any], name: str, output_file: Optional[str], format: str,
+                template: Union[str, Dict[str, Any]]) -> Union[bytes, str]:
+        try:
+            MatplotlibTools._check_dependencies()
+            image = _render_chart(MatplotlibTools._prepare(chart, format, template))
+            if output_file:
+                with open(output_file, "wb") as file:
+                    file.write(image)
+                return output_file
+            return image
         except ImportError as e:
             return str(e)
+        except (ValueError, TypeError) as e:
+            error_msg = f"Error: {str(e)}"
+            print(error_msg)
+            return error_msg
         except Exception as e:
-            error_msg = f"Error: An unexpected error occurred while creating the line plot: {str(e)}"
+            error_msg = f"Error: An unexpected error occurred while creating the {name}: {str(e)}"
             print(error_msg)
             return error_msg
-        finally:
-            if fig is not None:
-                plt.close(fig)  # Ensure the figure is closed to free up memory
 
     @staticmethod
-    def create_scatter_plot(x: List[float], y: List[float], title: str = None, xlabel: str = None, ylabel: str = None) -> Union[str, None]:
+    def render_charts(charts: List[Dict[str, Any]], format: str = "png",
+                      template: Union[str, Dict[str, Any]] = "default") -> List[Union[bytes, str]]:
+        """
+        Render several charts in parallel in a pool of worker processes, or in this process on a single CPU.
+
+        Each chart is a dict with a 'kind' ("line", "scatter", "bar", "histogram" or "heatmap"), the data
+        arguments of the matching create_* method ('x' and 'y', or 'data' and optionally 'bins'), and
+        optionally 'title', 'xlabel', 'ylabel', 'format' and 'template' overriding the defaults below.
+
+        Args:
+            charts (List[Dict[str, Any]]): The charts to render.
+            format (str, optional): The image format, e.g. "png" or "svg". Defaults to "png".
+            template (Union[str, Dict[str, Any]], optional): A registered template name or a dict of template settings.
+                Defaults to "default".
+
+        Returns:
+            List[Union[bytes, str]]: The image bytes of each chart, in order, or an error message for charts that failed.
+        """
+        try:
+            MatplotlibTools._check_dependencies()
+        except ImportError as e:
+            return [str(e)] * len(charts)
+
+        prepared: List[Union[Dict[str, Any], str]] = []
+        for chart in charts:
+            try:
+                prepared.append(MatplotlibTools._prepare(chart, format, template))
+            except ValueError as e:
+                prepared.append(f"Error: {str(e)}")
+
+        jobs = [chart for chart in prepared if isinstance(chart, dict)]
+        if len(jobs) > 1 and (MatplotlibTools.max_workers or os.cpu_count() or 1) > 1:
+            pool = MatplotlibTools._get_pool()
+            futures = iter([pool.submit(_render_chart, chart) for chart in jobs])
+        else:
+            futures = None
+
+        results: List[Union[bytes, str]] = []
+        for chart in prepared:
+            if isinstance(chart, str):
+                results.append(chart)
+                continue
+            try:
+                results.append(next(futures).result() if futures is not None else _render_chart(chart))
+            except (ValueError, TypeError) as e:
+                results.append(f"Error: {str(e)}")
+            except Exception as e:
+                results.append(f"Error: An unexpected error occurred while creating the {chart['kind']} chart: {str(e)}")
+        return results
+
+    @staticmethod
+    def create_line_plot(x: List[List[Union[float, str]]], y: List[List[float]], title: str = None, xlabel: str = "X", ylabel: str = "Y",
+                         output_file: str = None, format: str = "png", template: Union[str, Dict[str, Any]] = "default") -> Union[bytes, str]:
+        """
+        Create a line plot using the provided x and y data.
+
+        Args:
+            x (List[List[Union[float, str]]]): The x-coordinates of the data points for each line. Strings are parsed as dates.
+            y (List[List[float]]): The y-coordinates of the data points for each line.
+            title (str, optional): The title of the plot. Defaults to None.
+            xlabel (str, optional): The label for the x-axis. Defaults to "X".
+            ylabel (str, optional): The label for the y-axis. Defaults to "Y".
+            output_file (str, optional): A file to save the image to. Defaults to None, returning the image bytes.
+            format (str, optional): The image format, e.g. "png" or "svg". Defaults to "png".
+            template (Union[str, Dict[str, Any]], optional): A registered template name or a dict of template settings.
+                Defaults to "default".
+
+        Returns:
+            Union[bytes, str]: The image bytes, the path of the saved image if output_file is given, or an error message as a string.
+        """
+        return MatplotlibTools._render({"kind": "line", "x": x, "y": y, "title": title, "xlabel": xlabel, "ylabel": ylabel},
+                                       "line plot", output_file, format, template)
+
+    @staticmethod
+    def create_scatter_plot(x: List[float], y: List[float], title: str = None, xlabel: str = None, ylabel: str = None,
+                            output_file: str = None, format: str = "png", template: Union[str, Dict[str, Any]] = "default") -> Union[bytes, str]:
         """
         Create a scatter plot using the provided x and y data.
 
@@ -89,94 +333,43 @@ class MatplotlibTools:
             title (str, optional): The title of the plot. Defaults to None.
             xlabel (str, optional): The label for the x-axis. Defaults to None.
             ylabel (str, optional): The label for the y-axis. Defaults to None.
+            output_file (str, optional): A file to save the image to. Defaults to None, returning the image bytes.
+            format (str, optional): The image format, e.g. "png" or "svg". Defaults to "png".
+            template (Union[str, Dict[str, Any]], optional): A registered template name or a dict of template settings.
+                Defaults to "default".
 
         Returns:
-            Union[str, None]: The path to the saved plot image file, or an error message as a string.
+            Union[bytes, str]: The image bytes, the path of the saved image if output_file is given, or an error message as a string.
         """
-        try:
-            np, plt, _ = check_matplotlib_dependencies()
-            if len(x) != len(y):
-                raise ValueError("The lengths of x and y must be equal.")
-
-            plt.figure(figsize=(8, 6))
-            plt.scatter(x, y)
-
-            if title:
-                plt.title(title)
-            if xlabel:
-                plt.xlabel(xlabel)
-            if ylabel:
-                plt.ylabel(ylabel)
-
-            plt.tight_layout()
-            plot_path = "scatter_plot.png"
-            plt.savefig(plot_path)
-            plt.close()
-
-            return plot_path
-        
-        except ImportError as e:
-            return str(e)
-        
-        except ValueError as e:
-            error_msg = f"Error: {str(e)} Please ensure x and y have the same length."
-            print(error_msg)
-            return error_msg
-        except Exception as e:
-            error_msg = f"Error: An unexpected error occurred while creating the scatter plot: {str(e)}"
-            print(error_msg)
-            return error_msg
+        return MatplotlibTools._render({"kind": "scatter", "x": x, "y": y, "title": title, "xlabel": xlabel, "ylabel": ylabel},
+                                       "scatter plot", output_file, format, template)
 
     @staticmethod
-    def create_bar_plot(x: List[str], y: List[float], title: str = None, xlabel: str = None, ylabel: str = None) -> Union[str, None]:
+    def create_bar_plot(x: List[str], y: List[float], title: str = None, xlabel: str = None, ylabel: str = None,
+                        output_file: str = None, format: str = "png", template: Union[str, Dict[str, Any]] = "default") -> Union[bytes, str]:
         """
         Create a bar plot using the provided x and y data.
 
         Args:
-            x (List[str]): The categories for the x-axis.
-            y (List[float]): The values for each category.
+            x (List[str]): The labels for the x-axis.
+            y (List[float]): The heights of the bars.
             title (str, optional): The title of the plot. Defaults to None.
             xlabel (str, optional): The label for the x-axis. Defaults to None.
             ylabel (str, optional): The label for the y-axis. Defaults to None.
+            output_file (str, optional): A file to save the image to. Defaults to None, returning the image bytes.
+            format (str, optional): The image format, e.g. "png" or "svg". Defaults to "png".
+            template (Union[str, Dict[str, Any]], optional): A registered template name or a dict of template settings.
+                Defaults to "default".
 
         Returns:
-            Union[str, None]: The path to the saved plot image file, or an error message as a string.
+            Union[bytes, str]: The image bytes, the path of the saved image if output_file is given, or an error message as a string.
         """
-        try:
-            np, plt, _ = check_matplotlib_dependencies()
-            if len(x) != len(y):
-                raise ValueError("The lengths of x and y must be equal.")
-
-            plt.figure(figsize=(8, 6))
-            plt.bar(x, y)
-
-            if title:
-                plt.title(title)
-            if xlabel:
-                plt.xlabel(xlabel)
-            if ylabel:
-                plt.ylabel(ylabel)
-
-            plt.tight_layout()
-            plot_path = "bar_plot.png"
-            plt.savefig(plot_path)
-            plt.close()
-
-            return plot_path
-        except ImportError as e:
-            return str(e)
-
-        except ValueError as e:
-            error_msg = f"Error: {str(e)} Please ensure x and y have the same length."
-            print(error_msg)
-            return error_msg
-        except Exception as e:
-            error_msg = f"Error: An unexpected error occurred while creating the bar plot: {str(e)}"
-            print(error_msg)
-            return error_msg
+        return MatplotlibTools._render({"kind": "bar", "x": x, "y": y, "title": title, "xlabel": xlabel, "ylabel": ylabel},
+                                       "bar plot", output_file, format, template)
 
     @staticmethod
-    def create_histogram(data: List[float], bins: int = 10, title: str = None, xlabel: str = None, ylabel: str = None) -> Union[str, None]:
+    def create_histogram(data: List[float], bins: int = 10, title: str = None, xlabel: str = None, ylabel: str = None,
+                         output_file: str = None, format: str = "png", template: Union[str, Dict[str, Any]] = "default") -> Union[bytes, str]:
         """
         Create a histogram using the provided data.
 
@@ -186,38 +379,20 @@ class MatplotlibTools:
             title (str, optional): The title of the plot. Defaults to None.
             xlabel (str, optional): The label for the x-axis. Defaults to None.
             ylabel (str, optional): The label for the y-axis. Defaults to None.
+            output_file (str, optional): A file to save the image to. Defaults to None, returning the image bytes.
+            format (str, optional): The image format, e.g. "png" or "svg". Defaults to "png".
+            template (Union[str, Dict[str, Any]], optional): A registered template name or a dict of template settings.
+                Defaults to "default".
 
         Returns:
-            Union[str, None]: The path to the saved plot image file, or an error message as a string.
+            Union[bytes, str]: The image bytes, the path of the saved image if output_file is given, or an error message as a string.
         """
-        try:
-            np, plt, _ = check_matplotlib_dependencies()
-            plt.figure(figsize=(8, 6))
-            plt.hist(data, bins=bins)
-
-            if title:
-                plt.title(title)
-            if xlabel:
-                plt.xlabel(xlabel)
-            if ylabel:
-                plt.ylabel(ylabel)
-
-            plt.tight_layout()
-            plot_path = "histogram.png"
-            plt.savefig(plot_path)
-            plt.close()
-
-            return plot_path
-        
-        except ImportError as e:
-            return str(e)
-        except Exception as e:
-            error_msg = f"Error: An unexpected error occurred while creating the histogram: {str(e)}"
-            print(error_msg)
-            return error_msg
+        return MatplotlibTools._render({"kind": "histogram", "data": data, "bins": bins, "title": title, "xlabel": xlabel, "ylabel": ylabel},
+                                       "histogram", output_file, format, template)
 
-    @staticmethod 
-    def create_heatmap(data: List[List[float]], title: str = None, xlabel: str = None, ylabel: str = None) -> Union[str, None]:
+    @staticmethod
+    def create_heatmap(data: List[List[float]], title: str = None, xlabel: str = None, ylabel: str = None,
+                       output_file: str = None, format: str = "png", template: Union[str, Dict[str, Any]] = "default") -> Union[bytes, str]:
         """
         Create a heatmap using the provided 2D data.
 
@@ -226,35 +401,13 @@ class MatplotlibTools:
             title (str, optional): The title of the plot. Defaults to None.
             xlabel (str, optional): The label for the x-axis. Defaults to None.
             ylabel (str, optional): The label for the y-axis. Defaults to None.
+            output_file (str, optional): A file to save the image to. Defaults to None, returning the image bytes.
+            format (str, optional): The image format, e.g. "png" or "svg". Defaults to "png".
+            template (Union[str, Dict[str, Any]], optional): A registered template name or a dict of template settings.
+                Defaults to "default".
 
         Returns:
-            Union[str, None]: The path to the saved plot image file, or an error message as a string.
+            Union[bytes, str]: The image bytes, the path of the saved image if output_file is given, or an error message as a string.
         """
-        try:
-            np, plt, _ = check_matplotlib_dependencies()
-            data = np.array(data)
-
-            plt.figure(figsize=(8, 6))
-            plt.imshow(data, cmap='viridis')
-            plt.colorbar()
-
-            if title:
-                plt.title(title)
-            if xlabel:
-                plt.xlabel(xlabel)
-            if ylabel:
-                plt.ylabel(ylabel)
-
-            plt.tight_layout()
-            plot_path = "heatmap.png"
-            plt.savefig(plot_path)
-            plt.close()
-
-            return plot_path
-        
-        except ImportError as e:
-            return str(e)
-        except Exception as e:
-            error_msg = f"Error: An unexpected error occurred while creating the heatmap: {str(e)}"
-            print(error_msg)
-            return error_msg
\ No newline at end of file
+        return MatplotlibTools._render({"kind": "heatmap", "data": data, "title": title, "xlabel": xlabel, "ylabel": ylabel},
+                                       "heatmap", output_file, format, template)
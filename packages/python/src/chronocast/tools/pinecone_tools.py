@@ -1,5 +1,8 @@
 import os
-from typing import List, Dict, Any
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Iterator
 import numpy as np
 
 def check_pinecone():
@@ -9,22 +12,54 @@ def check_pinecone():
         raise ImportError("pinecone is required for Pinecone tools. Install with `pip install pinecone`")
     return pinecone
 
+# Pinecone rejects upsert requests over 2MB or 1000 vectors, and deletes over 1000 ids
+MAX_UPSERT_BATCH_SIZE = 1000
+MAX_UPSERT_REQUEST_BYTES = 2 * 1024 * 1024
+MAX_DELETE_BATCH_SIZE = 1000
+
 class PineconeTools:
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, client: Any = None, max_workers: int = 8):
         """
         Initialize PineconeTools with the Pinecone API key.
 
         Args:
             api_key (str, optional): Pinecone API key. If not provided, it will try to use the PINECONE_API_KEY environment variable.
+            client (Any, optional): A pre-built client exposing the Pinecone client interface (e.g. InMemoryPineconeClient
+                for local development and tests). When given, no API key is required.
+            max_workers (int, optional): Maximum number of concurrent requests for batched operations. Defaults to 8.
         """
+        self.max_workers = max_workers
+        self._indexes: Dict[str, Any] = {}
+        self._indexes_lock = threading.Lock()
+
+        if client is not None:
+            self.api_key = api_key
+            self.pc = client
+            return
+
         self.api_key = api_key or os.getenv("PINECONE_API_KEY")
         if not self.api_key:
             raise ValueError("Pinecone API key is required. Please provide it or set the PINECONE_API_KEY environment variable.")
         self.pc = check_pinecone().Pinecone(api_key=self.api_key)
 
     def get_pinecone_index(self, name: str):
-        pinecone_client = check_pinecone().Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
-        return pinecone_client.Index(name)
+        """
+        Get a handle to a Pinecone index, reusing the cached handle (and its connection pool) when possible.
+
+        Args:
+            name (str): Name of the index.
+
+        Returns:
+            The index handle.
+        """
+        index = self._indexes.get(name)
+        if index is None:
+            with self._indexes_lock:
+                index = self._indexes.get(name)
+                if index is None:
+                    index = self.pc.Index(name)
+                    self._indexes[name] = index
+        return index
 
     def create_index(self, name: str, dimension: int, metric: str = "cosine", cloud: str = "aws", region: str = "us-east-1") -> None:
         """
@@ -63,6 +98,8 @@ class PineconeTools:
         """
         try:
             self.pc.delete_index(name)
+            with self._indexes_lock:
+                self._indexes.pop(name, None)
             print(f"Index '{name}' deleted successfully.")
         except Exception as e:
             raise Exception(f"Error deleting index: {str(e)}")
@@ -82,25 +119,31 @@ class PineconeTools:
         except Exception as e:
             raise Exception(f"Error listing indexes: {str(e)}")
 
-    def upsert_vectors(self, index_name: str, vectors: List[Dict[str, Any]]) -> None:
+    def upsert_vectors(self, index_name: str, vectors: List[Dict[str, Any]], namespace: str = "", batch_size: int = 100) -> None:
         """
         Upsert vectors into a Pinecone index.
 
+        Vectors are split into batches that respect Pinecone's per-request vector count and size limits,
+        and the batches are sent concurrently.
+
         Args:
             index_name (str): Name of the index to upsert vectors into.
             vectors (List[Dict[str, Any]]): List of vectors to upsert. Each vector should be a dictionary with 'id', 'values', and optionally 'metadata'.
+            namespace (str, optional): Namespace to upsert into. Defaults to the default namespace.
+            batch_size (int, optional): Maximum number of vectors per request. Defaults to 100.
 
         Raises:
             Exception: If there's an error upserting vectors.
         """
         try:
-            index = self.pc.Index(index_name)
-            index.upsert(vectors=vectors)
-            print(f"Vectors upserted successfully into index '{index_name}'.")
+            index = self.get_pinecone_index(index_name)
+            batches = list(self._upsert_batches(vectors, min(batch_size, MAX_UPSERT_BATCH_SIZE)))
+            self._map_concurrently(lambda batch: index.upsert(vectors=batch, namespace=namespace), batches)
+            print(f"{len(vectors)} vectors upserted successfully into index '{index_name}' in {len(batches)} batches.")
         except Exception as e:
             raise Exception(f"Error upserting vectors: {str(e)}")
 
-    def query_index(self, index_name: str, query_vector: List[float], top_k: int = 10, filter: Dict = None, include_metadata: bool = True) -> Dict[str, Any]:
+    def query_index(self, index_name: str, query_vector: List[float], top_k: int = 10, filter: Dict = None, include_metadata: bool = True, namespace: str = "") -> Dict[str, Any]:
         """
         Query a Pinecone index for similar vectors.
 
@@ -110,6 +153,7 @@ class PineconeTools:
             top_k (int, optional): Number of results to return. Defaults to 10.
             filter (Dict, optional): Metadata filter to apply to the query. Defaults to None.
             include_metadata (bool, optional): Whether to include metadata in the results. Defaults to True.
+            namespace (str, optional): Namespace to query. Defaults to the default namespace.
 
         Returns:
             Dict[str, Any]: Query results containing matches and their scores.
@@ -118,35 +162,118 @@ class PineconeTools:
             Exception: If there's an error querying the index.
         """
         try:
-            index = self.pc.Index(index_name)
+            index = self.get_pinecone_index(index_name)
             results = index.query(
                 vector=query_vector,
                 top_k=top_k,
                 include_metadata=include_metadata,
-                filter=filter
+                filter=filter,
+                namespace=namespace
             )
             return results
         except Exception as e:
             raise Exception(f"Error querying index: {str(e)}")
 
-    def delete_vectors(self, index_name: str, ids: List[str]) -> None:
+    def query_many(self, index_name: str, query_vectors: List[List[float]], top_k: int = 10, filter: Dict = None,
+                   include_metadata: bool = True, namespaces: Optional[List[str]] = None, merge: bool = False) -> List[Any]:
+        """
+        Run several queries, optionally across several namespaces, concurrently and merge the results.
+
+        Args:
+            index_name (str): Name of the index to query.
+            query_vectors (List[List[float]]): The query vectors.
+            top_k (int, optional): Number of results to return per query (or in total when merge is True). Defaults to 10.
+            filter (Dict, optional): Metadata filter to apply to every query. Defaults to None.
+            include_metadata (bool, optional): Whether to include metadata in the results. Defaults to True.
+            namespaces (List[str], optional): Namespaces to search. Defaults to the default namespace only.
+            merge (bool, optional): If True, return a single list of the best matches across all queries. Defaults to False.
+
+        Returns:
+            List[Any]: For each query, its top_k matches across namespaces, sorted by score. If merge is True, a single
+                list of the top_k matches across all queries, with each id appearing once at its best score.
+                Every match is a dictionary with 'id', 'score', 'namespace' and, if requested, 'metadata'.
+
+        Raises:
+            Exception: If there's an error querying the index.
+        """
+        namespaces = namespaces or [""]
+        try:
+            index = self.get_pinecone_index(index_name)
+            jobs = [(query_index, namespace, vector)
+                        for query_index, vector in enumerate(query_vectors) for namespace in namespaces]
+
+            def run(request):
+                _, namespace, vector = request
+                return index.query(vector=vector, top_k=top_k, include_metadata=include_metadata,
+                                   filter=filter, namespace=namespace)
+
+            responses = self._map_concurrently(run, jobs)
+        except Exception as e:
+            raise Exception(f"Error querying index: {str(e)}")
+
+        per_query: List[Dict[str, Dict[str, Any]]] = [{} for _ in query_vectors]
+        for (query_index, namespace, _), response in zip(jobs, responses):
+            best = per_query[query_index]
+            for match in self._response_matches(response):
+                match["namespace"] = namespace
+                key = f"{namespace}:{match['id']}"
+                if key not in best or match["score"] > best[key]["score"]:
+                    best[key] = match
+
+        if merge:
+            merged: Dict[str, Dict[str, Any]] = {}
+            for best in per_query:
+                for key, match in best.items():
+                    if key not in merged or match["score"] > merged[key]["score"]:
+                        merged[key] = match
+            return sorted(merged.values(), key=lambda m: m["score"], reverse=True)[:top_k]
+
+        return [sorted(best.values(), key=lambda m: m["score"], reverse=True)[:top_k] for best in per_query]
+
+    def delete_vectors(self, index_name: str, ids: List[str], namespace: str = "") -> None:
         """
         Delete vectors from a Pinecone index by their IDs.
 
+        Large id lists are split into batches within Pinecone's per-request limit and deleted concurrently.
+
         Args:
             index_name (str): Name of the index to delete vectors from.
             ids (List[str]): List of vector IDs to delete.
+            namespace (str, optional): Namespace containing the vectors. Defaults to the default namespace.
 
         Raises:
             Exception: If there's an error deleting vectors.
         """
         try:
-            index = self.pc.Index(index_name)
-            index.delete(ids=ids)
+            index = self.get_pinecone_index(index_name)
+            batches = [ids[i:i + MAX_DELETE_BATCH_SIZE] for i in range(0, len(ids), MAX_DELETE_BATCH_SIZE)]
+            self._map_concurrently(lambda batch: index.delete(ids=batch, namespace=namespace), batches)
             print(f"Vectors deleted successfully from index '{index_name}'.")
         except Exception as e:
             raise Exception(f"Error deleting vectors: {str(e)}")
 
+    def delete_namespace(self, index_name: str, namespace: str, filter: Dict = None) -> None:
+        """
+        Delete every vector in a namespace, or only those matching a metadata filter.
+
+        Args:
+            index_name (str): Name of the index.
+            namespace (str): Namespace to clear.
+            filter (Dict, optional): Metadata filter selecting the vectors to delete. Defaults to None (delete all).
+
+        Raises:
+            Exception: If there's an error deleting vectors.
+        """
+        try:
+            index = self.get_pinecone_index(index_name)
+            if filter:
+                index.delete(filter=filter, namespace=namespace)
+            else:
+                index.delete(delete_all=True, namespace=namespace)
+            print(f"Vectors deleted successfully from namespace '{namespace}' in index '{index_name}'.")
+        except Exception as e:
+            raise Exception(f"Error deleting vectors: {str(e)}")
+
     def update_vector_metadata(self, index_name: str, id: str, metadata: Dict[str, Any]) -> None:
         """
         Update the metadata of a vector in a Pinecone index.
@@ -160,7 +287,7 @@ class PineconeTools:
             Exception: If there's an error updating the vector metadata.
         """
         try:
-            index = self.pc.Index(index_name)
+            index = self.get_pinecone_index(index_name)
             index.update(id=id, set_metadata=metadata)
             print(f"Metadata updated successfully for vector '{id}' in index '{index_name}'.")
         except Exception as e:
@@ -180,11 +307,46 @@ class PineconeTools:
             Exception: If there's an error describing the index stats.
         """
         try:
-            index = self.pc.Index(index_name)
+            index = self.get_pinecone_index(index_name)
             return index.describe_index_stats()
         except Exception as e:
             raise Exception(f"Error describing index stats: {str(e)}")
 
+    def _map_concurrently(self, func, items: List[Any]) -> List[Any]:
+        if len(items) <= 1 or self.max_workers <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            return list(executor.map(func, items))
+
+    @staticmethod
+    def _upsert_batches(vectors: List[Dict[str, Any]], batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+        batch, batch_bytes = [], 0
+        for vector in vectors:
+            # Rough JSON payload size: ~12 bytes per float plus id and metadata
+            size = 12 * len(vector.get("values", [])) + len(str(vector.get("id", ""))) + 64
+            if vector.get("metadata"):
+                size += len(json.dumps(vector["metadata"], default=str))
+            if batch and (len(batch) >= batch_size or batch_bytes + size > MAX_UPSERT_REQUEST_BYTES):
+                yield batch
+                batch, batch_bytes = [], 0
+            batch.append(vector)
+            batch_bytes += size
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _response_matches(response: Any) -> List[Dict[str, Any]]:
+        matches = response["matches"] if isinstance(response, dict) else getattr(response, "matches", [])
+        results = []
+        for match in matches or []:
+            if not isinstance(match, dict):
+                match = match.to_dict() if hasattr(match, "to_dict") else vars(match)
+            result = {"id": match["id"], "score": match.get("score")}
+            if match.get("metadata") is not None:
+                result["metadata"] = match["metadata"]
+            results.append(result)
+        return results
+
     @staticmethod
     def normalize_vector(vector: List[float]) -> List[float]:
         """
@@ -197,4 +359,133 @@ class PineconeTools:
             List[float]: The normalized vector.
         """
         norm = np.linalg.norm(vector)
-        return (np.array(vector) / norm).tolist() if norm != 0 else vector
\ No newline at end of file
+        return (np.array(vector) / norm).tolist() if norm != 0 else vector
+
+
+class InMemoryPineconeIndex:
+    """
+    A local, in-memory stand-in for a Pinecone index, supporting the subset of the interface used by PineconeTools.
+    Scores are cosine similarities.
+    """
+    def __init__(self):
+        self._namespaces: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def upsert(self, vectors: List[Dict[str, Any]], namespace: str = "") -> Dict[str, int]:
+        with self._lock:
+            store = self._namespaces.setdefault(namespace, {})
+            for vector in vectors:
+                store[vector["id"]] = {"values": list(vector["values"]), "metadata": dict(vector.get("metadata") or {})}
+        return {"upserted_count": len(vectors)}
+
+    def query(self, vector: List[float], top_k: int = 10, include_metadata: bool = False, filter: Dict = None,
+              namespace: str = "", include_values: bool = False) -> Dict[str, Any]:
+        with self._lock:
+            items = [(id, item) for id, item in self._namespaces.get(namespace, {}).items()
+                     if _matches_filter(item["metadata"], filter)]
+        if not items:
+            return {"matches": [], "namespace": namespace}
+
+        matrix = np.array([item["values"] for _, item in items], dtype=np.float32)
+        query = np.asarray(vector, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+        scores = matrix @ query / np.where(norms == 0, 1, norms)
+
+        matches = []
+        for i in np.argsort(-scores)[:top_k]:
+            id, item = items[i]
+            match = {"id": id, "score": float(scores[i])}
+            if include_metadata:
+                match["metadata"] = item["metadata"]
+            if include_values:
+                match["values"] = item["values"]
+            matches.append(match)
+        return {"matches": matches, "namespace": namespace}
+
+    def delete(self, ids: List[str] = None, delete_all: bool = False, filter: Dict = None, namespace: str = "") -> None:
+        with self._lock:
+            store = self._namespaces.get(namespace, {})
+            if delete_all:
+                store.clear()
+            elif filter:
+                for id in [id for id, item in store.items() if _matches_filter(item["metadata"], filter)]:
+                    del store[id]
+            else:
+                for id in ids or []:
+                    store.pop(id, None)
+
+    def update(self, id: str, values: List[float] = None, set_metadata: Dict[str, Any] = None, namespace: str = "") -> None:
+        with self._lock:
+            item = self._namespaces.get(namespace, {}).get(id)
+            if item is None:
+                return
+            if values is not None:
+                item["values"] = list(values)
+            if set_metadata:
+                item["metadata"].update(set_metadata)
+
+    def describe_index_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            namespaces = {name: {"vector_count": len(store)} for name, store in self._namespaces.items()}
+        return {"namespaces": namespaces, "total_vector_count": sum(ns["vector_count"] for ns in namespaces.values())}
+
+
+class InMemoryPineconeClient:
+    """
+    A local stand-in for the Pinecone client. Pass it to PineconeTools(client=InMemoryPineconeClient())
+    to develop and test without network access.
+    """
+    def __init__(self):
+        self._indexes: Dict[str, InMemoryPineconeIndex] = {}
+
+    def create_index(self, name: str, dimension: int, metric: str = "cosine", spec: Any = None) -> None:
+        self._indexes.setdefault(name, InMemoryPineconeIndex())
+
+    def delete_index(self, name: str) -> None:
+        self._indexes.pop(name, None)
+
+    def list_indexes(self) -> List[str]:
+        return list(self._indexes)
+
+    def Index(self, name: str) -> InMemoryPineconeIndex:
+        if name not in self._indexes:
+            raise ValueError(f"Index '{name}' not found")
+        return self._indexes[name]
+
+
+def _matches_filter(metadata: Dict[str, Any], filter: Optional[Dict[str, Any]]) -> bool:
+    if not filter:
+        return True
+    for key, condition in filter.items():
+        if key == "$and":
+            if not all(_matches_filter(metadata, sub) for sub in condition):
+                return False
+            continue
+        if key == "$or":
+            if not any(_matches_filter(metadata, sub) for sub in condition):
+                return False
+            continue
+        value = metadata.get(key)
+        if not isinstance(condition, dict):
+            condition = {"$eq": condition}
+        for op, operand in condition.items():
+            if op == "$eq" and value != operand:
+                return False
+            if op == "$ne" and value == operand:
+                return False
+            if op == "$in" and value not in operand:
+                return False
+            if op == "$nin" and value in operand:
+                return False
+            if op in ("$gt", "$gte", "$lt", "$lte"):
+                if value is None:
+                    return False
+                if op == "$gt" and not value > operand:
+                    return False
+                if op == "$gte" and not value >= operand:
+                    return False
+                if op == "$lt" and not value < operand:
+                    return False
+                if op == "$lte" and not value <= operand:
+                    return False
+    return True
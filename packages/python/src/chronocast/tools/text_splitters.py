@@ -1,4 +1,6 @@
-from typing import List, Union
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, wait, FIRST_COMPLETED
 import numpy as np
 from dotenv import load_dotenv
 from .embedding_tools import EmbeddingsTools
@@ -8,14 +10,40 @@ from sentence_splitter import SentenceSplitter as ExternalSentenceSplitter
 load_dotenv()
 
 class SemanticSplitter:
-    def __init__(self, embedding_provider: str = "openai", embedding_model: str = "text-embedding-3-small"):
+    def __init__(self, embedding_provider: str = "openai", embedding_model: str = "text-embedding-3-small",
+                 graph_mode: str = "dense", top_k: int = 10, window: Optional[int] = None,
+                 block_size: int = 1024):
+        """
+        Args:
+            embedding_provider (str): The provider of the embedding model.
+            embedding_model (str): The embedding model to use.
+            graph_mode (str): "dense" builds the full N x N similarity matrix; "sparse" only keeps
+                each segment's top_k neighbours (and/or neighbours within `window`), which keeps
+                memory linear in the number of segments.
+            top_k (int): Number of nearest neighbours kept per segment in sparse mode.
+            window (Optional[int]): In sparse mode, only connect segments at most `window` positions
+                apart. Useful for order-preserving chunking of long transcripts.
+            block_size (int): Rows per block for the blocked matrix multiply used when FAISS is unavailable.
+        """
+        if graph_mode not in ("dense", "sparse"):
+            raise ValueError(f"Unsupported graph mode: {graph_mode}")
+        if top_k < 1:
+            raise ValueError("top_k must be at least 1")
+        if window is not None and window < 1:
+            raise ValueError("window must be at least 1")
+
         self.embedding_provider = embedding_provider
         self.embedding_model = embedding_model
+        self.graph_mode = graph_mode
+        self.top_k = top_k
+        self.window = window
+        self.block_size = block_size
 
     @staticmethod
     def chunk_text(text: Union[str, List[str]], rearrange: bool = False, 
-                   embedding_provider: str = "openai", embedding_model: str = "text-embedding-3-small") -> List[str]:
-        splitter = SemanticSplitter(embedding_provider, embedding_model)
+                   embedding_provider: str = "openai", embedding_model: str = "text-embedding-3-small",
+                   graph_mode: str = "dense", top_k: int = 10, window: Optional[int] = None) -> List[str]:
+        splitter = SemanticSplitter(embedding_provider, embedding_model, graph_mode, top_k, window)
         
         if isinstance(text, str):
             return splitter._process_single_text(text, rearrange)
@@ -27,6 +55,82 @@ class SemanticSplitter:
         else:
             raise ValueError("Input must be either a string or a list of strings")
 
+    @staticmethod
+    def chunk_documents(texts: List[str], rearrange: bool = False,
+                        embedding_provider: str = "openai", embedding_model: str = "text-embedding-3-small",
+                        graph_mode: str = "dense", top_k: int = 10, window: Optional[int] = None,
+                        batch_size: int = 2048, max_workers: Optional[int] = None) -> Iterator[Tuple[int, List[str]]]:
+        """
+        Chunk many documents at once, yielding each document's chunks as soon as they are ready.
+
+        Segments from all documents are embedded together in shared requests of up to `batch_size`
+        inputs, and community detection for each fully embedded document runs in a process pool
+        while the remaining batches are still being embedded.
+
+        Args:
+            texts (List[str]): The documents to chunk.
+            rearrange (bool): Group segments by community instead of preserving their order.
+            embedding_provider (str): The provider of the embedding model.
+            embedding_model (str): The embedding model to use.
+            graph_mode (str): "dense" or "sparse" similarity graph construction.
+            top_k (int): Number of nearest neighbours kept per segment in sparse mode.
+            window (Optional[int]): Locality window for sparse mode.
+            batch_size (int): Maximum number of segments per embedding request.
+            max_workers (Optional[int]): Size of the process pool. 1 runs community detection inline.
+
+        Yields:
+            Tuple[int, List[str]]: The index of the document in `texts` and its chunks, in completion order.
+        """
+        if not isinstance(texts, list):
+            raise ValueError("Input must be a list of strings")
+
+        splitter = SemanticSplitter(embedding_provider, embedding_model, graph_mode, top_k, window)
+        options = (graph_mode, top_k, window, rearrange)
+
+        segments_per_doc = [splitter._create_sentence_segments(doc) for doc in texts]
+        embedded: Dict[int, List[np.ndarray]] = {i: [] for i in range(len(texts))}
+        remaining = [len(segments) for segments in segments_per_doc]
+
+        for doc_index, segments in enumerate(segments_per_doc):
+            if not segments:
+                yield doc_index, []
+
+        # Flatten (doc_index, segment) pairs so every request carries a full batch regardless of document boundaries
+        flat = [(doc_index, segment) for doc_index, segments in enumerate(segments_per_doc) for segment in segments]
+
+        executor = ProcessPoolExecutor(max_workers=max_workers) if max_workers != 1 else None
+        pending: Dict[Future, int] = {}
+        try:
+            for start in range(0, len(flat), batch_size):
+                batch = flat[start:start + batch_size]
+                embeddings = splitter._embed_segments([segment for _, segment in batch])
+
+                ready = []
+                for (doc_index, _), embedding in zip(batch, embeddings):
+                    embedded[doc_index].append(embedding)
+                    remaining[doc_index] -= 1
+                    if remaining[doc_index] == 0:
+                        ready.append(doc_index)
+
+                for doc_index in ready:
+                    args = (segments_per_doc[doc_index], np.array(embedded.pop(doc_index)), *options)
+                    if executor is None:
+                        yield doc_index, _chunk_embedded_document(*args)
+                    else:
+                        pending[executor.submit(_chunk_embedded_document, *args)] = doc_index
+
+                # Hand back whatever has finished without blocking the next embedding request
+                for future in [f for f in pending if f.done()]:
+                    yield pending.pop(future), future.result()
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
     def _process_single_text(self, text: str, rearrange: bool) -> List[str]:
         segments = self._create_sentence_segments(text)
         embeddings = self._embed_segments(segments)
@@ -50,7 +154,10 @@ class SemanticSplitter:
         if embeddings.shape[0] < 2:
             return [0]
         
-        G = self._create_similarity_graph(embeddings, similarity_threshold=0.55)
+        if self.graph_mode == "sparse":
+            G = self._create_sparse_similarity_graph(embeddings, similarity_threshold=0.55)
+        else:
+            G = self._create_similarity_graph(embeddings, similarity_threshold=0.55)
         
         partition = self._find_optimal_partition(G, resolution=0.35)
         
@@ -111,6 +218,102 @@ class SemanticSplitter:
         G.es['weight'] = similarities[np.where(adjacency_matrix)]
         return G
 
+    def _create_sparse_similarity_graph(self, embeddings: np.ndarray, similarity_threshold: float) -> ig.Graph:
+        """
+        Build the similarity graph from candidate neighbour pairs only, never materialising the N x N matrix.
+
+        Similarities are scaled by the largest candidate similarity, which matches the dense
+        min-max normalisation (the dense minimum is always 0 after clipping and zeroing the diagonal).
+        """
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+
+        if self.window is not None:
+            sources, targets, sims = self._windowed_neighbours(embeddings)
+        else:
+            sources, targets, sims = self._top_k_neighbours(embeddings)
+
+        sims = np.maximum(sims, 0)
+        max_sim = sims.max() if sims.size else 0.0
+        if max_sim > 0:
+            sims = sims / max_sim
+
+        keep = sims >= similarity_threshold
+        sources, targets, sims = sources[keep], targets[keep], sims[keep]
+
+        # Deduplicate undirected pairs, then add both directions so the graph matches the
+        # symmetric directed graph produced by ig.Graph.Adjacency in dense mode
+        low = np.minimum(sources, targets)
+        high = np.maximum(sources, targets)
+        _, unique_idx = np.unique(low.astype(np.int64) * len(embeddings) + high, return_index=True)
+        low, high, sims = low[unique_idx], high[unique_idx], sims[unique_idx]
+
+        edges = np.concatenate([np.stack([low, high], axis=1), np.stack([high, low], axis=1)])
+        weights = np.concatenate([sims, sims])
+
+        G = ig.Graph(n=len(embeddings), edges=edges.tolist(), directed=True)
+        G.es['weight'] = weights.tolist()
+        return G
+
+    def _top_k_neighbours(self, embeddings: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        n = embeddings.shape[0]
+        k = min(self.top_k, n - 1)
+
+        try:
+            import faiss
+        except ModuleNotFoundError:
+            faiss = None
+
+        if faiss is not None:
+            index = faiss.IndexFlatIP(embeddings.shape[1])
+            index.add(embeddings)
+            sims, indices = index.search(embeddings, k + 1)
+            # Drop each segment's self-match (or the extra neighbour when self isn't ranked first)
+            sims[(indices == np.arange(n)[:, None]) | (indices < 0)] = -np.inf
+            order = np.argsort(-sims, axis=1)[:, :k]
+            sources = np.repeat(np.arange(n), k)
+            targets = np.take_along_axis(indices, order, axis=1).ravel()
+            sims = np.take_along_axis(sims, order, axis=1).ravel()
+            valid = np.isfinite(sims)
+            return sources[valid], targets[valid], sims[valid]
+
+        # Blocked matrix multiply: only block_size x N similarities are held in memory at once
+        all_sources, all_targets, all_sims = [], [], []
+        for start in range(0, n, self.block_size):
+            end = min(start + self.block_size, n)
+            block = embeddings[start:end] @ embeddings.T
+            rows = np.arange(end - start)
+            block[rows, rows + start] = -np.inf
+            top = np.argpartition(block, -k, axis=1)[:, -k:]
+            all_sources.append(np.repeat(np.arange(start, end), k))
+            all_targets.append(top.ravel())
+            all_sims.append(block[rows[:, None], top].ravel())
+
+        return np.concatenate(all_sources), np.concatenate(all_targets), np.concatenate(all_sims)
+
+    def _windowed_neighbours(self, embeddings: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        n = embeddings.shape[0]
+        window = min(self.window, n - 1)
+
+        # band[i, window + d] holds sim(i, i + d) for d in [-window, window]
+        band = np.full((n, 2 * window + 1), -np.inf, dtype=np.float32)
+        for d in range(1, window + 1):
+            forward = np.einsum('ij,ij->i', embeddings[:-d], embeddings[d:])
+            band[:-d, window + d] = forward
+            band[d:, window - d] = forward
+
+        offsets = np.arange(-window, window + 1)
+        k = min(self.top_k, 2 * window)
+        if k < 2 * window:
+            cols = np.argpartition(band, -k, axis=1)[:, -k:]
+        else:
+            cols = np.broadcast_to(np.arange(2 * window + 1), (n, 2 * window + 1))
+
+        sources = np.repeat(np.arange(n), cols.shape[1])
+        targets = sources + offsets[cols.ravel()]
+        sims = np.take_along_axis(band, cols, axis=1).ravel()
+        valid = np.isfinite(sims)
+        return sources[valid], targets[valid], sims[valid]
+
     def _find_optimal_partition(self, G: ig.Graph, resolution: float) -> la.VertexPartition:
         return la.find_partition(
             G, 
@@ -136,7 +339,27 @@ class SemanticSplitter:
         
         return new_membership
 
+def _chunk_embedded_document(segments: List[str], embeddings: np.ndarray, graph_mode: str, top_k: int,
+                             window: Optional[int], rearrange: bool) -> List[str]:
+    # Module-level so it can be pickled into a ProcessPoolExecutor worker
+    splitter = SemanticSplitter(graph_mode=graph_mode, top_k=top_k, window=window)
+    communities = splitter._detect_communities(embeddings)
+    chunks = splitter._create_chunks_from_communities(segments, communities, rearrange)
+
+    print(f"Created {len(chunks)} non-empty chunks for this document")
+    return chunks
+
 class SentenceSplitter:
+    # One splitter per language; building one loads its non-breaking prefix lists from disk
+    _splitters: Dict[str, ExternalSentenceSplitter] = {}
+
+    @staticmethod
+    def _get_splitter(language: str) -> ExternalSentenceSplitter:
+        splitter = SentenceSplitter._splitters.get(language)
+        if splitter is None:
+            splitter = SentenceSplitter._splitters.setdefault(language, ExternalSentenceSplitter(language=language))
+        return splitter
+
     @staticmethod
     def split_text_by_sentences(text: str, chunk_size: int = 5, overlap: int = 1, language: str = 'en') -> List[str]:
         """
@@ -148,7 +371,7 @@ class SentenceSplitter:
         :param language: The language of the text (default: 'en').
         :return: A list of text chunks.
         """
-        splitter = ExternalSentenceSplitter(language=language)
+        splitter = SentenceSplitter._get_splitter(language)
         sentences = splitter.split(text)
         chunks = []
         
@@ -158,3 +381,115 @@ class SentenceSplitter:
         
         print(f"Created {len(chunks)} chunks with {chunk_size} sentences each and {overlap} sentence overlap")
         return chunks
+
+    @staticmethod
+    def stream_sentences(source: Union[Iterable[str], TextIO], language: str = 'en',
+                         read_size: int = 65536, max_buffer_chars: int = 100000) -> Iterator[str]:
+        """
+        Incrementally split a stream of text into sentences.
+
+        The last (possibly incomplete) sentence of the buffer is held back until more text arrives,
+        so only the unfinished tail of the input is kept in memory.
+
+        :param source: An iterable of text pieces (e.g. a live transcript feed) or a file-like object.
+        :param language: The language of the text (default: 'en').
+        :param read_size: Number of characters read at a time from file-like sources.
+        :param max_buffer_chars: Flush the buffer as a sentence if it grows past this many characters
+            without a sentence boundary (e.g. unpunctuated transcripts).
+        :return: An iterator of sentences.
+        """
+        splitter = SentenceSplitter._get_splitter(language)
+
+        if hasattr(source, 'read'):
+            source = iter(lambda reader=source: reader.read(read_size), '')
+
+        buffer = ''
+        for piece in source:
+            if not piece:
+                continue
+            buffer += piece
+            sentences = splitter.split(buffer)
+            if not sentences:
+                continue
+
+            for sentence in sentences[:-1]:
+                if sentence:
+                    yield sentence
+
+            tail = sentences[-1]
+            if len(tail) > max_buffer_chars:
+                yield tail
+                buffer = ''
+            else:
+                # The splitter strips whitespace; keep a separator so the next piece doesn't fuse words
+                buffer = tail + ' ' if buffer[-1].isspace() else tail
+
+        for sentence in splitter.split(buffer):
+            if sentence:
+                yield sentence
+
+    @staticmethod
+    def stream_text_by_sentences(source: Union[Iterable[str], TextIO], chunk_size: int = 5, overlap: int = 1,
+                                 language: str = 'en', max_tokens: Optional[int] = None, overlap_tokens: int = 0,
+                                 token_counter: Optional[Callable[[str], int]] = None) -> Iterator[str]:
+        """
+        Stream overlapping sentence-window chunks from an iterable or file-like source.
+
+        Windows are measured in sentences by default. When max_tokens is set, each window instead holds
+        as many whole sentences as fit in max_tokens (a single longer sentence forms its own chunk), and
+        the trailing sentences totalling at most overlap_tokens are carried into the next window.
+
+        :param source: An iterable of text pieces or a file-like object.
+        :param chunk_size: The number of sentences per chunk (sentence-count windows).
+        :param overlap: The number of sentences to overlap between chunks (sentence-count windows).
+        :param language: The language of the text (default: 'en').
+        :param max_tokens: Maximum tokens per chunk; enables token-count windows.
+        :param overlap_tokens: Maximum tokens to overlap between chunks (token-count windows).
+        :param token_counter: Function returning the token count of a sentence. Defaults to a whitespace word count.
+        :return: An iterator of text chunks.
+        """
+        if max_tokens is None and not 0 <= overlap < chunk_size:
+            raise ValueError("overlap must be non-negative and smaller than chunk_size")
+        if max_tokens is not None and not 0 <= overlap_tokens < max_tokens:
+            raise ValueError("overlap_tokens must be non-negative and smaller than max_tokens")
+
+        count_tokens = token_counter or (lambda sentence: len(sentence.split()))
+        window = deque()  # (sentence, token_count)
+        window_tokens = 0
+        carried = 0  # sentences in the window that were already emitted as overlap
+
+        def carry_over() -> None:
+            nonlocal window_tokens, carried
+            if max_tokens is None:
+                keep = overlap
+            else:
+                keep, kept_tokens = 0, 0
+                for _, tokens in reversed(window):
+                    if kept_tokens + tokens > overlap_tokens:
+                        break
+                    kept_tokens += tokens
+                    keep += 1
+            while len(window) > keep:
+                window_tokens -= window.popleft()[1]
+            carried = len(window)
+
+        for sentence in SentenceSplitter.stream_sentences(source, language):
+            tokens = count_tokens(sentence) if max_tokens is not None else 0
+
+            if max_tokens is not None and len(window) > carried and window_tokens + tokens > max_tokens:
+                yield ' '.join(s for s, _ in window).strip()
+                carry_over()
+                # Drop overlap that would push the new sentence over the limit on its own
+                while window and window_tokens + tokens > max_tokens:
+                    window_tokens -= window.popleft()[1]
+                carried = len(window)
+
+            window.append((sentence, tokens))
+            window_tokens += tokens
+
+            if max_tokens is None and len(window) == chunk_size:
+                yield ' '.join(s for s, _ in window).strip()
+                carry_over()
+
+        if len(window) > carried:
+            yield ' '.join(s for s, _ in window).strip()
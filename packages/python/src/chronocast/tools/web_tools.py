@@ -1,20 +1,24 @@
 import os
 import json
-from typing import Any, List, Dict, Union, Literal, Optional
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, List, Dict, Tuple, Union, Literal, Optional
 from bs4 import BeautifulSoup
+import httpx
 import requests
-import time
 import random
-from fake_useragent import UserAgent
 from dotenv import load_dotenv
+from .http_utils import get_user_agent, request_with_backoff, run_sync
+from .http_cache import get_http_cache
 
 class WebTools:
     @staticmethod
-    def exa_search(queries: Union[str, List[str]], num_results: int = 10, search_type: str = "neural", num_sentences: int = 5, highlights_per_url: int = 3) -> dict:
+    def exa_search(queries: Union[str, List[str]], num_results: int = 10, search_type: str = "neural", num_sentences: int = 5, highlights_per_url: int = 3,
+                   max_concurrency: int = 8, deduplicate: bool = True) -> dict:
         """
         Searches the internet using the Exa search engine and returns a structured response.
 
-        This function sends one or more search queries to the Exa API, processes the responses,
+        This function sends one or more search queries to the Exa API concurrently, processes the responses,
         and returns a structured dictionary containing the search results.
 
         Args:
@@ -23,6 +27,8 @@ class WebTools:
             search_type (str, optional): The type of search to perform. Can be 'neural' or 'keyword'. Defaults to 'neural'.
             num_sentences (int, optional): The number of sentences to include in each highlight. Defaults to 3.
             highlights_per_url (int, optional): The number of highlights to include per URL. Defaults to 3.
+            max_concurrency (int, optional): Maximum number of queries in flight at once. Defaults to 8.
+            deduplicate (bool, optional): Drop results whose URL was already returned for an earlier query. Defaults to True.
 
         Returns:
             dict: A structured dictionary containing the search results. The dictionary includes:
@@ -64,12 +70,7 @@ class WebTools:
             "x-api-key": api_key  # Use the retrieved API key
         }
 
-        structured_data = {
-            "queries": queries,
-            "results": []
-        }
-
-        for query in queries:
+        def search(query: str) -> List[Dict[str, Any]]:
             # Define the payload
             payload = {
                 "query": query,
@@ -85,50 +86,58 @@ class WebTools:
                 }
             }
 
-            # Attempt to make the POST request with retries
-            for attempt in range(3):  # Retry up to 3 times
-                try:
-                    response = requests.post(url, headers=headers, json=payload)
-                    response.raise_for_status()  # Will raise an exception for HTTP errors
-                    # Print the raw response
-                    #print(f"DEBUG: Raw API response for query '{query}': {response.text}")
-                    # Restructure and clean up the response data
-                    data = response.json()
-                    query_results = {
-                        "query": query,
-                        "data": []
+            try:
+                response = request_with_backoff(
+                    lambda: get_http_cache().post(url, namespace="exa", headers=headers, json=payload)
+                )
+                response.raise_for_status()  # Will raise an exception for HTTP errors
+                # Restructure and clean up the response data
+                data = response.json()
+                return [
+                    {
+                        "title": result["title"],
+                        "url": result["url"],
+                        "author": result["author"],
+                        "highlights": "\n".join(result["highlights"])
                     }
-                    for result in data["results"]:
-                        structured_result = {
-                            "title": result["title"],
-                            "url": result["url"],
-                            "author": result["author"],
-                            "highlights": "\n".join(result["highlights"])
-                        }
-                        query_results["data"].append(structured_result)
-                    
-                    structured_data["results"].append(query_results)
-                    break  # Success, break the retry loop
-                
-                except requests.exceptions.HTTPError as e:
-                    print(f"HTTP error occurred for query '{query}': {e}")
-                except requests.exceptions.RequestException as e:
-                    print(f"Error during request to Exa for query '{query}': {e}")
-                except ValueError as e:
-                    print(f"Error decoding JSON for query '{query}': {e}")
+                    for result in data["results"]
+                ]
+            except requests.exceptions.HTTPError as e:
+                print(f"HTTP error occurred for query '{query}': {e}")
+            except requests.exceptions.RequestException as e:
+                print(f"Error during request to Exa for query '{query}': {e}")
+            except ValueError as e:
+                print(f"Error decoding JSON for query '{query}': {e}")
+
+            print(f"All attempts failed for query '{query}'. Adding empty result.")
+            return []
 
-                if attempt < 2:  # Don't sleep after the last attempt
-                    print(f"Retrying query '{query}'...")
-                    time.sleep(1)  # Wait for 1 second before retrying
+        structured_data = {
+            "queries": queries,
+            "results": []
+        }
 
-            else:  # This else clause is executed if the for loop completes without breaking
-                print(f"All attempts failed for query '{query}'. Adding empty result.")
-                structured_data["results"].append({"query": query, "data": []})
+        seen_urls = set()
+        for query, data in zip(queries, WebTools._map_queries(search, queries, max_concurrency)):
+            if deduplicate:
+                data = [result for result in data if result["url"] not in seen_urls]
+                seen_urls.update(result["url"] for result in data)
+            structured_data["results"].append({"query": query, "data": data})
 
         return structured_data
 
     @staticmethod
-    def scrape_urls(urls: Union[str, List[str]], include_html: bool = False, include_links: bool = False) -> List[Dict[str, Any]]:
+    def _map_queries(search, queries: List[str], max_concurrency: int) -> List[Any]:
+        # Results keep the order of `queries` so de-duplication favours earlier queries
+        if len(queries) <= 1 or max_concurrency <= 1:
+            return [search(query) for query in queries]
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(queries))) as executor:
+            return list(executor.map(search, queries))
+
+    @staticmethod
+    def scrape_urls(urls: Union[str, List[str]], include_html: bool = False, include_links: bool = False,
+                    max_concurrency: int = 10, per_host_concurrency: int = 2, politeness_delay: float = 0.25,
+                    max_bytes: int = 5_000_000, timeout: float = 10) -> List[Dict[str, Any]]:
         """
         Scrape one or more webpages and return the content.
 
@@ -136,65 +145,151 @@ class WebTools:
             urls (Union[str, List[str]]): A single URL string or a list of URL strings to scrape.
             include_html (bool, optional): Whether to include the HTML content of the page. Defaults to False.
             include_links (bool, optional): Whether to include the links on the page. Defaults to False.
+            max_concurrency (int, optional): Maximum number of pages fetched at once. Defaults to 10.
+            per_host_concurrency (int, optional): Maximum number of pages fetched at once from the same host. Defaults to 2.
+            politeness_delay (float, optional): Minimum seconds between request starts to the same host. Defaults to 0.25.
+            max_bytes (int, optional): Pages are truncated after this many bytes. Defaults to 5,000,000.
+            timeout (float, optional): Request timeout in seconds. Defaults to 10.
 
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, each containing the URL and the scraped content.
         """
+        return run_sync(WebTools.scrape_urls_async(
+            urls, include_html, include_links, max_concurrency, per_host_concurrency, politeness_delay, max_bytes, timeout
+        ))
+
+    @staticmethod
+    async def scrape_urls_async(urls: Union[str, List[str]], include_html: bool = False, include_links: bool = False,
+                                max_concurrency: int = 10, per_host_concurrency: int = 2, politeness_delay: float = 0.25,
+                                max_bytes: int = 5_000_000, timeout: float = 10) -> List[Dict[str, Any]]:
+        """
+        Scrape one or more webpages concurrently and return the content.
+
+        Args:
+            urls (Union[str, List[str]]): A single URL string or a list of URL strings to scrape.
+            include_html (bool, optional): Whether to include the HTML content of the page. Defaults to False.
+            include_links (bool, optional): Whether to include the links on the page. Defaults to False.
+            max_concurrency (int, optional): Maximum number of pages fetched at once. Defaults to 10.
+            per_host_concurrency (int, optional): Maximum number of pages fetched at once from the same host. Defaults to 2.
+            politeness_delay (float, optional): Minimum seconds between request starts to the same host. Defaults to 0.25.
+            max_bytes (int, optional): Pages are truncated after this many bytes. Defaults to 5,000,000.
+            timeout (float, optional): Request timeout in seconds. Defaults to 10.
+
+        Returns:
+            List[Dict[str, Any]]: A list of dictionaries, each containing the URL and the scraped content, in the order of `urls`.
+        """
         if isinstance(urls, str):
             urls = [urls]
-        
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(urls)
+        async for index, result in WebTools.iter_scrape_urls(
+            urls, include_html, include_links, max_concurrency, per_host_concurrency, politeness_delay, max_bytes, timeout
+        ):
+            results[index] = result
+        return results
+
+    @staticmethod
+    async def iter_scrape_urls(urls: Union[str, List[str]], include_html: bool = False, include_links: bool = False,
+                               max_concurrency: int = 10, per_host_concurrency: int = 2, politeness_delay: float = 0.25,
+                               max_bytes: int = 5_000_000, timeout: float = 10) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Scrape webpages concurrently, yielding each result as soon as its page has been fetched and parsed.
+
+        Takes the same arguments as scrape_urls_async.
+
+        Yields:
+            Tuple[int, Dict[str, Any]]: The index of the URL in `urls` and its scraped result.
+        """
+        if isinstance(urls, str):
+            urls = [urls]
+
         if not isinstance(include_html, bool) or not isinstance(include_links, bool):
             raise ValueError("include_html and include_links must be boolean values")
 
-        results = []
-        ua = UserAgent()
+        ua = get_user_agent()
+        global_limit = asyncio.Semaphore(max_concurrency)
+        host_limits: Dict[str, asyncio.Semaphore] = {}
+        host_next_start: Dict[str, float] = {}
+        loop = asyncio.get_running_loop()
+
+        async def wait_for_turn(host: str) -> None:
+            # Reserve the next start slot for this host before sleeping so concurrent fetches queue up behind it
+            now = loop.time()
+            start = max(now, host_next_start.get(host, now))
+            host_next_start[host] = start + politeness_delay * random.uniform(1, 1.5)
+            if start > now:
+                await asyncio.sleep(start - now)
+
+        async def fetch(index: int, url: str, client: httpx.AsyncClient) -> Tuple[int, Dict[str, Any]]:
+            try:
+                host = httpx.URL(url).host if url.startswith(("http://", "https://")) else url
+                host_limit = host_limits.setdefault(host, asyncio.Semaphore(per_host_concurrency))
+                async with global_limit, host_limit:
+                    await wait_for_turn(host)
+                    async with client.stream("GET", url, headers={'User-Agent': ua.random}) as response:
+                        response.raise_for_status()
+                        body = bytearray()
+                        async for chunk in response.aiter_bytes():
+                            body.extend(chunk)
+                            if len(body) >= max_bytes:
+                                del body[max_bytes:]
+                                break
+                        encoding = response.charset_encoding
+
+                # Parsing is CPU-bound; keep it off the event loop so other downloads keep flowing
+                result = await asyncio.to_thread(
+                    WebTools._extract_page_content, url, bytes(body), encoding, include_html, include_links
+                )
+                return index, result
+            except (httpx.HTTPError, httpx.InvalidURL) as e:
+                # InvalidURL is not an HTTPError; UnsupportedProtocol is, via TransportError
+                return index, {'url': url, 'error': f"Error fetching {url}: {str(e)}"}
+            except UnicodeDecodeError as e:
+                return index, {'url': url, 'error': f"Encoding error for {url}: {str(e)}"}
+            except (AttributeError, ValueError, TypeError) as e:
+                return index, {'url': url, 'error': f"Error processing {url}: {str(e)}"}
 
-        for url in urls:
+        limits = httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+        async with httpx.AsyncClient(limits=limits, timeout=timeout, follow_redirects=True) as client:
+            tasks = [asyncio.create_task(fetch(index, url, client)) for index, url in enumerate(urls)]
             try:
-                time.sleep(random.uniform(.1, .3))
-                headers = {'User-Agent': ua.random}
-                response = requests.get(url, headers=headers, timeout=10)
-                response.raise_for_status()
-                response.encoding = response.apparent_encoding
+                for task in asyncio.as_completed(tasks):
+                    yield await task
+            finally:
+                for task in tasks:
+                    task.cancel()
 
-                soup = BeautifulSoup(response.text, 'html.parser')
+    @staticmethod
+    def _extract_page_content(url: str, body: bytes, encoding: Optional[str], include_html: bool, include_links: bool) -> Dict[str, Any]:
+        soup = BeautifulSoup(body, 'lxml', from_encoding=encoding)
 
-                # Remove common non-content elements
-                for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-                    element.decompose()
+        # Remove common non-content elements
+        for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
+            element.decompose()
 
-                # Try to find the main content
-                main_content = soup.find('main') or soup.find('article') or soup.find('div', class_='content')
-                
-                if main_content:
-                    content_soup = main_content
-                else:
-                    # If no main content found, use the whole body but remove potential sidebars
-                    content_soup = soup.find('body')
-                    if content_soup:
-                        for sidebar in content_soup(['aside', 'div'], class_=['sidebar', 'widget']):
-                            sidebar.decompose()
-
-                result: Dict[str, Any] = {'url': url}
+        # Try to find the main content
+        main_content = soup.find('main') or soup.find('article') or soup.find('div', class_='content')
+        
+        if main_content:
+            content_soup = main_content
+        else:
+            # If no main content found, use the whole body but remove potential sidebars
+            content_soup = soup.find('body')
+            if content_soup:
+                for sidebar in content_soup(['aside', 'div'], class_=['sidebar', 'widget']):
+                    sidebar.decompose()
 
-                if include_html:
-                    result['content'] = str(content_soup) if content_soup else ''
-                else:
-                    result['content'] = content_soup.get_text(separator=' ', strip=True) if content_soup else ''
+        result: Dict[str, Any] = {'url': url}
 
-                if include_links:
-                    result['links'] = [a['href'] for a in (content_soup.find_all('a', href=True) if content_soup else [])]
+        if include_html:
+            result['content'] = str(content_soup) if content_soup else ''
+        else:
+            result['content'] = content_soup.get_text(separator=' ', strip=True) if content_soup else ''
 
-                results.append(result)
+        if include_links:
+            result['links'] = [a['href'] for a in (content_soup.find_all('a', href=True) if content_soup else [])]
 
-            except requests.RequestException as e:
-                results.append({'url': url, 'error': f"Error fetching {url}: {str(e)}"})
-            except UnicodeDecodeError as e:
-                results.append({'url': url, 'error': f"Encoding error for {url}: {str(e)}"})
-            except (AttributeError, ValueError, TypeError) as e:
-                results.append({'url': url, 'error': f"Error processing {url}: {str(e)}"})
-
-        return results
+        return result
 
     @staticmethod
     def serper_search(
@@ -202,17 +297,21 @@ class WebTools:
         search_type: Literal["search", "news", "images", "shopping"] = "search",
         num_results: Optional[int] = range(3, 10),
         date_range: Optional[Literal["h", "d", "w", "m", "y"]] = None,
-        location: Optional[str] = None
+        location: Optional[str] = None,
+        max_concurrency: int = 8,
+        deduplicate: bool = True
     ) -> Union[str, List[str]]:
         """
         Perform a search using the Serper API and format the results.
 
         Args:
-            query (Union[str, List[str]]): The search query or a list of search queries.
+            query (Union[str, List[str]]): The search query or a list of search queries. Multiple queries are sent concurrently.
             search_type (Literal["search", "news", "images", "shopping"]): The type of search to perform.
             num_results (Optional[int]): Number of results to return (default range: 3-10).
             date_range (Optional[Literal["h", "d", "w", "m", "y"]]): Date range for results (h: hour, d: day, w: week, m: month, y: year).
             location (Optional[str]): Specific location for the search.
+            max_concurrency (int): Maximum number of queries in flight at once. Defaults to 8.
+            deduplicate (bool): Drop results whose URL was already returned for an earlier query. Defaults to True.
 
         Returns:
             Union[str, List[str]]: A formatted string or list of formatted strings containing the search results.
@@ -238,9 +337,13 @@ class WebTools:
         # Convert query to list if it's a string
         queries = [query] if isinstance(query, str) else query
 
-        results_list = []
+        # Prepare headers
+        headers = {
+            "X-API-KEY": api_key,
+            "Content-Type": "application/json"
+        }
 
-        for single_query in queries:
+        def search(single_query: str) -> Union[dict, str]:
             # Prepare the payload
             payload = {
                 "q": single_query,
@@ -248,8 +351,8 @@ class WebTools:
                 "hl": "en",
             }
 
-            # Add num_results to payload if provided
-            if num_results is not None:
+            # Add num_results to payload if provided (the range default isn't a valid value, so the API default applies)
+            if isinstance(num_results, int):
                 payload["num"] = num_results
 
             # Add optional parameters if provided
@@ -258,63 +361,76 @@ class WebTools:
             if location:
                 payload["location"] = location
 
-            # Prepare headers
-            headers = {
-                "X-API-KEY": api_key,
-                "Content-Type": "application/json"
-            }
-
             try:
                 # Make the API call
-                response = requests.post(url, headers=headers, data=json.dumps(payload))
+                response = request_with_backoff(
+                    lambda: get_http_cache().post(url, namespace="serper", headers=headers, data=json.dumps(payload))
+                )
                 response.raise_for_status()  # Raise an exception for HTTP errors
                 
                 # Parse the JSON response
-                results = response.json()
-                
-                # Format the results
-                formatted_results = ""
-
-                if "organic" in results:
-                    formatted_results += "Organic Results:\n"
-                    for i, result in enumerate(results["organic"], 1):
-                        formatted_results += f"{i}. {result.get('title', 'No Title')}\n"
-                        formatted_results += f"   URL: {result.get('link', 'No Link')}\n"
-                        formatted_results += f"   Snippet: {result.get('snippet', 'No Snippet')}\n\n"
-
-                if "news" in results:
-                    formatted_results += "News Results:\n"
-                    for i, news in enumerate(results["news"], 1):
-                        formatted_results += f"{i}. {news.get('title', 'No Title')}\n"
-                        formatted_results += f"   Source: {news.get('source', 'No Source')}\n"
-                        formatted_results += f"   URL: {news.get('link', 'No Link')}\n"
-                        formatted_results += f"   Date: {news.get('date', 'No Date')}\n"
-                        formatted_results += f"   Snippet: {news.get('snippet', 'No Snippet')}\n"
-                        formatted_results += f"   Image URL: {news.get('imageUrl', 'No Image URL')}\n\n"
-
-                if "images" in results:
-                    formatted_results += "Image Results:\n"
-                    for i, image in enumerate(results["images"], 1):
-                        formatted_results += f"{i}. {image.get('title', 'No Title')}\n"
-                        formatted_results += f"   URL: {image.get('link', 'No Link')}\n"
-                        formatted_results += f"   Source: {image.get('source', 'No Source')}\n\n"
-
-                if "shopping" in results:
-                    formatted_results += "Shopping Results:\n"
-                    for i, item in enumerate(results["shopping"], 1):
-                        formatted_results += f"{i}. {item.get('title', 'No Title')}\n"
-                        formatted_results += f"   Price: {item.get('price', 'No Price')}\n"
-                        formatted_results += f"   URL: {item.get('link', 'No Link')}\n\n"
-
-                results_list.append(formatted_results.strip())
-            
+                return response.json()
             except requests.RequestException as e:
-                results_list.append(f"Error making request to Serper API for query '{single_query}': {str(e)}")
+                return f"Error making request to Serper API for query '{single_query}': {str(e)}"
             except json.JSONDecodeError:
-                results_list.append(f"Error decoding JSON response from Serper API for query '{single_query}'")
+                return f"Error decoding JSON response from Serper API for query '{single_query}'"
+
+        results_list = []
+        seen_links = set()
+
+        for results in WebTools._map_queries(search, queries, max_concurrency):
+            if isinstance(results, str):
+                results_list.append(results)
+                continue
+
+            if deduplicate:
+                for section in ("organic", "news", "images", "shopping"):
+                    if section in results:
+                        fresh = [item for item in results[section] if item.get('link') not in seen_links]
+                        seen_links.update(item.get('link') for item in fresh if item.get('link'))
+                        results[section] = fresh
+
+            results_list.append(WebTools._format_serper_results(results))
 
         return results_list[0] if len(results_list) == 1 else results_list
 
+    @staticmethod
+    def _format_serper_results(results: dict) -> str:
+        formatted_results = ""
+
+        if "organic" in results:
+            formatted_results += "Organic Results:\n"
+            for i, result in enumerate(results["organic"], 1):
+                formatted_results += f"{i}. {result.get('title', 'No Title')}\n"
+                formatted_results += f"   URL: {result.get('link', 'No Link')}\n"
+                formatted_results += f"   Snippet: {result.get('snippet', 'No Snippet')}\n\n"
+
+        if "news" in results:
+            formatted_results += "News Results:\n"
+            for i, news in enumerate(results["news"], 1):
+                formatted_results += f"{i}. {news.get('title', 'No Title')}\n"
+                formatted_results += f"   Source: {news.get('source', 'No Source')}\n"
+                formatted_results += f"   URL: {news.get('link', 'No Link')}\n"
+                formatted_results += f"   Date: {news.get('date', 'No Date')}\n"
+                formatted_results += f"   Snippet: {news.get('snippet', 'No Snippet')}\n"
+                formatted_results += f"   Image URL: {news.get('imageUrl', 'No Image URL')}\n\n"
+
+        if "images" in results:
+            formatted_results += "Image Results:\n"
+            for i, image in enumerate(results["images"], 1):
+                formatted_results += f"{i}. {image.get('title', 'No Title')}\n"
+                formatted_results += f"   URL: {image.get('link', 'No Link')}\n"
+                formatted_results += f"   Source: {image.get('source', 'No Source')}\n\n"
+
+        if "shopping" in results:
+            formatted_results += "Shopping Results:\n"
+            for i, item in enumerate(results["shopping"], 1):
+                formatted_results += f"{i}. {item.get('title', 'No Title')}\n"
+                formatted_results += f"   Price: {item.get('price', 'No Price')}\n"
+                formatted_results += f"   URL: {item.get('link', 'No Link')}\n\n"
+
+        return formatted_results.strip()
+
     @staticmethod
     def scrape_url_with_serper(urls: Union[str, List[str]]) -> Union[dict, List[dict]]:
         """
@@ -403,7 +519,7 @@ class WebTools:
         }
 
         try:
-            response = requests.get(base_url, params=params)
+            response = get_http_cache().get(base_url, namespace="arxiv", params=params)
             response.raise_for_status()
             feed = BeautifulSoup(response.text, "lxml-xml")
             entries = feed.find_all("entry")
@@ -488,7 +604,7 @@ class WebTools:
             params['forecast_days'] = 1
 
         try:
-            response = requests.get(f"{BASE_URL}/{endpoint}", params=params)
+            response = get_http_cache().get(f"{BASE_URL}/{endpoint}", namespace="weather", params=params)
             response.raise_for_status()
             data = response.json()
             
@@ -1,5 +1,6 @@
 import requests
 from typing import List, Dict, Optional
+from .http_cache import get_http_cache
 
 class WikipediaTools:
     @staticmethod
@@ -43,7 +44,7 @@ class WikipediaTools:
         }
 
         try:
-            response = requests.get(base_url, params=params)
+            response = get_http_cache().get(base_url, namespace="wikipedia", params=params)
             response.raise_for_status()
             data = response.json()
             pages = data["query"]["pages"]
@@ -83,41 +84,30 @@ class WikipediaTools:
         """
         print(f"Searching articles for query: {query}")
         base_url = "https://en.wikipedia.org/w/api.php"
+        # One generator query returns the search hits together with their extracts, URLs and thumbnails
         params = {
             "action": "query",
-            "list": "search",
-            "srsearch": query,
-            "srlimit": num_results,
+            "generator": "search",
+            "gsrsearch": query,
+            "gsrlimit": num_results,
+            "prop": "info|extracts|pageimages",
+            "inprop": "url",
+            "exintro": "",
+            "explaintext": "",
+            "exlimit": "max",
+            "pithumbsize": "250",
+            "pilimit": "max",
             "format": "json",
             "origin": "*"
         }
 
         try:
-            response = requests.get(base_url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            search_results = data["query"]["search"]
+            pages = WikipediaTools._query_pages(base_url, params)
+            # Pages come back keyed by page id; 'index' holds the search rank
+            ranked = sorted(pages.values(), key=lambda page: page.get("index", 0))
 
-            # Fetch additional details for each search result
             detailed_results = []
-            for result in search_results:
-                page_id = result['pageid']
-                detailed_params = {
-                    "action": "query",
-                    "pageids": page_id,
-                    "prop": "info|extracts|pageimages",
-                    "inprop": "url",
-                    "exintro": "",
-                    "explaintext": "",
-                    "pithumbsize": "250",
-                    "format": "json",
-                    "origin": "*"
-                }
-                detailed_response = requests.get(base_url, params=detailed_params)
-                detailed_response.raise_for_status()
-                detailed_data = detailed_response.json()
-                page_data = detailed_data["query"]["pages"][str(page_id)]
-                
+            for page_data in ranked:
                 detailed_result = {
                     "title": page_data.get("title"),
                     "fullurl": page_data.get("fullurl"),
@@ -164,7 +154,7 @@ class WikipediaTools:
         }
 
         try:
-            response = requests.get(base_url, params=params)
+            response = get_http_cache().get(base_url, namespace="wikipedia", params=params)
             response.raise_for_status()
             data = response.json()
             pages = data["query"]["pages"]
@@ -181,6 +171,86 @@ class WikipediaTools:
             print(f"Error parsing response: {e}")
             return None
 
+    @staticmethod
+    def get_main_images(titles: List[str], thumb_size: int = 250) -> Dict[str, Optional[str]]:
+        """
+        Retrieve the main images for several Wikipedia articles in as few requests as possible.
+
+        Args:
+            titles (List[str]): The titles of the Wikipedia articles.
+            thumb_size (int, optional): The desired size of the thumbnails in pixels. Defaults to 250.
+
+        Returns:
+            Dict[str, Optional[str]]: The image URL for each requested title, or None if the article has no image
+            or could not be found.
+
+        Raises:
+            requests.exceptions.RequestException: If there's an error in the HTTP request.
+            KeyError, ValueError: If there's an error parsing the API response.
+        """
+        print(f"Getting main images for {len(titles)} titles")
+        base_url = "https://en.wikipedia.org/w/api.php"
+        images: Dict[str, Optional[str]] = {title: None for title in titles}
+
+        try:
+            # The API accepts up to 50 titles per request
+            for i in range(0, len(titles), 50):
+                batch = titles[i:i + 50]
+                params = {
+                    "action": "query",
+                    "titles": "|".join(batch),
+                    "prop": "pageimages",
+                    "pithumbsize": thumb_size,
+                    "pilimit": "max",
+                    "redirects": "",
+                    "format": "json",
+                    "origin": "*"
+                }
+                aliases: Dict[str, str] = {}
+                pages = WikipediaTools._query_pages(base_url, params, aliases)
+                by_title = {page.get("title"): page for page in pages.values()}
+                for title in batch:
+                    resolved = title
+                    while resolved in aliases:
+                        resolved = aliases[resolved]
+                    page = by_title.get(resolved)
+                    if page and page.get("thumbnail"):
+                        images[title] = page["thumbnail"]["source"]
+            return images
+        except requests.exceptions.RequestException as e:
+            print(f"Error fetching main images: {e}")
+            return images
+        except (KeyError, ValueError) as e:
+            print(f"Error parsing response: {e}")
+            return images
+
+    @staticmethod
+    def _query_pages(base_url: str, params: Dict[str, str], aliases: Optional[Dict[str, str]] = None) -> Dict[str, dict]:
+        """
+        Run a MediaWiki query, following prop continuations so every page's properties are complete.
+
+        Generator continuations (the next page of search results) are not followed, so the number of pages
+        stays within the requested limit. Title normalizations and redirects are recorded in `aliases`.
+        """
+        pages: Dict[str, dict] = {}
+        params = dict(params)
+        while True:
+            response = get_http_cache().get(base_url, namespace="wikipedia", params=params)
+            response.raise_for_status()
+            data = response.json()
+            query = data.get("query", {})
+
+            for page_id, page in query.get("pages", {}).items():
+                pages.setdefault(page_id, {}).update(page)
+            if aliases is not None:
+                for mapping in query.get("normalized", []) + query.get("redirects", []):
+                    aliases[mapping["from"]] = mapping["to"]
+
+            continuation = data.get("continue", {})
+            if not any(key not in ("continue", "gsroffset") for key in continuation):
+                return pages
+            params.update(continuation)
+
     @staticmethod
     def search_images(query: str, limit: int = 20, thumb_size: int = 250) -> List[Dict[str, str]]:
         """
@@ -211,18 +281,16 @@ class WikipediaTools:
             "gsrlimit": limit,
             "prop": "pageimages|info",
             "pithumbsize": thumb_size,
+            "pilimit": "max",
             "inprop": "url",
             "format": "json",
             "origin": "*"
         }
 
         try:
-            response = requests.get(base_url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            pages = data["query"]["pages"]
+            pages = WikipediaTools._query_pages(base_url, params)
             image_results = []
-            for page_id, page_data in pages.items():
+            for page_data in sorted(pages.values(), key=lambda page: page.get("index", 0)):
                 image_info = {
                     "title": page_data["title"],
                     "url": page_data["fullurl"],
@@ -1,5 +1,7 @@
 import json
-from typing import List, Dict, Any, Union
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Union, Optional, Tuple
 
 def check_yfinance():
     try:
@@ -22,8 +24,208 @@ def check_pandas():
     except ImportError:
         raise ImportError("pandas is required for YahooFinanceTools. Install with `pip install pandas`")
 
+INTRADAY_INTERVALS = {"1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h"}
+
+def _interval_delta(interval: str) -> timedelta:
+    """Approximate length of one bar."""
+    if interval.endswith("mo"):
+        return timedelta(days=31 * int(interval[:-2]))
+    if interval.endswith("wk"):
+        return timedelta(weeks=int(interval[:-2]))
+    unit = {"m": "minutes", "h": "hours", "d": "days"}[interval[-1]]
+    return timedelta(**{unit: int(interval[:-1])})
+
+def _period_range(period: str, now: Optional[datetime] = None) -> Tuple[datetime, datetime]:
+    """Convert a yfinance period such as "5d", "3mo", "1y", "ytd" or "max" to a (start, end) range ending now."""
+    pd = check_pandas()
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+    if period == "max":
+        return datetime(1970, 1, 1), now
+    if period == "ytd":
+        return datetime(now.year, 1, 1), now
+    if period.endswith("mo"):
+        offset = pd.DateOffset(months=int(period[:-2]))
+    elif period.endswith("y"):
+        offset = pd.DateOffset(years=int(period[:-1]))
+    elif period.endswith("wk"):
+        offset = pd.DateOffset(weeks=int(period[:-2]))
+    elif period.endswith("d"):
+        # Day periods count trading days
+        offset = pd.offsets.BDay(int(period[:-1]))
+    else:
+        raise ValueError(f"Unsupported period: {period}")
+    return (pd.Timestamp(now) - offset).to_pydatetime(), now
+
+class PriceCache:
+    def __init__(self, max_staleness: float = 900.0):
+        """
+        In-process OHLCV cache keyed by ticker and interval.
+
+        Each ticker/interval pair is held as a time-indexed DataFrame together with the date ranges that have
+        already been downloaded, so a request only downloads the parts of its range not covered yet. Tickers
+        missing the same range are downloaded together in one `yf.download` call.
+
+        Args:
+            max_staleness (float, optional): Seconds a range ending at the present stays current before its latest
+                bars are refreshed. Defaults to 900.
+        """
+        self.max_staleness = timedelta(seconds=max_staleness)
+        self._frames: Dict[Tuple[str, str], Any] = {}
+        self._covered: Dict[Tuple[str, str], List[Tuple[datetime, datetime]]] = {}
+        self._lock = threading.Lock()
+        self.downloads = 0
+
+    def get(self, tickers: List[str], start: datetime, end: datetime, interval: str = "1d") -> Dict[str, Any]:
+        """
+        Get OHLCV history for several tickers, downloading only what is missing.
+
+        Args:
+            tickers (List[str]): Ticker symbols.
+            start (datetime): Start of the range (UTC).
+            end (datetime): End of the range (UTC).
+            interval (str, optional): Bar interval. Defaults to "1d".
+
+        Returns:
+            Dict[str, DataFrame]: A DataFrame per ticker indexed by timestamp, restricted to [start, end].
+        """
+        pd = check_pandas()
+        tickers = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+
+        # Group tickers by the exact gaps they are missing so each distinct gap is downloaded once
+        groups: Dict[Tuple[Tuple[datetime, datetime], ...], List[str]] = {}
+        with self._lock:
+            for ticker in tickers:
+                gaps = tuple(self._missing(self._covered.get((ticker, interval), []), start, end))
+                if gaps:
+                    groups.setdefault(gaps, []).append(ticker)
+
+        for gaps, group in groups.items():
+            for gap_start, gap_end in gaps:
+                self._download(group, gap_start, gap_end, interval)
+
+        with self._lock:
+            result = {}
+            for ticker in tickers:
+                frame = self._frames.get((ticker, interval))
+                if frame is None:
+                    result[ticker] = pd.DataFrame()
+                else:
+                    result[ticker] = frame.loc[pd.Timestamp(start):pd.Timestamp(end)]
+            return result
+
+    def panel(self, tickers: List[str], start: datetime, end: datetime, interval: str = "1d", field: str = "Close") -> Any:
+        """
+        Get one field for several tickers as a single DataFrame with a column per ticker.
+
+        Args:
+            tickers (List[str]): Ticker symbols.
+            start (datetime): Start of the range (UTC).
+            end (datetime): End of the range (UTC).
+            interval (str, optional): Bar interval. Defaults to "1d".
+            field (str, optional): Price field, e.g. "Close" or "Volume". Defaults to "Close".
+
+        Returns:
+            DataFrame: Values indexed by timestamp, one column per ticker.
+        """
+        pd = check_pandas()
+        frames = self.get(tickers, start, end, interval)
+        columns = {ticker: frame[field] for ticker, frame in frames.items() if field in frame}
+        panel = pd.DataFrame(columns)
+        return panel.reindex(columns=[ticker for ticker in frames if ticker in columns])
+
+    def clear(self) -> None:
+        """Drop all cached history."""
+        with self._lock:
+            self._frames.clear()
+            self._covered.clear()
+
+    def _missing(self, covered: List[Tuple[datetime, datetime]], start: datetime, end: datetime) -> List[Tuple[datetime, datetime]]:
+        gaps = []
+        cursor = start
+        for covered_start, covered_end in covered:
+            if covered_end <= cursor:
+                continue
+            if covered_start >= end:
+                break
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start))
+            cursor = max(cursor, covered_end)
+        if cursor < end:
+            gaps.append((cursor, end))
+        # A short gap at the present is tolerated until the cached bars are max_staleness old
+        return [(gap_start, gap_end) for gap_start, gap_end in gaps if gap_end - gap_start > self.max_staleness or gap_end != end]
+
+    def _download(self, tickers: List[str], start: datetime, end: datetime, interval: str) -> None:
+        pd = check_pandas()
+        yf = check_yfinance()
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        # Refetch the bar at the boundary, which may have been partial when it was cached
+        fetch_start = start - _interval_delta(interval)
+        fetch_end = None if end >= now - self.max_staleness else end + _interval_delta(interval)
+        if interval not in INTRADAY_INTERVALS:
+            fetch_start = fetch_start.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        data = yf.download(tickers, start=fetch_start, end=fetch_end, interval=interval, group_by="ticker",
+                           auto_adjust=True, actions=True, progress=False, threads=True)
+        self.downloads += 1
+        if data is None or data.empty:
+            return
+
+        if data.index.tz is not None:
+            data.index = data.index.tz_convert("UTC").tz_localize(None)
+        data.index.name = "Datetime" if interval in INTRADAY_INTERVALS else "Date"
+
+        with self._lock:
+            for ticker in tickers:
+                frame = self._ticker_frame(data, ticker)
+                if frame is not None and not frame.empty:
+                    key = (ticker, interval)
+                    cached = self._frames.get(key)
+                    if cached is not None:
+                        # Newly downloaded bars replace the cached ones they overlap
+                        frame = pd.concat([cached[~cached.index.isin(frame.index)], frame]).sort_index()
+                    self._frames[key] = frame
+                self._cover((ticker, interval), start, min(end, now))
+
+    @staticmethod
+    def _ticker_frame(data: Any, ticker: str) -> Any:
+        pd = check_pandas()
+        if isinstance(data.columns, pd.MultiIndex):
+            ticker_level = next((level for level in range(data.columns.nlevels)
+                                 if ticker in data.columns.get_level_values(level)), None)
+            if ticker_level is None:
+                return None
+            frame = data.xs(ticker, axis=1, level=ticker_level)
+        else:
+            frame = data
+        frame = frame.dropna(how="all")
+        frame.columns.name = None
+        return frame
+
+    def _cover(self, key: Tuple[str, str], start: datetime, end: datetime) -> None:
+        ranges = sorted(self._covered.get(key, []) + [(start, end)])
+        merged = [ranges[0]]
+        for range_start, range_end in ranges[1:]:
+            if range_start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], range_end))
+            else:
+                merged.append((range_start, range_end))
+        self._covered[key] = merged
+
 
 class YahooFinanceTools:
+    _price_cache = PriceCache()
+
+    @staticmethod
+    def _history(tickers: List[str], period: str, interval: str) -> Dict[str, Any]:
+        start, end = _period_range(period)
+        return YahooFinanceTools._price_cache.get(tickers, start, end, interval)
+
+    @staticmethod
+    def clear_price_cache() -> None:
+        """Drop all cached price history."""
+        YahooFinanceTools._price_cache.clear()
+
     @staticmethod
     def get_ticker_info(ticker: str) -> Dict[str, Any]:
         """
@@ -102,13 +304,13 @@ class YahooFinanceTools:
             ValueError: If the ticker is invalid or data cannot be retrieved.
         """
         try:
-            yf = check_yfinance()
-            stock = yf.Ticker(ticker)
-            data = stock.history(period=period, interval=interval)
+            data = YahooFinanceTools._history([ticker], period, interval)[ticker.upper()]
+            if data.empty:
+                raise ValueError("No data returned")
             
             # Reset index and ensure datetime handling is correct
             data = data.copy()
-            data.index = data.index.strftime('%Y-%m-%dT%H:%M:%S%z')
+            data.index = data.index.strftime('%Y-%m-%dT%H:%M:%S')
             data_dict = data.reset_index().to_dict(orient='records')
             
             # Round price values
@@ -147,20 +349,18 @@ class YahooFinanceTools:
         if isinstance(tickers, str):
             tickers = [tickers]
         
-        returns = {}
         try:
-            check_yfinance()
-            data = YahooFinanceTools.download_multiple_tickers(tickers, period=period, interval=interval)
+            start, end = _period_range(period)
+            close = YahooFinanceTools._price_cache.panel(tickers, start, end, interval, field="Close")
             
-            if data.empty:
-                raise ValueError("No data returned from download_multiple_tickers")
+            if close.empty:
+                raise ValueError("No data returned for the requested tickers")
             
+            returns = {}
             for ticker in tickers:
-                if ('Close' in data.columns.get_level_values('Price') and 
-                    ticker in data.columns.get_level_values('Ticker')):
-                    returns[ticker] = data[ticker]['Close'].pct_change()
-                else:
+                if ticker.upper() not in close.columns:
                     raise ValueError(f"'Close' column not found for ticker {ticker}")
+                returns[ticker] = close[ticker.upper()].dropna().pct_change()
             
             return returns
         except Exception as e:
@@ -256,8 +456,10 @@ class YahooFinanceTools:
             ValueError: If period/interval combination is unsafe or data cannot be retrieved
         """
         try:
-            yf = check_yfinance()
-            data = yf.download(" ".join(tickers), period=period, interval=interval, group_by="ticker")
+            pd = check_pandas()
+            frames = YahooFinanceTools._history(tickers, period, interval)
+            data = pd.concat({ticker: frame for ticker, frame in frames.items() if not frame.empty}, axis=1)
+            data.columns.names = ["Ticker", "Price"]
             return data
         except Exception as e:
             raise ValueError(f"Error downloading data for tickers {tickers}: {str(e)}")
@@ -379,6 +581,11 @@ class YahooFinanceTools:
             ValueError: If the ticker is invalid, dates are incorrect, or data cannot be retrieved.
         """
         try:
+            if event == 'history' and frequency in ('1d', '1wk', '1mo'):
+                start = datetime.fromisoformat(start_date)
+                end = datetime.fromisoformat(end_date)
+                return YahooFinanceTools._price_cache.get([ticker], start, end, frequency)[ticker.upper()]
+
             yahoofinance = check_yahoofinance()
             historical_data = yahoofinance.HistoricalPrices(
                 ticker, start_date, end_date, 
@@ -389,6 +596,80 @@ class YahooFinanceTools:
         except Exception as e:
             raise ValueError(f"Error retrieving custom historical data for ticker {ticker}: {str(e)}")
         
+    @staticmethod
+    def compute_indicators(close: Any) -> Dict[str, Any]:
+        """
+        Compute SMA, RSI, MACD and Bollinger Bands for every column of a price panel at once.
+
+        Args:
+            close (DataFrame): Closing prices indexed by date, one column per ticker.
+
+        Returns:
+            Dict[str, DataFrame]: Indicator panels with the same shape as `close`, keyed by 'sma_50', 'sma_200', 'rsi',
+                'macd', 'macd_signal', 'bollinger_upper', 'bollinger_middle' and 'bollinger_lower'.
+        """
+        # Carry prices over days one market is closed and another open, so rolling windows stay unbroken
+        close = close.ffill()
+
+        delta = close.diff()
+        gain = delta.clip(lower=0).rolling(window=14).mean()
+        loss = (-delta.clip(upper=0)).rolling(window=14).mean()
+
+        macd = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+        bb_middle = close.rolling(window=20).mean()
+        bb_width = close.rolling(window=20).std() * 2
+
+        return {
+            "sma_50": close.rolling(window=50).mean(),
+            "sma_200": close.rolling(window=200).mean(),
+            "rsi": 100 - (100 / (1 + gain / loss)),
+            "macd": macd,
+            "macd_signal": macd.ewm(span=9, adjust=False).mean(),
+            "bollinger_upper": bb_middle + bb_width,
+            "bollinger_middle": bb_middle,
+            "bollinger_lower": bb_middle - bb_width
+        }
+
+    @staticmethod
+    def technical_analysis_multi(tickers: List[str], period: str = "1y", interval: str = "1d") -> Dict[str, Dict[str, Any]]:
+        """
+        Perform technical analysis for a watchlist of tickers in one pass.
+        Prices are downloaded together and the indicators computed across all tickers at once.
+
+        Args:
+            tickers (List[str]): The stock ticker symbols.
+            period (str): The time period for historical data (e.g., "3mo", "1y"). Use at least "1y" for a 200-day SMA.
+            interval (str): The interval between data points. Defaults to "1d".
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The latest indicator values for each ticker; None where there is not enough history.
+
+        Raises:
+            ValueError: If data cannot be retrieved.
+        """
+        try:
+            pd = check_pandas()
+            start, end = _period_range(period)
+            close = YahooFinanceTools._price_cache.panel(tickers, start, end, interval, field="Close")
+            volume = YahooFinanceTools._price_cache.panel(tickers, start, end, interval, field="Volume")
+            if close.empty:
+                raise ValueError("No data returned for the requested tickers")
+
+            indicators = YahooFinanceTools.compute_indicators(close)
+            latest = {name: panel.iloc[-1] for name, panel in indicators.items()}
+            latest["current_price"] = close.ffill().iloc[-1]
+            latest["volume"] = volume.ffill().iloc[-1]
+
+            def value(series: Any, ticker: str) -> Optional[float]:
+                number = series.get(ticker)
+                return None if number is None or pd.isna(number) else float(number)
+
+            names = ["current_price", "sma_50", "sma_200", "rsi", "macd", "macd_signal",
+                     "bollinger_upper", "bollinger_middle", "bollinger_lower", "volume"]
+            return {ticker: {name: value(latest[name], ticker.upper()) for name in names} for ticker in tickers}
+        except Exception as e:
+            raise ValueError(f"Error performing technical analysis for tickers {tickers}: {str(e)}")
+
     @staticmethod
     def technical_analysis(ticker: str, period: str = "1y") -> Dict[str, Any]:
         """
@@ -405,45 +686,7 @@ class YahooFinanceTools:
             ValueError: If the ticker is invalid or data cannot be retrieved.
         """
         try:
-            # Get historical data
-            data = YahooFinanceTools.get_historical_data(ticker, period)
-            
-            # Calculate moving averages
-            data['SMA_50'] = data['Close'].rolling(window=50).mean()
-            data['SMA_200'] = data['Close'].rolling(window=200).mean()
-            
-            # Calculate Relative Strength Index (RSI)
-            delta = data['Close'].diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            rs = gain / loss
-            data['RSI'] = 100 - (100 / (1 + rs))
-            
-            # Calculate MACD
-            exp1 = data['Close'].ewm(span=12, adjust=False).mean()
-            exp2 = data['Close'].ewm(span=26, adjust=False).mean()
-            data['MACD'] = exp1 - exp2
-            data['Signal_Line'] = data['MACD'].ewm(span=9, adjust=False).mean()
-            
-            # Calculate Bollinger Bands
-            data['BB_Middle'] = data['Close'].rolling(window=20).mean()
-            data['BB_Upper'] = data['BB_Middle'] + (data['Close'].rolling(window=20).std() * 2)
-            data['BB_Lower'] = data['BB_Middle'] - (data['Close'].rolling(window=20).std() * 2)
-            
-            latest = data.iloc[-1]
-            
-            return {
-                "current_price": latest['Close'],
-                "sma_50": latest['SMA_50'],
-                "sma_200": latest['SMA_200'],
-                "rsi": latest['RSI'],
-                "macd": latest['MACD'],
-                "macd_signal": latest['Signal_Line'],
-                "bollinger_upper": latest['BB_Upper'],
-                "bollinger_middle": latest['BB_Middle'],
-                "bollinger_lower": latest['BB_Lower'],
-                "volume": latest['Volume']
-            }
+            return YahooFinanceTools.technical_analysis_multi([ticker], period)[ticker]
         except Exception as e:
             raise ValueError(f"Error performing technical analysis for ticker {ticker}: {str(e)}")
         
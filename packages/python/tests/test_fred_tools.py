@@ -0,0 +1,100 @@
+import pandas as pd
+import pytest
+
+from chronocast.tools.fred_tools import FixtureFredClient, FredSeriesStore, FredTools
+
+
+def monthly(start, periods, first_value=1.0):
+    index = pd.date_range(start, periods=periods, freq="MS")
+    return pd.Series([first_value + i for i in range(periods)], index=index, dtype="float64")
+
+
+@pytest.fixture
+def fred(tmp_path):
+    client = FixtureFredClient({"UNRATE": monthly("2024-01-01", 6), "GDP": monthly("2023-01-01", 4, 100.0)},
+                               info={"UNRATE": {"title": "Unemployment Rate", "units": "Percent"}})
+    store = FredSeriesStore(directory=str(tmp_path))
+    FredTools.configure(client=client, store=store)
+    yield client, store
+    FredTools.configure()
+
+
+def test_first_fetch_downloads_full_series(fred):
+    client, _ = fred
+
+    result = FredTools.fetch_series(["UNRATE", "GDP", "UNRATE"])
+
+    assert list(result) == ["UNRATE", "GDP"]
+    assert result["UNRATE"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    assert result["GDP"].index[0] == pd.Timestamp("2023-01-01")
+    assert sorted(call for call in client.calls if call[0] == "get_series") == [
+        ("get_series", "GDP", None, None), ("get_series", "UNRATE", None, None)]
+
+
+def test_warm_store_makes_no_calls(fred):
+    client, _ = fred
+    FredTools.fetch_series(["UNRATE", "GDP"])
+    client.calls.clear()
+
+    result = FredTools.fetch_series(["UNRATE", "GDP"], start_date="2024-03-01", end_date="2024-04-01")
+
+    assert client.calls == []
+    assert result["UNRATE"].tolist() == [3.0, 4.0]
+    assert result["GDP"].empty
+
+
+def test_refresh_requests_only_new_observations(fred):
+    client, _ = fred
+    FredTools.fetch_series(["UNRATE"])
+    client.series["UNRATE"] = monthly("2024-01-01", 8)
+    client.calls.clear()
+
+    result = FredTools.fetch_series(["UNRATE"], force_refresh=True)
+
+    assert ("get_series", "UNRATE", "2024-06-02", None) in client.calls
+    assert result["UNRATE"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0]
+
+
+def test_refresh_skips_observations_when_series_is_unchanged(fred):
+    client, _ = fred
+    FredTools.fetch_series(["UNRATE"])
+    client.calls.clear()
+
+    FredTools.fetch_series(["UNRATE"], force_refresh=True)
+
+    assert client.calls == [("get_series_info", "UNRATE")]
+
+
+def test_stale_series_are_checked_again(fred):
+    client, store = fred
+    FredTools.fetch_series(["UNRATE"])
+    store.refresh_interval = 0
+    client.calls.clear()
+
+    FredTools.fetch_series(["UNRATE"])
+
+    assert client.calls == [("get_series_info", "UNRATE")]
+
+
+def test_series_info_comes_from_the_store(fred):
+    client, _ = fred
+
+    info = FredTools.get_series_info("UNRATE")
+    FredTools.get_series_info("UNRATE")
+
+    assert info["title"] == "Unemployment Rate"
+    assert info["observation_end"] == "2024-06-01"
+    assert "last_checked" not in info
+    assert client.calls.count(("get_series_info", "UNRATE")) == 1
+
+
+def test_fixtures_load_from_directory(tmp_path):
+    (tmp_path / "CPI.csv").write_text("date,value\n2024-01-01,300.5\n2024-02-01,301.0\n")
+    (tmp_path / "CPI.json").write_text('{"title": "Consumer Price Index"}')
+
+    client = FixtureFredClient.from_directory(str(tmp_path))
+
+    assert client.get_series("CPI", observation_start="2024-02-01").tolist() == [301.0]
+    assert client.get_series_info("CPI")["title"] == "Consumer Price Index"
+    with pytest.raises(ValueError):
+        client.get_series("MISSING")
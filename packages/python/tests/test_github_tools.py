@@ -0,0 +1,118 @@
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from chronocast.tools.github_tools import GitHubTools
+
+ISSUES = [
+    {"number": i, "title": f"Issue {i}", "state": "open", "created_at": "2024-01-01T00:00:00Z",
+     "updated_at": "2024-01-02T00:00:00Z", "html_url": f"https://github.test/o/r/issues/{i}",
+     "user": {"login": "octocat", "id": 1}, "comments": 0}
+    for i in range(1, 251)
+]
+
+
+class FakeGitHubHandler(BaseHTTPRequestHandler):
+    """Serves /repos/o/r/issues with Link pagination, ETags and 304 responses to If-None-Match."""
+    protocol_version = "HTTP/1.1"
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if url.path != "/repos/o/r/issues":
+            return self._send(404, {"message": "Not Found"})
+
+        per_page = int(query.get("per_page", ["30"])[0])
+        page = int(query.get("page", ["1"])[0])
+        headers = {}
+        if page * per_page < len(ISSUES):
+            headers["Link"] = f'<http://{self.headers["Host"]}{url.path}?per_page={per_page}&page={page + 1}>; rel="next"'
+        self._send(200, ISSUES[(page - 1) * per_page:page * per_page], headers)
+
+    def _send(self, status, payload, headers=None):
+        body = json.dumps(payload).encode()
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        revalidated = self.headers.get("If-None-Match") == etag
+        type(self).requests.append({"path": self.path, "status": 304 if revalidated else status})
+        if revalidated:
+            status, body = 304, b""
+        self.send_response(status)
+        self.send_header("ETag", etag)
+        self.send_header("X-RateLimit-Remaining", "4999")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def github(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeGitHubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("GITHUB_API_URL", f"http://127.0.0.1:{server.server_address[1]}")
+    monkeypatch.setenv("GITHUB_OWNER", "o")
+    monkeypatch.setenv("GITHUB_REPO", "r")
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    FakeGitHubHandler.requests = []
+    GitHubTools.clear_cache()
+    yield FakeGitHubHandler.requests
+    server.shutdown()
+    server.server_close()
+    GitHubTools.clear_cache()
+
+
+def test_list_repo_issues_is_bounded_by_default(github):
+    issues = GitHubTools.list_repo_issues()
+
+    assert [issue["number"] for issue in issues] == list(range(1, 101))
+    assert len(github) == 1
+
+
+def test_list_repo_issues_stops_paging_at_max_results(github):
+    issues = GitHubTools.list_repo_issues(max_results=30)
+
+    assert [issue["number"] for issue in issues] == list(range(1, 31))
+    assert len(github) == 1
+    assert "per_page=30" in github[0]["path"]
+
+
+def test_list_repo_issues_follows_link_header_for_every_page(github):
+    issues = GitHubTools.list_repo_issues(max_results=None)
+
+    assert [issue["number"] for issue in issues] == list(range(1, 251))
+    assert [request["status"] for request in github] == [200, 200, 200]
+    assert "page=3" in github[-1]["path"]
+
+
+def test_repeated_request_is_revalidated_with_etag(github):
+    first = GitHubTools.list_repo_issues(max_results=10)
+    second = GitHubTools.list_repo_issues(max_results=10)
+
+    assert second == first
+    assert [request["status"] for request in github] == [200, 304]
+
+
+def test_clear_cache_drops_conditional_requests(github):
+    GitHubTools.list_repo_issues(max_results=10)
+    GitHubTools.clear_cache()
+    GitHubTools.list_repo_issues(max_results=10)
+
+    assert [request["status"] for request in github] == [200, 200]
+
+
+def test_http_errors_are_raised(github, monkeypatch):
+    monkeypatch.setenv("GITHUB_REPO", "missing")
+
+    with pytest.raises(Exception):
+        GitHubTools.list_repo_issues()
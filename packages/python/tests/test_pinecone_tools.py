@@ -0,0 +1,85 @@
+import pytest
+
+from chronocast.tools.pinecone_tools import InMemoryPineconeClient, PineconeTools
+
+
+@pytest.fixture
+def pinecone():
+    client = InMemoryPineconeClient()
+    tools = PineconeTools(client=client, max_workers=4)
+    tools.create_index("shows", dimension=3)
+    return tools
+
+
+def vectors(count, namespace_tag="a"):
+    return [{"id": f"{namespace_tag}{i}", "values": [1.0, float(i), 0.0], "metadata": {"n": i, "tag": namespace_tag}}
+            for i in range(count)]
+
+
+def test_upsert_splits_into_batches(pinecone):
+    index = pinecone.get_pinecone_index("shows")
+    calls = []
+    upsert = index.upsert
+    index.upsert = lambda vectors, namespace="": calls.append(len(vectors)) or upsert(vectors, namespace=namespace)
+
+    pinecone.upsert_vectors("shows", vectors(250), batch_size=100)
+
+    assert sorted(calls) == [50, 100, 100]
+    assert pinecone.describe_index_stats("shows")["total_vector_count"] == 250
+
+
+def test_upsert_overwrites_existing_ids(pinecone):
+    pinecone.upsert_vectors("shows", vectors(3))
+    pinecone.upsert_vectors("shows", [{"id": "a1", "values": [0.0, 0.0, 1.0], "metadata": {"n": 99}}])
+
+    result = pinecone.query_index("shows", [0.0, 0.0, 1.0], top_k=1)
+
+    assert result["matches"][0]["id"] == "a1"
+    assert result["matches"][0]["metadata"] == {"n": 99}
+    assert pinecone.describe_index_stats("shows")["total_vector_count"] == 3
+
+
+def test_query_ranks_by_cosine_similarity_and_filters(pinecone):
+    pinecone.upsert_vectors("shows", vectors(5))
+
+    result = pinecone.query_index("shows", [0.0, 1.0, 0.0], top_k=2)
+    assert [match["id"] for match in result["matches"]] == ["a4", "a3"]
+    assert result["matches"][0]["score"] > result["matches"][1]["score"]
+
+    result = pinecone.query_index("shows", [0.0, 1.0, 0.0], top_k=5, filter={"n": {"$lt": 2}})
+    assert {match["id"] for match in result["matches"]} == {"a0", "a1"}
+
+
+def test_query_many_merges_across_namespaces(pinecone):
+    pinecone.upsert_vectors("shows", vectors(3, "a"), namespace="a")
+    pinecone.upsert_vectors("shows", vectors(3, "b"), namespace="b")
+
+    per_query = pinecone.query_many("shows", [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], top_k=2, namespaces=["a", "b"])
+    assert len(per_query) == 2
+    assert {match["namespace"] for match in per_query[0]} == {"a", "b"}
+    assert [match["id"] for match in per_query[1]] in (["a2", "b2"], ["b2", "a2"])
+
+    merged = pinecone.query_many("shows", [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], top_k=3, namespaces=["a", "b"], merge=True)
+    assert len(merged) == 3
+    assert [match["score"] for match in merged] == sorted((match["score"] for match in merged), reverse=True)
+
+
+def test_delete_vectors_and_namespace(pinecone):
+    pinecone.upsert_vectors("shows", vectors(4, "a"), namespace="a")
+    pinecone.upsert_vectors("shows", vectors(4, "b"), namespace="b")
+
+    pinecone.delete_vectors("shows", ["a0", "a1"], namespace="a")
+    pinecone.delete_namespace("shows", "b", filter={"n": {"$gte": 2}})
+    stats = pinecone.describe_index_stats("shows")["namespaces"]
+    assert stats["a"]["vector_count"] == 2
+    assert stats["b"]["vector_count"] == 2
+
+    pinecone.delete_namespace("shows", "b")
+    assert pinecone.describe_index_stats("shows")["namespaces"]["b"]["vector_count"] == 0
+    assert pinecone.query_index("shows", [1.0, 0.0, 0.0], namespace="b")["matches"] == []
+    assert pinecone.describe_index_stats("shows")["namespaces"]["a"]["vector_count"] == 2
+
+
+def test_unknown_index_raises(pinecone):
+    with pytest.raises(Exception, match="Error querying index"):
+        pinecone.query_index("missing", [1.0, 0.0, 0.0])